@@ -10,6 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.0/ref/settings/
 """
 import os
+from datetime import timedelta
+from importlib.util import find_spec
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -42,6 +44,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'openproject_sync.middleware.RequestDecompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -138,12 +141,46 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.DjangoModelPermissionsOrAnonReadOnly'
     ],
+    # JSON is read and written with orjson, MessagePack is offered if msgpack is installed.
     'DEFAULT_PARSER_CLASSES': (
         'rest_framework.parsers.FormParser',
         'rest_framework.parsers.MultiPartParser',
-        'rest_framework.parsers.JSONParser',
-    )
+        'openproject_sync.parsers.ORJSONParser',
+    ) + (('openproject_sync.parsers.MessagePackParser',) if find_spec('msgpack') else ()),
+    'DEFAULT_RENDERER_CLASSES': (
+        'openproject_sync.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ) + (('openproject_sync.renderers.MessagePackRenderer',) if find_spec('msgpack') else ()),
+    'DEFAULT_PAGINATION_CLASS': 'openproject_sync.pagination.OpenProjectCursorPagination',
+    'PAGE_SIZE': int(os.environ.get("OPENPROJECT_PAGE_SIZE", 500)),
 }
 
 OPENPROJECT_API_URL = os.environ.get("OPENPROJECT_API_URL", "http://web:8080/")
-OPENPROJECT_AUTHORIZATION_HASH = os.environ.get("OPENPROJECT_AUTHORIZATION_HASH", "")
\ No newline at end of file
+OPENPROJECT_AUTHORIZATION_HASH = os.environ.get("OPENPROJECT_AUTHORIZATION_HASH", "")
+
+# Connection handling of the OpenProject client, see openproject_sync.client.
+OPENPROJECT_CONNECT_TIMEOUT = float(os.environ.get("OPENPROJECT_CONNECT_TIMEOUT", 3.05))
+OPENPROJECT_READ_TIMEOUT = float(os.environ.get("OPENPROJECT_READ_TIMEOUT", 30))
+OPENPROJECT_MAX_RETRIES = int(os.environ.get("OPENPROJECT_MAX_RETRIES", 5))
+OPENPROJECT_POOL_SIZE = int(os.environ.get("OPENPROJECT_POOL_SIZE", 16))
+
+# Maximum number of openproject_id -> pk pairs cached per model and process.
+OPENPROJECT_IDENTITY_MAP_SIZE = int(os.environ.get("OPENPROJECT_IDENTITY_MAP_SIZE", 100000))
+
+# Upper bound for the page size clients may request via ?page_size=.
+OPENPROJECT_MAX_PAGE_SIZE = int(os.environ.get("OPENPROJECT_MAX_PAGE_SIZE", 5000))
+
+# Interval of the full reconciles between incremental (watermark-based) pulls.
+OPENPROJECT_FULL_SYNC_INTERVAL = timedelta(
+    hours=float(os.environ.get("OPENPROJECT_FULL_SYNC_INTERVAL_HOURS", 24))
+)
+
+# Maximum number of records accepted by a single bulk_upsert request.
+OPENPROJECT_BULK_UPSERT_BATCH_SIZE = int(os.environ.get("OPENPROJECT_BULK_UPSERT_BATCH_SIZE", 1000))
+# Number of rows fetched per database round trip by streamed (?format=ndjson) lists.
+OPENPROJECT_STREAM_CHUNK_SIZE = int(os.environ.get("OPENPROJECT_STREAM_CHUNK_SIZE", 2000))
+
+# Maximum size of gzip or deflate compressed request bodies once decompressed.
+OPENPROJECT_MAX_DECOMPRESSED_REQUEST_SIZE = int(
+    os.environ.get("OPENPROJECT_MAX_DECOMPRESSED_REQUEST_SIZE", 256 * 1024 * 1024)
+)
@@ -26,6 +26,7 @@ router = routers.DefaultRouter()
 router.register(r"projects", views.ProjectViewSet)
 router.register(r"work_packages", views.WorkPackageViewSet)
 router.register(r"time_entries", views.TimeEntryViewSet)
+router.register(r"sync_state", views.SyncStateViewSet)
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -1,6 +1,22 @@
 from django.contrib import admin
 
-from openproject_sync.models import WorkPackage, TimeEntry, Project
+from openproject_sync.models import WorkPackage, TimeEntry, Project, OutboxEvent
+
+
+class SelectRelatedFieldListFilter(admin.RelatedFieldListFilter):
+    """
+    Lists the choices of a foreign key filter with their own foreign keys joined.
+
+    The string representations of work packages and time entries include their
+    parents, so listing them without the joins takes one query per choice.
+    """
+
+    def field_choices(self, field, request, model_admin):
+        ordering = self.field_admin_ordering(field, request, model_admin)
+        queryset = field.related_model._default_manager.select_related()
+        if ordering:
+            queryset = queryset.order_by(*ordering)
+        return [(obj.pk, str(obj)) for obj in queryset]
 
 
 class ProjectAdmin(admin.ModelAdmin):
@@ -12,6 +28,7 @@ class ProjectAdmin(admin.ModelAdmin):
 class WorkPackageAdmin(admin.ModelAdmin):
     list_display = ("subject", "project")
     list_filter = ("project",)
+    list_select_related = ("project",)
 
     def get_readonly_fields(self, request, obj=None):
         return (
@@ -30,12 +47,30 @@ class WorkPackageAdmin(admin.ModelAdmin):
 
 class TimeEntryAdmin(admin.ModelAdmin):
     list_display = ("work_package", "comment", "spentOn", "hours")
-    list_filter = ("work_package",)
+    list_filter = (("work_package", SelectRelatedFieldListFilter),)
+    list_select_related = ("work_package__project",)
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == "work_package":
+            kwargs["queryset"] = WorkPackage.objects.select_related("project")
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = ("model_label", "object_id", "action", "created_at", "attempts", "processed_at")
+    list_filter = ("model_label", "action")
 
     def has_add_permission(self, request, obj=None):
         return False
 
+    def has_change_permission(self, request, obj=None):
+        return False
+
 
 admin.site.register(Project, ProjectAdmin)
 admin.site.register(WorkPackage, WorkPackageAdmin)
 admin.site.register(TimeEntry, TimeEntryAdmin)
+admin.site.register(OutboxEvent, OutboxEventAdmin)
@@ -0,0 +1,156 @@
+import os
+import threading
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# OpenProject caps the page size of collections at its configured maximum
+# (1000 by default).
+MAX_PAGE_SIZE = 1000
+
+
+class OpenProjectClient:
+    """
+    A pooled, keep-alive client for the OpenProject API v3.
+
+    All requests go through one `requests.Session`, so TCP (and TLS)
+    connections to OpenProject are reused and the authorization headers are
+    built once. Every request has connect and read timeouts. Requests answered
+    with 429 or a 5xx status, or failing to connect, are retried with
+    exponential, jittered backoff honouring `Retry-After`; POST requests are
+    only retried if the connection could not be established, as they are not
+    idempotent.
+
+    Attributes:
+        base_url (str): The OpenProject base URL, without trailing slash.
+        timeout (tuple[float, float]): The connect and read timeouts in seconds.
+        session (requests.Session): The underlying session.
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "PATCH", "DELETE"})
+
+    def __init__(
+        self,
+        base_url=None,
+        authorization_hash=None,
+        timeout=None,
+        max_retries=None,
+        pool_size=None,
+    ):
+        self.base_url = (base_url or settings.OPENPROJECT_API_URL).rstrip("/")
+        self.timeout = timeout or (
+            settings.OPENPROJECT_CONNECT_TIMEOUT,
+            settings.OPENPROJECT_READ_TIMEOUT,
+        )
+        if authorization_hash is None:
+            authorization_hash = settings.OPENPROJECT_AUTHORIZATION_HASH
+        if max_retries is None:
+            max_retries = settings.OPENPROJECT_MAX_RETRIES
+        pool_size = pool_size or settings.OPENPROJECT_POOL_SIZE
+
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            status=max_retries,
+            backoff_factor=0.5,
+            backoff_jitter=0.5,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=self.RETRY_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_size, max_retries=retry
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(
+            {
+                "Authorization": f"Basic {authorization_hash}",
+                "Content-Type": "application/json",
+            }
+        )
+
+    def url(self, path):
+        """
+        Returns the absolute URL for an API path such as `/api/v3/projects`.
+
+        Absolute URLs (e.g. `href` links taken from HAL documents) are returned as-is.
+        """
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def request(self, method, path, **kwargs):
+        """
+        Sends a request and returns the decoded JSON response.
+
+        Raises:
+            requests.RequestException: If the request fails after all retries or
+                OpenProject answers with an error status.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        r = self.session.request(method, self.url(path), **kwargs)
+        r.raise_for_status()
+        return r.json()
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def patch(self, path, **kwargs):
+        return self.request("PATCH", path, **kwargs)
+
+    def iter_pages(self, path, params=None, page_size=MAX_PAGE_SIZE):
+        """
+        Yields the elements of an OpenProject collection page by page.
+
+        Args:
+            path (str): The API path or absolute URL of the collection.
+            params (dict): Additional query parameters, e.g. "filters".
+            page_size (int): The requested number of elements per page. OpenProject
+                caps it at its configured maximum and reports the effective value.
+
+        Yields:
+            list[dict]: The elements of each page.
+        """
+        offset = 1
+        while True:
+            page = self.get(
+                path, params={**(params or {}), "offset": offset, "pageSize": page_size}
+            )
+            elements = page.get("_embedded", {}).get("elements", [])
+            yield elements
+            page_size = page.get("pageSize") or page_size
+            if not elements or offset * page_size >= page.get("total", 0):
+                return
+            offset += 1
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_client_pid = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """
+    Returns the OpenProject client of the current process.
+
+    The client is created on first use and replaced after a fork, so that
+    processes never share pooled connections.
+    """
+    global _client, _client_pid
+    with _client_lock:
+        if _client is None or _client_pid != os.getpid():
+            _client = OpenProjectClient()
+            _client_pid = os.getpid()
+        return _client
@@ -0,0 +1,128 @@
+from django.db import models
+
+from .outbox import ENDPOINTS
+
+
+class HALError(ValueError):
+    """
+    Raised if a document is not an OpenProject HAL resource of the expected type.
+    """
+
+
+def linked_id(document, related_model, link_names):
+    """
+    Returns the OpenProject ID of a resource linked from a HAL document.
+
+    Embedded resources are preferred. Otherwise the ID is taken from the last
+    segment of the `href` of the link, provided it points to the collection of
+    `related_model` (links such as "entity" may point to other resource types).
+
+    Args:
+        document (dict): The HAL document.
+        related_model: The model of the linked resource.
+        link_names (Iterable[str]): The names of the links, in order of preference.
+
+    Returns:
+        int or None: The OpenProject ID of the linked resource, if any.
+    """
+    embedded = document.get("_embedded") or {}
+    for name in link_names:
+        resource = embedded.get(name) or {}
+        if resource.get("id") is not None and resource.get("_type") in (
+            None,
+            related_model.openproject_type,
+        ):
+            return resource["id"]
+    links = document.get("_links") or {}
+    collection = f"/{ENDPOINTS[related_model._meta.label_lower]}/"
+    for name in link_names:
+        href = (links.get(name) or {}).get("href") or ""
+        if collection in href:
+            last_segment = href.rstrip("/").rsplit("/", 1)[-1]
+            if last_segment.isdigit():
+                return int(last_segment)
+    return None
+
+
+def field_value(field, value):
+    """
+    Converts a HAL attribute value to the input expected by the serializer field.
+
+    Formattable values (e.g. descriptions and comments) are reduced to their
+    `raw` text and empty dates become None. ISO 8601 dates and datetimes are
+    parsed by the serializer; plain dates given for datetime fields (as
+    OpenProject does for derived dates) are read as midnight.
+    """
+    if isinstance(value, dict) and "raw" in value:
+        return value["raw"]
+    if isinstance(field, (models.DateField, models.DateTimeField)) and value == "":
+        return None
+    return value
+
+
+def from_hal(model, document):
+    """
+    Maps an OpenProject API v3 HAL resource to serializer data for `model`.
+
+    Attributes named like model fields are taken over, `id` becomes
+    `openproject_id`, and the foreign keys listed in `model.openproject_links`
+    are given as `<name>_openproject_id`.
+
+    Args:
+        model: The model the resource is mapped to.
+        document (dict): The HAL resource, e.g. an element of a collection.
+
+    Returns:
+        dict: The data to pass to the model's serializer.
+
+    Raises:
+        HALError: If the document is not a resource of the model's type.
+    """
+    if not isinstance(document, dict):
+        raise HALError("Expected a HAL document.")
+    if document.get("_type") != model.openproject_type:
+        raise HALError(
+            f"Expected a {model.openproject_type} document, got {document.get('_type')!r}."
+        )
+    if document.get("id") is None:
+        raise HALError(f"{model.openproject_type} document without id.")
+    data = {"openproject_id": document["id"]}
+    for field in model._meta.concrete_fields:
+        if (
+            field.primary_key
+            or field.is_relation
+            or field.name == "openproject_id"
+            or field.name not in document
+        ):
+            continue
+        data[field.name] = field_value(field, document[field.name])
+    for field_name, link_names in model.openproject_links.items():
+        related_model = model._meta.get_field(field_name).related_model
+        openproject_id = linked_id(document, related_model, link_names)
+        if openproject_id is not None:
+            data[f"{field_name}_openproject_id"] = openproject_id
+    return data
+
+
+def from_hal_documents(model, data):
+    """
+    Maps a HAL resource, a list of resources or a collection page to serializer data.
+
+    Args:
+        model: The model the resources are mapped to.
+        data (dict or list): A single resource, a list of resources or a
+            collection (any `_type` ending in "Collection").
+
+    Returns:
+        list[dict]: The data to pass to the model's list serializer.
+
+    Raises:
+        HALError: If any document is not a resource of the model's type.
+    """
+    if isinstance(data, dict) and str(data.get("_type", "")).endswith("Collection"):
+        data = (data.get("_embedded") or {}).get("elements", [])
+    elif isinstance(data, dict):
+        data = [data]
+    if not isinstance(data, list):
+        raise HALError("Expected a HAL document, a list or a collection.")
+    return [from_hal(model, document) for document in data]
@@ -0,0 +1,151 @@
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+
+
+class IdentityMap:
+    """
+    A bounded, per-process cache mapping OpenProject IDs to primary keys.
+
+    Every model synchronized with OpenProject is addressed by its `openproject_id`
+    from the outside, while foreign keys and detail lookups need the Django
+    primary key. The identity map keeps the most recently used pairs in memory
+    (least recently used entries are evicted once `maxsize` is reached) so that
+    hot lookups do not have to hit the database.
+
+    The map is kept current by the signal handlers in `openproject_sync.signals`.
+    Because other processes may change or delete rows behind our back, callers
+    that fetch rows through a cached primary key must verify the `openproject_id`
+    of the fetched row and call `discard` if it does not match.
+
+    Attributes:
+        model: The model class whose instances are mapped.
+        maxsize: The maximum number of entries kept in memory.
+    """
+
+    def __init__(self, model, maxsize=None):
+        self.model = model
+        self.maxsize = maxsize or settings.OPENPROJECT_IDENTITY_MAP_SIZE
+        self._by_openproject_id = OrderedDict()
+        self._by_pk = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._by_openproject_id)
+
+    def __contains__(self, openproject_id):
+        return openproject_id in self._by_openproject_id
+
+    def get(self, openproject_id, default=None):
+        """
+        Returns the primary key for the given OpenProject ID.
+
+        Cached entries are returned without touching the database. On a miss the
+        primary key is looked up via the unique `openproject_id` index and
+        remembered for subsequent calls.
+
+        Args:
+            openproject_id (int): The OpenProject ID to resolve.
+            default: Value returned if no row with this OpenProject ID exists.
+
+        Returns:
+            int or None: The primary key of the matching row, or `default`.
+        """
+        return self.get_many([openproject_id]).get(openproject_id, default)
+
+    def get_many(self, openproject_ids):
+        """
+        Resolves several OpenProject IDs at once.
+
+        All IDs missing from the cache are fetched with a single query.
+
+        Args:
+            openproject_ids (Iterable[int]): The OpenProject IDs to resolve.
+
+        Returns:
+            dict: A mapping of OpenProject ID to primary key for all IDs that exist.
+        """
+        found = {}
+        missing = set()
+        with self._lock:
+            for openproject_id in openproject_ids:
+                pk = self._by_openproject_id.get(openproject_id)
+                if pk is None:
+                    missing.add(openproject_id)
+                else:
+                    self._by_openproject_id.move_to_end(openproject_id)
+                    found[openproject_id] = pk
+        if missing:
+            fetched = dict(
+                self.model._default_manager.filter(
+                    openproject_id__in=missing
+                ).values_list("openproject_id", "pk")
+            )
+            self.set_many(fetched)
+            found.update(fetched)
+        return found
+
+    def set(self, openproject_id, pk):
+        """
+        Remembers that the row with primary key `pk` has the given OpenProject ID.
+        """
+        self.set_many({openproject_id: pk})
+
+    def set_many(self, mapping):
+        """
+        Remembers several OpenProject ID to primary key pairs at once.
+
+        Stale entries pointing to the same primary keys or OpenProject IDs are
+        replaced, and the least recently used entries are evicted if the map
+        grows beyond `maxsize`.
+        """
+        with self._lock:
+            for openproject_id, pk in mapping.items():
+                self._discard_pk(pk)
+                self._discard_openproject_id(openproject_id)
+                self._by_openproject_id[openproject_id] = pk
+                self._by_pk[pk] = openproject_id
+            while len(self._by_openproject_id) > self.maxsize:
+                _, pk = self._by_openproject_id.popitem(last=False)
+                self._by_pk.pop(pk, None)
+
+    def discard(self, openproject_id=None, pk=None):
+        """
+        Forgets the entry for the given OpenProject ID and/or primary key.
+        """
+        with self._lock:
+            if openproject_id is not None:
+                self._discard_openproject_id(openproject_id)
+            if pk is not None:
+                self._discard_pk(pk)
+
+    def clear(self):
+        with self._lock:
+            self._by_openproject_id.clear()
+            self._by_pk.clear()
+
+    def _discard_openproject_id(self, openproject_id):
+        pk = self._by_openproject_id.pop(openproject_id, None)
+        if pk is not None:
+            self._by_pk.pop(pk, None)
+
+    def _discard_pk(self, pk):
+        openproject_id = self._by_pk.pop(pk, None)
+        if openproject_id is not None:
+            self._by_openproject_id.pop(openproject_id, None)
+
+
+_identity_maps = {}
+_identity_maps_lock = threading.Lock()
+
+
+def identity_map(model):
+    """
+    Returns the process-wide identity map for the given model class.
+    """
+    key = model._meta.label_lower
+    with _identity_maps_lock:
+        if key not in _identity_maps:
+            _identity_maps[key] = IdentityMap(model._meta.concrete_model)
+        return _identity_maps[key]
@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from openproject_sync.outbox import drain
+
+
+class Command(BaseCommand):
+    help = "Pushes pending outbox events to OpenProject."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=100, help="Events claimed per batch."
+        )
+        parser.add_argument(
+            "--workers", type=int, default=8, help="Concurrent requests to OpenProject."
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=10,
+            help="Events that failed this often are not retried.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep draining, polling for new events when the outbox is empty.",
+        )
+        parser.add_argument(
+            "--interval", type=float, default=1.0, help="Polling interval in seconds."
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            delivered, failed = drain(
+                batch_size=options["batch_size"],
+                max_workers=options["workers"],
+                max_attempts=options["max_attempts"],
+            )
+            if delivered or failed:
+                self.stdout.write(f"Delivered {delivered} events, {failed} failed.")
+            if delivered:
+                continue
+            if not (failed or options["loop"]):
+                return
+            # The outbox is empty or OpenProject is unavailable, wait before polling again.
+            time.sleep(options["interval"])
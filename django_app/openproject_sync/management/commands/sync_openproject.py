@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from openproject_sync.pull import pull
+
+
+class Command(BaseCommand):
+    help = (
+        "Pulls all projects, work packages and time entries from OpenProject "
+        "and writes them with bulk upserts."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Skip the projects already pulled by an interrupted run.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Processes pulling the work packages and time entries of projects in parallel.",
+        )
+
+    def handle(self, *args, **options):
+        pull(resume=options["resume"], progress=self.report, workers=options["workers"])
+
+    def report(self, stage, stats):
+        rate = stats["records"] / stats["seconds"] if stats["seconds"] else 0
+        self.stdout.write(
+            f"{stage}: {stats['records']} records, {stats['skipped']} skipped "
+            f"in {stats['seconds']:.1f}s ({rate:.0f} records/s)"
+        )
@@ -0,0 +1,48 @@
+import io
+import zlib
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseBadRequest
+
+# zlib window bits per supported Content-Encoding.
+WBITS = {
+    "gzip": 16 + zlib.MAX_WBITS,
+    "x-gzip": 16 + zlib.MAX_WBITS,
+    "deflate": zlib.MAX_WBITS,
+}
+
+
+class RequestDecompressionMiddleware:
+    """
+    Decompresses request bodies sent with `Content-Encoding: gzip` or `deflate`.
+
+    The body is replaced by its decompressed content before any view reads it,
+    so parsers do not need to know about the compression. Bodies decompressing
+    to more than `OPENPROJECT_MAX_DECOMPRESSED_REQUEST_SIZE` bytes are rejected
+    without being decompressed completely. API responses are compressed by
+    `views.GZipMixin`.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        encoding = request.META.get("HTTP_CONTENT_ENCODING", "").strip().lower()
+        if encoding and encoding != "identity":
+            if encoding not in WBITS:
+                return HttpResponse(f"Unsupported Content-Encoding {encoding!r}.", status=415)
+            limit = settings.OPENPROJECT_MAX_DECOMPRESSED_REQUEST_SIZE
+            decompressor = zlib.decompressobj(WBITS[encoding])
+            try:
+                body = decompressor.decompress(request.body, limit + 1)
+            except zlib.error:
+                return HttpResponseBadRequest("Invalid compressed request body.")
+            if len(body) > limit:
+                return HttpResponse("Decompressed request body too large.", status=413)
+            if not decompressor.eof:
+                return HttpResponseBadRequest("Truncated compressed request body.")
+            request._body = body
+            request._stream = io.BytesIO(body)
+            request.META["CONTENT_LENGTH"] = str(len(body))
+            del request.META["HTTP_CONTENT_ENCODING"]
+        return self.get_response(request)
@@ -0,0 +1,64 @@
+# Generated by Django 6.0.1 on 2026-10-18 04:02
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def check_duplicate_openproject_ids(apps, schema_editor):
+    """
+    Fails with the duplicate OpenProject IDs before they are made unique.
+
+    Earlier versions of the synchronization scripts could write an OpenProject
+    resource more than once. Which of the rows to keep (and where to move the
+    rows referencing the others) cannot be decided here, so the duplicates have
+    to be merged by hand before migrating.
+    """
+    duplicates = {}
+    for model_name in ("Project", "WorkPackage", "TimeEntry"):
+        model = apps.get_model("openproject_sync", model_name)
+        ids = list(
+            model.objects.values("openproject_id")
+            .annotate(count=Count("pk"))
+            .filter(count__gt=1)
+            .order_by("openproject_id")
+            .values_list("openproject_id", flat=True)
+        )
+        if ids:
+            duplicates[model_name] = ids
+    if duplicates:
+        raise RuntimeError(
+            "OpenProject IDs must be unique, merge the rows with these duplicate IDs "
+            "before migrating: "
+            + "; ".join(f"{name}: {', '.join(map(str, ids))}" for name, ids in duplicates.items())
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openproject_sync', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_openproject_ids, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='workpackage',
+            name='lockVersion',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='openproject_id',
+            field=models.IntegerField(unique=True),
+        ),
+        migrations.AlterField(
+            model_name='timeentry',
+            name='openproject_id',
+            field=models.IntegerField(unique=True),
+        ),
+        migrations.AlterField(
+            model_name='workpackage',
+            name='openproject_id',
+            field=models.IntegerField(unique=True),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0.1 on 2026-10-18 05:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openproject_sync', '0003_outboxevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resource', models.CharField(choices=[('work_packages', 'Work Packages'), ('time_entries', 'Time Entries')], max_length=32, unique=True)),
+                ('watermark', models.DateTimeField(blank=True, null=True)),
+                ('last_full_sync_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Sync States',
+                'ordering': ('resource',),
+            },
+        ),
+    ]
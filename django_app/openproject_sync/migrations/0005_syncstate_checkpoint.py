@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-18 07:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openproject_sync', '0004_syncstate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='syncstate',
+            name='checkpoint',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
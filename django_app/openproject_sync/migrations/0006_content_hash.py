@@ -0,0 +1,79 @@
+# Generated by Django 6.0.1 on 2026-10-18 07:40
+
+import datetime
+import hashlib
+import json
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def content_hash(values):
+    """
+    Mirrors `openproject_sync.models.content_hash` as of this migration.
+    """
+
+    def hashable_value(value):
+        if isinstance(value, datetime.datetime):
+            if timezone.is_aware(value):
+                value = value.astimezone(datetime.timezone.utc)
+            return value.isoformat()
+        if isinstance(value, datetime.date):
+            return value.isoformat()
+        return value
+
+    payload = json.dumps(
+        [hashable_value(value) for value in values], separators=(",", ":"), default=str
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+
+def backfill_content_hash(apps, schema_editor):
+    """
+    Stores the content hash of all existing rows.
+
+    Mirrors `OpenProjectModelMixin.content_hash_fields` and `content_hash`, as
+    historical models do not have the methods of the current ones and the
+    hashing must not change with later versions of the models module.
+    """
+    for model_name in ("Project", "WorkPackage", "TimeEntry"):
+        model = apps.get_model("openproject_sync", model_name)
+        attnames = sorted(
+            field.attname
+            for field in model._meta.concrete_fields
+            if not field.primary_key and field.name not in ("openproject_id", "content_hash")
+        )
+        batch = []
+        for obj in model.objects.only(*attnames).iterator(chunk_size=2000):
+            obj.content_hash = content_hash(getattr(obj, attname) for attname in attnames)
+            batch.append(obj)
+            if len(batch) >= 2000:
+                model.objects.bulk_update(batch, ["content_hash"])
+                batch = []
+        model.objects.bulk_update(batch, ["content_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openproject_sync', '0005_syncstate_checkpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', editable=False, max_length=16),
+        ),
+        migrations.AddField(
+            model_name='timeentry',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', editable=False, max_length=16),
+        ),
+        migrations.AddField(
+            model_name='workpackage',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', editable=False, max_length=16),
+        ),
+        migrations.RunPython(backfill_content_hash, migrations.RunPython.noop),
+    ]
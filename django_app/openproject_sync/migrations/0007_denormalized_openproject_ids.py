@@ -0,0 +1,44 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:12
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_openproject_ids(apps, schema_editor):
+    """
+    Copies the OpenProject IDs of the parents of all existing rows.
+    """
+    Project = apps.get_model("openproject_sync", "Project")
+    WorkPackage = apps.get_model("openproject_sync", "WorkPackage")
+    TimeEntry = apps.get_model("openproject_sync", "TimeEntry")
+    WorkPackage.objects.update(
+        project_openproject_id=Subquery(
+            Project.objects.filter(pk=OuterRef("project_id")).values("openproject_id")[:1]
+        )
+    )
+    TimeEntry.objects.update(
+        work_package_openproject_id=Subquery(
+            WorkPackage.objects.filter(pk=OuterRef("work_package_id")).values("openproject_id")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openproject_sync', '0006_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='timeentry',
+            name='work_package_openproject_id',
+            field=models.IntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='workpackage',
+            name='project_openproject_id',
+            field=models.IntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_openproject_ids, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,41 @@
-from django.db import models
+import datetime
+import hashlib
+import json
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+
+
+def _hashable_value(value):
+    if isinstance(value, datetime.datetime):
+        if timezone.is_aware(value):
+            value = value.astimezone(datetime.timezone.utc)
+        return value.isoformat()
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return value
+
+
+def content_hash(values):
+    """
+    Computes a stable hash of the given field values.
+
+    Dates and datetimes are normalized to ISO 8601 (datetimes in UTC), so values
+    read from the database and freshly validated values hash identically.
+
+    Args:
+        values (Iterable): The field values, in the order of `content_hash_fields()`.
+
+    Returns:
+        str: A 16 character hexadecimal digest.
+    """
+    payload = json.dumps(
+        [_hashable_value(value) for value in values],
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
 
 
 class OpenProjectModelMixin(models.Model):
@@ -8,14 +45,183 @@ class OpenProjectModelMixin(models.Model):
     This mixin provides the functionality to associate a model with an
     OpenProject ID. It is designed to be used as an abstract base class,
     allowing other models to inherit from it and include the `openproject_id`
-    field for managing integration with the OpenProject platform.
+    field for managing integration with the OpenProject platform. The field is
+    unique (and therefore indexed) per model, as all API lookups go through it.
+    The content hash of the synchronized fields is stored with every row, so
+    that writes of unchanged records can be skipped.
     """
 
-    openproject_id = models.IntegerField()
+    openproject_id = models.IntegerField(unique=True)
+    # The content hash of the synchronized fields as last written, or empty if
+    # unknown (e.g. after a queryset update).
+    content_hash = models.CharField(max_length=16, blank=True, default="", editable=False)
+
+    # Maps the keys of the `to_openproject()` payload to the attribute names of
+    # the fields they are derived from.
+    openproject_fields = {}
+    # Payload keys always sent, even if their fields did not change.
+    openproject_required_keys = ("_type", "id", "lockVersion")
+    # The `_type` of the corresponding OpenProject HAL resource.
+    openproject_type = None
+    # Maps foreign key names to the HAL links (in order of preference) the
+    # related resource is read from, see `openproject_sync.hal`.
+    openproject_links = {}
+    # Maps the names of fields holding copies of fields of related objects to
+    # the (foreign key, related field) pair they are copied from, so that e.g.
+    # `to_openproject()` does not need to fetch the related object.
+    denormalized_fields = {}
 
     class Meta:
         abstract = True
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            attname: value
+            for attname, value in zip(field_names, values)
+            if value is not models.DEFERRED
+        }
+        return instance
+
+    def get_dirty_fields(self):
+        """
+        Returns the attribute names of all fields changed since the instance was
+        loaded from or last saved to the database.
+
+        For instances that were never loaded or saved, all concrete fields are
+        considered dirty.
+        """
+        loaded = getattr(self, "_loaded_values", None)
+        attnames = [field.attname for field in self._meta.concrete_fields]
+        if loaded is None:
+            return set(attnames)
+        return {
+            attname
+            for attname in attnames
+            if attname in loaded and getattr(self, attname) != loaded[attname]
+        }
+
+    def to_openproject_diff(self):
+        """
+        Returns the `to_openproject()` payload restricted to the changed fields.
+
+        Keys listed in `openproject_required_keys` are always kept.
+
+        Returns:
+            dict or None: The minimal payload, or None if no synchronized field
+            changed and nothing needs to be sent.
+        """
+        dirty = self.get_dirty_fields()
+        changed_keys = {
+            key for key, attname in self.openproject_fields.items() if attname in dirty
+        }
+        if not changed_keys:
+            return None
+        return {
+            key: value
+            for key, value in self.to_openproject().items()
+            if key in changed_keys or key in self.openproject_required_keys
+        }
+
+    @classmethod
+    def content_hash_fields(cls):
+        """
+        Returns the attribute names of all fields covered by the content hash.
+
+        These are all concrete fields except the primary key, `openproject_id`,
+        `content_hash` and the `denormalized_fields`, with foreign keys given by
+        their column attribute (e.g. `project_id`). They are sorted by name, so
+        the hash does not depend on the order the fields are declared or were
+        added by migrations in.
+        """
+        excluded = {"openproject_id", "content_hash", *cls.denormalized_fields}
+        return sorted(
+            field.attname
+            for field in cls._meta.concrete_fields
+            if not field.primary_key and field.name not in excluded
+        )
+
+    def get_content_hash(self):
+        """
+        Returns the content hash of the synchronized fields of this instance.
+        """
+        return content_hash(
+            getattr(self, attname) for attname in self.content_hash_fields()
+        )
+
+    def refresh_denormalized_fields(self):
+        """
+        Copies the `denormalized_fields` from the related objects.
+
+        A related object is only fetched if it is not cached on the instance and
+        its foreign key changed since the instance was loaded.
+        """
+        loaded = getattr(self, "_loaded_values", {})
+        for name, (fk_name, related_name) in self.denormalized_fields.items():
+            fk = self._meta.get_field(fk_name)
+            related_pk = getattr(self, fk.attname)
+            if related_pk is None:
+                value = None
+            elif fk.is_cached(self):
+                value = getattr(getattr(self, fk_name), related_name)
+            elif name in loaded and loaded.get(fk.attname) == related_pk:
+                continue
+            else:
+                value = (
+                    fk.related_model._default_manager.filter(pk=related_pk)
+                    .values_list(related_name, flat=True)
+                    .first()
+                )
+            setattr(self, name, value)
+
+    @classmethod
+    def update_denormalized_copies(cls, pk, values):
+        """
+        Updates the copies of fields of an instance held by related objects.
+
+        Args:
+            pk: The primary key of the changed instance.
+            values (dict): The new values by attribute name.
+        """
+        for relation in cls._meta.related_objects:
+            related_model = relation.related_model
+            for name, (fk_name, related_name) in getattr(
+                related_model, "denormalized_fields", {}
+            ).items():
+                if fk_name == relation.field.name and related_name in values:
+                    # Only rows holding an outdated copy are written.
+                    related_model._default_manager.filter(
+                        **{relation.field.attname: pk}
+                    ).exclude(**{name: values[related_name]}).update(**{name: values[related_name]})
+
+    def save(self, *args, **kwargs):
+        self.refresh_denormalized_fields()
+        self.content_hash = self.get_content_hash()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            update_fields = {*update_fields, "content_hash"}
+            update_fields.update(
+                name
+                for name, (fk_name, _) in self.denormalized_fields.items()
+                if fk_name in update_fields
+            )
+            kwargs["update_fields"] = update_fields
+        changed = {}
+        if getattr(self, "_loaded_values", None) is not None:
+            changed = {attname: getattr(self, attname) for attname in self.get_dirty_fields()}
+        # The post_save receivers write to the outbox, which has to happen in the
+        # same transaction as the save itself.
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
+            if changed:
+                self.update_denormalized_copies(self.pk, changed)
+        self._loaded_values = {
+            field.attname: getattr(self, field.attname)
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+        }
+
 
 class Project(OpenProjectModelMixin, models.Model):
     """
@@ -46,6 +252,15 @@ class Project(OpenProjectModelMixin, models.Model):
     public = models.BooleanField(default=True)
     description = models.TextField(blank=True, null=True)
 
+    openproject_fields = {
+        "identifier": "identifier",
+        "name": "name",
+        "active": "active",
+        "public": "public",
+        "description": "description",
+    }
+    openproject_type = "Project"
+
     class Meta:
         ordering = ("name",)
         verbose_name_plural = "Projects"
@@ -97,6 +312,25 @@ class WorkPackage(OpenProjectModelMixin, models.Model):
     ignoreNonWorkingDays = models.BooleanField(default=False)
     percentageDone = models.IntegerField(blank=True, null=True)
     derivedPercentageDone = models.IntegerField(blank=True, null=True)
+    # Copy of `project.openproject_id`, see `denormalized_fields`.
+    project_openproject_id = models.IntegerField(blank=True, null=True, editable=False)
+
+    openproject_fields = {
+        "subject": "subject",
+        "startDate": "startDate",
+        "dueDate": "dueDate",
+        "estimatedTime": "estimatedTime",
+        "duration": "duration",
+        "laborCosts": "laborCosts",
+        "materialCosts": "materialCosts",
+        "overallCosts": "overallCosts",
+        "scheduleManually": "scheduleManually",
+        "description": "description",
+        "_embedded": "project_id",
+    }
+    openproject_type = "WorkPackage"
+    openproject_links = {"project": ("project",)}
+    denormalized_fields = {"project_openproject_id": ("project", "openproject_id")}
 
     class Meta:
         ordering = ("subject",)
@@ -121,7 +355,7 @@ class WorkPackage(OpenProjectModelMixin, models.Model):
             "overallCosts": self.overallCosts,
             "scheduleManually": str(self.scheduleManually),
             "description": {"raw": self.description},
-            "_embedded": {"project": {"id": self.project.openproject_id}},
+            "_embedded": {"project": {"id": self.project_openproject_id}},
         }
 
 
@@ -133,6 +367,20 @@ class TimeEntry(OpenProjectModelMixin, models.Model):
     hours = models.CharField(max_length=255, blank=True, null=True)
     createdAt = models.DateTimeField(blank=True, null=True)
     updatedAt = models.DateTimeField(blank=True, null=True)
+    # Copy of `work_package.openproject_id`, see `denormalized_fields`.
+    work_package_openproject_id = models.IntegerField(blank=True, null=True, editable=False)
+
+    openproject_fields = {
+        "ongoing": "ongoing",
+        "spentOn": "spentOn",
+        "hours": "hours",
+        "comment": "comment",
+        "_embedded": "work_package_id",
+    }
+    openproject_type = "TimeEntry"
+    # Newer OpenProject versions link the work package as "entity".
+    openproject_links = {"work_package": ("entity", "workPackage")}
+    denormalized_fields = {"work_package_openproject_id": ("work_package", "openproject_id")}
 
     class Meta:
         ordering = ("work_package", "spentOn")
@@ -149,5 +397,121 @@ class TimeEntry(OpenProjectModelMixin, models.Model):
             "spentOn": str(self.spentOn),
             "hours": self.hours,
             "comment": {"raw": self.comment},
-            "_embedded": {"workPackage": {"id": self.work_package.openproject_id}},
+            "_embedded": {"workPackage": {"id": self.work_package_openproject_id}},
         }
+
+
+class OutboxEvent(models.Model):
+    """
+    A pending push of a local change to OpenProject.
+
+    Outbox events are written by the `post_save` receivers in the same database
+    transaction as the change they describe, and are delivered asynchronously by
+    the `drain_outbox` management command. This keeps OpenProject's latency and
+    availability out of the request/response cycle of the Django application.
+
+    Fields:
+        model_label (str): The label of the changed model, e.g. `openproject_sync.project`.
+        object_id (int): The primary key of the changed instance.
+        action (str): Whether the instance was `created` or `updated`.
+        payload (dict): The OpenProject API payload at the time of the change.
+        created_at (datetime): When the event was written.
+        attempts (int): Number of failed delivery attempts.
+        last_error (str or None): The error of the last failed delivery attempt.
+        claimed_at (datetime or None): When a drainer claimed the event for delivery.
+        processed_at (datetime or None): When the event was delivered.
+    """
+
+    CREATED = "created"
+    UPDATED = "updated"
+    ACTION_CHOICES = ((CREATED, "Created"), (UPDATED, "Updated"))
+
+    model_label = models.CharField(max_length=255)
+    object_id = models.BigIntegerField()
+    action = models.CharField(max_length=16, choices=ACTION_CHOICES)
+    payload = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    attempts = models.IntegerField(default=0)
+    last_error = models.TextField(blank=True, null=True)
+    claimed_at = models.DateTimeField(blank=True, null=True)
+    processed_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ("id",)
+        verbose_name_plural = "Outbox Events"
+        indexes = [
+            models.Index(
+                fields=["id"],
+                condition=models.Q(processed_at__isnull=True),
+                name="outbox_pending_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.model_label} {self.object_id} {self.action}"
+
+
+class SyncState(models.Model):
+    """
+    The incremental synchronization state of one OpenProject resource.
+
+    The watermark is the time the last completed pull of the resource started.
+    Pulls only request records updated since the watermark, except when a full
+    reconcile is due, which happens every `OPENPROJECT_FULL_SYNC_INTERVAL`.
+
+    Fields:
+        resource (str): The OpenProject collection, e.g. `work_packages`.
+        watermark (datetime or None): When the last completed pull started.
+        last_full_sync_at (datetime or None): When the last full reconcile finished.
+        checkpoint (dict): The progress of an unfinished `sync_openproject` run,
+            i.e. when it started (`started_at`) and the OpenProject IDs of the
+            projects already pulled (`done`).
+    """
+
+    RESOURCE_CHOICES = (
+        ("work_packages", "Work Packages"),
+        ("time_entries", "Time Entries"),
+    )
+
+    resource = models.CharField(max_length=32, choices=RESOURCE_CHOICES, unique=True)
+    watermark = models.DateTimeField(blank=True, null=True)
+    last_full_sync_at = models.DateTimeField(blank=True, null=True)
+    checkpoint = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        ordering = ("resource",)
+        verbose_name_plural = "Sync States"
+
+    def __str__(self):
+        return f"{self.resource} - {self.watermark}"
+
+    @property
+    def resource_model(self):
+        return {"work_packages": WorkPackage, "time_entries": TimeEntry}[self.resource]
+
+    @property
+    def full_sync_due(self):
+        return (
+            self.last_full_sync_at is None
+            or self.watermark is None
+            or timezone.now() - self.last_full_sync_at >= settings.OPENPROJECT_FULL_SYNC_INTERVAL
+        )
+
+    def advance(self, started_at, full=False):
+        """
+        Moves the watermark to the time the finished synchronization started.
+
+        Records pulled at different times of a run, or written back by the
+        outbox, may carry a later `updatedAt` than changes made in OpenProject
+        while the run was going on, so the watermark must not be derived from
+        the stored records.
+
+        Args:
+            started_at (datetime): When the finished synchronization started.
+            full (bool): Whether the finished synchronization was a full reconcile.
+        """
+        if self.watermark is None or started_at > self.watermark:
+            self.watermark = started_at
+        if full:
+            self.last_full_sync_at = timezone.now()
+        self.save()
@@ -0,0 +1,221 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from itertools import groupby
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .client import get_client
+from .identity import identity_map
+from .models import OutboxEvent
+
+# OpenProject API v3 collection per model label.
+ENDPOINTS = {
+    "openproject_sync.project": "projects",
+    "openproject_sync.workpackage": "work_packages",
+    "openproject_sync.timeentry": "time_entries",
+}
+
+# Attributes of the OpenProject response written back to the local instance.
+RESPONSE_FIELDS = ("lockVersion", "updatedAt")
+
+
+def enqueue(instance, created):
+    """
+    Writes an outbox event describing the change of the given instance.
+
+    Must be called inside the transaction saving the instance, so that the event
+    is committed (or rolled back) together with the change. Updates only carry
+    the changed fields; if no synchronized field changed, no event is written.
+
+    Args:
+        instance: The saved model instance.
+        created (bool): Whether the instance was newly created.
+
+    Returns:
+        OutboxEvent or None: The written event, if any.
+    """
+    payload = instance.to_openproject() if created else instance.to_openproject_diff()
+    if payload is None:
+        return None
+    return OutboxEvent.objects.create(
+        model_label=instance._meta.label_lower,
+        object_id=instance.pk,
+        action=OutboxEvent.CREATED if created else OutboxEvent.UPDATED,
+        payload=payload,
+    )
+
+
+def push(event):
+    """
+    Sends a single outbox event to the OpenProject API.
+
+    Args:
+        event (OutboxEvent): The event to deliver.
+
+    Returns:
+        dict: The JSON response of the OpenProject API.
+
+    Raises:
+        requests.RequestException: If the request fails or OpenProject rejects it.
+    """
+    url = f"/api/v3/{ENDPOINTS[event.model_label]}/"
+    if event.action == OutboxEvent.CREATED:
+        return get_client().post(url, json=event.payload)
+    return get_client().patch(f"{url}{event.payload['id']}/", json=event.payload)
+
+
+def push_group(events):
+    """
+    Sends the events of one instance in order, stopping at the first failure.
+
+    Returns:
+        list[tuple[OutboxEvent, dict or None, Exception or None]]: The outcome per event.
+    """
+    outcomes = []
+    for event in events:
+        try:
+            response = push(event)
+        except Exception as exc:
+            outcomes.append((event, None, exc))
+            outcomes.extend((later, None, exc) for later in events[len(outcomes):])
+            break
+        outcomes.append((event, response, None))
+        # Later events must address the new ID of a freshly created instance and
+        # carry the lockVersion OpenProject expects next.
+        for later in events[len(outcomes):]:
+            later.payload["id"] = response["id"]
+            if "lockVersion" in later.payload and "lockVersion" in response:
+                later.payload["lockVersion"] = response["lockVersion"]
+    return outcomes
+
+
+def apply_response(event, response):
+    """
+    Writes the identifiers returned by OpenProject back to the local instance.
+
+    The instance is updated with a queryset `update()`, so no further outbox
+    events are written.
+    """
+    model = apps.get_model(event.model_label)
+    field_names = {field.name for field in model._meta.concrete_fields}
+    values = {"openproject_id": response["id"]}
+    values.update(
+        (name, response[name]) for name in RESPONSE_FIELDS if name in field_names and name in response
+    )
+    # The content hash is not recomputed here; marking it unknown makes sure the
+    # next upsert of the instance is not skipped.
+    values["content_hash"] = ""
+    model._default_manager.filter(pk=event.object_id).update(**values)
+    model.update_denormalized_copies(event.object_id, values)
+    identity_map(model).set(response["id"], event.object_id)
+
+
+def claim(batch_size, max_attempts, claim_timeout):
+    """
+    Claims a batch of pending events for delivery and commits the claim.
+
+    The rows are selected with `SELECT ... FOR UPDATE SKIP LOCKED`, so several
+    drainers can run side by side, but the locks are only held until the claim
+    is committed. Claims older than `claim_timeout` are taken over, so events of
+    a drainer that died while pushing are delivered eventually.
+
+    Events of an instance must be pushed in order, as later events address the
+    ID returned for a creation and carry the lockVersion of the previous
+    update. So events having an earlier pending event outside the batch (e.g.
+    one claimed or locked by another drainer) are left for a later batch.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        events = list(
+            OutboxEvent.objects.select_for_update(skip_locked=True)
+            .filter(processed_at__isnull=True, attempts__lt=max_attempts)
+            .filter(Q(claimed_at__isnull=True) | Q(claimed_at__lt=now - claim_timeout))
+            .order_by("id")[:batch_size]
+        )
+        if not events:
+            return events
+        first_pending = {}
+        for model_label, object_id, pk in (
+            OutboxEvent.objects.filter(
+                processed_at__isnull=True,
+                attempts__lt=max_attempts,
+                object_id__in={event.object_id for event in events},
+            )
+            .exclude(pk__in=[event.pk for event in events])
+            .order_by("id")
+            .values_list("model_label", "object_id", "id")
+        ):
+            first_pending.setdefault((model_label, object_id), pk)
+        events = [
+            event
+            for event in events
+            if first_pending.get((event.model_label, event.object_id), event.pk) >= event.pk
+        ]
+        OutboxEvent.objects.filter(pk__in=[event.pk for event in events]).update(claimed_at=now)
+    return events
+
+
+def record_outcome(event, response, error):
+    """
+    Records the outcome of pushing an event in its own transaction.
+
+    Returns:
+        bool: Whether the event was delivered.
+    """
+    with transaction.atomic():
+        if error is None:
+            event.processed_at = timezone.now()
+            try:
+                with transaction.atomic():
+                    apply_response(event, response)
+            except Exception as exc:
+                # OpenProject has the change already; pushing the event again
+                # would e.g. create the instance a second time.
+                event.last_error = f"Applying the response failed: {exc}"
+        else:
+            event.attempts += 1
+            event.last_error = str(error)
+        event.claimed_at = None
+        event.save(update_fields=["payload", "processed_at", "attempts", "last_error", "claimed_at"])
+    return error is None
+
+
+def drain(batch_size=100, max_workers=8, max_attempts=10, claim_timeout=timedelta(minutes=10)):
+    """
+    Delivers one batch of pending outbox events.
+
+    The batch is claimed in a short transaction of its own, and no transaction
+    is open while pushing. Events of different instances are pushed
+    concurrently by up to `max_workers` threads, events of the same instance in
+    order. The outcome of every event is then recorded on the calling thread in
+    a transaction per event, so a failing write-back does not undo the record of
+    the other deliveries.
+
+    Args:
+        batch_size (int): Maximum number of events claimed at once.
+        max_workers (int): Maximum number of concurrent requests to OpenProject.
+        max_attempts (int): Events that failed this often are not retried.
+        claim_timeout (timedelta): Time after which events claimed by another
+            drainer are claimed again.
+
+    Returns:
+        tuple[int, int]: The number of delivered and failed events.
+    """
+    delivered = failed = 0
+    events = claim(batch_size, max_attempts, claim_timeout)
+    if not events:
+        return delivered, failed
+    key = lambda event: (event.model_label, event.object_id)
+    groups = [list(group) for _, group in groupby(sorted(events, key=key), key=key)]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(push_group, groups))
+    for outcomes in results:
+        for event, response, error in outcomes:
+            if record_outcome(event, response, error):
+                delivered += 1
+            else:
+                failed += 1
+    return delivered, failed
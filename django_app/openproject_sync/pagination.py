@@ -0,0 +1,22 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class OpenProjectCursorPagination(CursorPagination):
+    """
+    Keyset pagination over the primary key for all OpenProject resources.
+
+    Pages are selected with `WHERE id > <cursor> ORDER BY id LIMIT <size>`, so the
+    cost of a page does not grow with its position in the table and cursors stay
+    stable while rows are inserted concurrently. Clients follow the `next` link
+    of each page until it is `null`.
+
+    Attributes:
+        ordering: The indexed, unique and immutable column used as the key.
+        page_size_query_param: Query parameter allowing clients to pick a page size.
+        max_page_size: Upper bound for client-chosen page sizes.
+    """
+
+    ordering = "id"
+    page_size_query_param = "page_size"
+    max_page_size = settings.OPENPROJECT_MAX_PAGE_SIZE
@@ -0,0 +1,206 @@
+import json
+import time
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
+from django.db import connections
+from django.utils import timezone
+
+from openproject_sync import hal
+from openproject_sync.client import get_client
+from openproject_sync.models import Project, SyncState, TimeEntry, WorkPackage
+from openproject_sync.serializers import (
+    ProjectSerializer,
+    TimeEntrySerializer,
+    WorkPackageSerializer,
+    upsert_valid,
+)
+
+SERIALIZERS = {
+    Project: ProjectSerializer,
+    WorkPackage: WorkPackageSerializer,
+    TimeEntry: TimeEntrySerializer,
+}
+
+
+def new_stats():
+    return {"records": 0, "skipped": 0, "seconds": 0.0}
+
+
+def merge_stats(stats, other):
+    """
+    Adds the per-stage statistics `other` to `stats` in place and returns it.
+    """
+    for stage, values in other.items():
+        totals = stats.setdefault(stage, new_stats())
+        for key, value in values.items():
+            totals[key] += value
+    return stats
+
+
+def write_page(model, documents):
+    """
+    Writes one page of OpenProject HAL documents with a single bulk upsert.
+
+    The documents are mapped with `openproject_sync.hal` and validated with the
+    model's serializer. Records failing validation (e.g. time entries not logged
+    on a work package, or referencing work packages that are not visible) are
+    skipped, the others are written in one transaction. As the records are
+    written with `bulk_create`, no signals are sent and nothing is pushed back
+    to OpenProject.
+
+    Returns:
+        tuple[int, int]: The number of written and skipped records.
+    """
+    records = [hal.from_hal(model, document) for document in documents]
+    written, skipped = upsert_valid(SERIALIZERS[model], records, {})
+    return len(written), len(skipped)
+
+
+def pull_collection(model, path, params=None, stats=None):
+    """
+    Pulls an OpenProject collection into the database page by page.
+
+    Args:
+        model: The model the elements are written to.
+        path (str): The API path or absolute URL of the collection.
+        params (dict): Additional query parameters, e.g. "filters".
+        stats (dict): The statistics of the stage, updated in place.
+
+    Returns:
+        list[dict]: The pulled HAL documents if `model` is `Project`, as they are
+        needed to pull the work packages of each project; otherwise an empty list.
+    """
+    stats = new_stats() if stats is None else stats
+    documents = []
+    started = time.monotonic()
+    for elements in get_client().iter_pages(path, params=params):
+        written, skipped = write_page(model, elements)
+        stats["records"] += written
+        stats["skipped"] += skipped
+        if model is Project:
+            documents.extend(elements)
+    stats["seconds"] += time.monotonic() - started
+    return documents
+
+
+def project_shards(documents):
+    """
+    Returns the (OpenProject ID, work packages href) pair of every project.
+    """
+    return [
+        (document["id"], document.get("_links", {}).get("workPackages", {}).get("href"))
+        for document in documents
+    ]
+
+
+def pull_shard(resource, shard):
+    """
+    Pulls the work packages or time entries of one project.
+
+    Args:
+        resource (str): Either "work_packages" or "time_entries".
+        shard (tuple): The (OpenProject ID, work packages href) pair of the project.
+
+    Returns:
+        dict: The statistics of the pulled records.
+    """
+    project_id, work_packages_href = shard
+    stats = new_stats()
+    if resource == "work_packages":
+        pull_collection(
+            WorkPackage,
+            work_packages_href or f"/api/v3/projects/{project_id}/work_packages",
+            # Closed work packages are excluded by OpenProject's default filter.
+            params={"filters": "[]"},
+            stats=stats,
+        )
+    else:
+        filters = [{"project": {"operator": "=", "values": [str(project_id)]}}]
+        pull_collection(
+            TimeEntry, "/api/v3/time_entries", params={"filters": json.dumps(filters)}, stats=stats
+        )
+    return stats
+
+
+def pull_shards(resource, shards, workers=1):
+    """
+    Pulls the work packages or time entries of several projects.
+
+    With more than one worker, the projects are pulled by a pool of processes,
+    each with its own database connection and OpenProject client.
+
+    Args:
+        resource (str): Either "work_packages" or "time_entries".
+        shards (list[tuple]): The (OpenProject ID, work packages href) pairs.
+        workers (int): The number of processes.
+
+    Yields:
+        tuple[tuple, dict]: Each shard with its statistics, in order of completion.
+    """
+    if workers <= 1:
+        for shard in shards:
+            yield shard, pull_shard(resource, shard)
+        return
+    # Forked workers must not reuse the database connections of this process,
+    # they open their own on first use.
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as executor:
+        futures = {executor.submit(pull_shard, resource, shard): shard for shard in shards}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def pull(resume=False, progress=None, workers=1):
+    """
+    Pulls all projects, work packages and time entries from OpenProject.
+
+    Projects are always pulled completely. Work packages and time entries are
+    pulled project by project; after each project the progress is stored in the
+    resource's `SyncState.checkpoint`, so that an interrupted run can be resumed
+    with `resume=True`, skipping the projects already done. Once a resource is
+    complete its watermark is advanced to the time the (first, if resumed) run
+    started and its checkpoint cleared.
+
+    Args:
+        resume (bool): Whether to skip the projects done by an interrupted run.
+        progress (callable): Called with the stage name and its statistics after
+            each stage.
+        workers (int): The number of processes pulling projects in parallel.
+
+    Returns:
+        dict: The statistics per stage, each with the number of written and
+        skipped records and the elapsed (wall clock) seconds.
+    """
+    started_at = timezone.now()
+    stats = {"projects": new_stats()}
+    shards = project_shards(pull_collection(Project, "/api/v3/projects", stats=stats["projects"]))
+    if progress:
+        progress("projects", stats["projects"])
+    for resource in ("work_packages", "time_entries"):
+        state, _ = SyncState.objects.get_or_create(resource=resource)
+        checkpoint = state.checkpoint if resume else {}
+        done = set(checkpoint.get("done", []))
+        resource_started_at = checkpoint.get("started_at", started_at.isoformat())
+        stats[resource] = new_stats()
+        started = time.monotonic()
+        pending = [shard for shard in shards if shard[0] not in done]
+        for shard, shard_stats in pull_shards(resource, pending, workers=workers):
+            merge_stats(stats, {resource: shard_stats})
+            done.add(shard[0])
+            state.checkpoint = {"started_at": resource_started_at, "done": sorted(done)}
+            state.save(update_fields=["checkpoint"])
+        # The shards may have been pulled in parallel, so their durations add up
+        # to more than the elapsed time.
+        stats[resource]["seconds"] = time.monotonic() - started
+        state.checkpoint = {}
+        state.advance(datetime.fromisoformat(resource_started_at), full=True)
+        if progress:
+            progress(resource, stats[resource])
+    return stats
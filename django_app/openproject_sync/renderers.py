@@ -0,0 +1,92 @@
+import json
+
+from rest_framework import renderers
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    """
+    Renders JSON with orjson, which is several times faster than `json`.
+
+    The output is the same as the compact output of DRF's `JSONRenderer`:
+    values orjson does not handle the same way (dates, times, decimals, lazy
+    strings) are converted by DRF's JSON encoder. Indented output, as requested
+    by the browsable API, is rendered by `JSONRenderer`, as is everything if
+    orjson is not installed.
+    """
+
+    options = 0 if orjson is None else orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type or "", renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        ret = orjson.dumps(data, default=self.encoder_class().default, option=self.options)
+        # Like JSONRenderer, escape the separators that are invalid in JavaScript strings.
+        return ret.replace("\u2028".encode(), b"\\u2028").replace("\u2029".encode(), b"\\u2029")
+
+
+class MessagePackRenderer(renderers.BaseRenderer):
+    """
+    Renders MessagePack, a binary format more compact than JSON.
+
+    Values without a MessagePack type (dates, times, decimals) are rendered as
+    the strings they are rendered as in JSON. Requires the msgpack package.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=encoders.JSONEncoder().default, datetime=False)
+
+
+class NDJSONRenderer(renderers.BaseRenderer):
+    """
+    Renders newline delimited JSON, one record per line.
+
+    List views stream their records in this format without building the full
+    list in memory (see `views.StreamingListMixin`). Other responses, e.g.
+    errors, are rendered here as a single line, or one line per element of a list.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        records = data if isinstance(data, list) else [data]
+        return b"".join(self.render_line(record) for record in records)
+
+    @staticmethod
+    def render_line(record):
+        if orjson is not None:
+            return orjson.dumps(
+                record,
+                default=encoders.JSONEncoder().default,
+                option=ORJSONRenderer.options | orjson.OPT_APPEND_NEWLINE,
+            )
+        return json.dumps(
+            record, cls=encoders.JSONEncoder, ensure_ascii=False, separators=(",", ":")
+        ).encode() + b"\n"
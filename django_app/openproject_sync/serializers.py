@@ -1,6 +1,346 @@
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
 
-from openproject_sync.models import TimeEntry, WorkPackage, Project
+from openproject_sync.identity import identity_map
+from openproject_sync.models import TimeEntry, WorkPackage, Project, SyncState
+
+
+class UniqueOpenProjectIdValidator:
+    """
+    Validates the uniqueness of `openproject_id` through the identity map.
+
+    Unlike DRF's `UniqueValidator`, which issues an `EXISTS` query for every
+    write, this validator answers from the per-process identity map whenever the
+    OpenProject ID is already known. Only a conflicting cache hit is confirmed
+    against the database, so stale entries never reject valid data.
+    """
+
+    requires_context = True
+    message = "An object with this openproject_id already exists."
+
+    def __call__(self, value, serializer_field):
+        serializer = serializer_field.parent
+        instance = getattr(serializer, "instance", None)
+        model = serializer.Meta.model
+        ids = identity_map(model)
+        pk = ids.get(value)
+        if pk is None or (instance is not None and instance.pk == pk):
+            return
+        if not model._default_manager.filter(pk=pk, openproject_id=value).exists():
+            ids.discard(openproject_id=value, pk=pk)
+            return self(value, serializer_field)
+        raise serializers.ValidationError(self.message, code="unique")
+
+
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    A primary key related field that resolves against prefetched targets.
+
+    If the serializer context holds a `prefetched` mapping for the related model
+    and `lookup_field` (as filled by `BulkUpsertListSerializer`), the target
+    object is taken from it instead of being fetched with one query per record.
+    """
+
+    lookup_field = "pk"
+
+    def get_lookup_model_field(self):
+        model = self.get_queryset().model
+        if self.lookup_field == "pk":
+            return model._meta.pk
+        return model._meta.get_field(self.lookup_field)
+
+    def to_internal_value(self, data):
+        model = self.get_queryset().model
+        prefetched = self.context.get("prefetched", {}).get((model, self.lookup_field))
+        if prefetched is None:
+            return super().to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            return prefetched[self.get_lookup_model_field().to_python(data)]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+        except (TypeError, ValueError, DjangoValidationError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+
+class OpenProjectIdRelatedField(PrefetchedPrimaryKeyRelatedField):
+    """
+    A write-only related field addressing its target by `openproject_id`.
+
+    Lets clients reference related records by the ID OpenProject knows them by,
+    so no translation to Django primary keys is needed before a write. Within a
+    bulk upsert the targets are prefetched like primary keys.
+    """
+
+    lookup_field = "openproject_id"
+    default_error_messages = {
+        "does_not_exist": 'Invalid openproject_id "{pk_value}" - object does not exist.',
+    }
+
+    def __init__(self, **kwargs):
+        kwargs["write_only"] = True
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        model = self.get_queryset().model
+        if self.context.get("prefetched", {}).get((model, self.lookup_field)) is not None:
+            return super().to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            return self.get_queryset().get(openproject_id=data)
+        except ObjectDoesNotExist:
+            self.fail("does_not_exist", pk_value=data)
+        except (TypeError, ValueError, DjangoValidationError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+
+class BulkUpsertListSerializer(serializers.ListSerializer):
+    """
+    List serializer that creates or updates many records keyed by `openproject_id`.
+
+    Foreign key targets referenced by the records are prefetched with a single
+    query per related model before the records are validated, and the validated
+    records are written with one `bulk_create(update_conflicts=True)` statement.
+    Records whose content hash matches the one stored for them are unchanged
+    and not written at all. As `bulk_create` does not send `post_save`, no
+    record is pushed back to OpenProject.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            self.prefetch_related_targets(data)
+        return super().to_internal_value(data)
+
+    def prefetch_related_targets(self, data):
+        """
+        Fetches all foreign key targets referenced in `data` into the context.
+        """
+        prefetched = self.context.setdefault("prefetched", {})
+        for field_name, field in self.child.fields.items():
+            if field.read_only or not isinstance(field, PrefetchedPrimaryKeyRelatedField):
+                continue
+            values = {
+                item[field_name]
+                for item in data
+                if isinstance(item, dict)
+                and item.get(field_name) is not None
+                and not isinstance(item[field_name], (bool, dict, list))
+            }
+            queryset = field.get_queryset()
+            try:
+                prefetched[(queryset.model, field.lookup_field)] = queryset.in_bulk(
+                    values, field_name=field.lookup_field
+                )
+            except (TypeError, ValueError, DjangoValidationError):
+                # Invalid values are reported per record by the field itself.
+                pass
+
+    def upsert(self, validated_data):
+        """
+        Writes the validated records in a single transaction.
+
+        Parameters:
+            validated_data (list[dict]): The validated records.
+
+        Returns:
+            dict: A mapping of OpenProject ID to primary key of all written records.
+        """
+        model = self.child.Meta.model
+        records = {record["openproject_id"]: record for record in validated_data}
+        if not records:
+            return {}
+        # Records only overwrite the fields they contain, so records with
+        # different keys cannot share the update fields of one statement.
+        groups = {}
+        for openproject_id, record in records.items():
+            groups.setdefault(frozenset(record), {})[openproject_id] = record
+        try:
+            with transaction.atomic():
+                for group in groups.values():
+                    self.write(model, group)
+        except IntegrityError as exc:
+            raise serializers.ValidationError({"non_field_errors": [str(exc)]})
+        mapping = dict(
+            model._default_manager.filter(openproject_id__in=records).values_list(
+                "openproject_id", "pk"
+            )
+        )
+        identity_map(model).set_many(mapping)
+        return mapping
+
+    def write(self, model, records):
+        """
+        Writes records that all contain the same fields in one statement.
+        """
+        concrete_fields = {field.name for field in model._meta.concrete_fields}
+        update_fields = sorted(
+            (set(next(iter(records.values()))) & concrete_fields)
+            - {model._meta.pk.name, "openproject_id", "content_hash"}
+        )
+        objs = self.changed_objects(model, records, update_fields)
+        if update_fields:
+            update_fields.append("content_hash")
+            update_fields.extend(
+                name
+                for name, (fk_name, _) in model.denormalized_fields.items()
+                if fk_name in update_fields
+            )
+        model._default_manager.bulk_create(
+            objs,
+            update_conflicts=bool(update_fields),
+            ignore_conflicts=not update_fields,
+            unique_fields=["openproject_id"] if update_fields else None,
+            update_fields=update_fields or None,
+        )
+
+    def changed_objects(self, model, records, update_fields):
+        """
+        Returns unsaved instances of the records that are new or changed.
+
+        Existing rows keep the values of the fields not written by the upsert,
+        so these are read together with the stored content hashes (in a single
+        query) to compute the hash each row will have after the write.
+        """
+        update_attnames = {model._meta.get_field(name).attname for name in update_fields}
+        kept = [
+            attname for attname in model.content_hash_fields() if attname not in update_attnames
+        ]
+        existing = {
+            row[0]: row[1:]
+            for row in model._default_manager.filter(openproject_id__in=records)
+            .order_by()
+            .values_list("openproject_id", "content_hash", *kept)
+        }
+        objs = []
+        for openproject_id, record in records.items():
+            obj = model(**record)
+            for name, (fk_name, related_name) in model.denormalized_fields.items():
+                if fk_name in record:
+                    # The related objects were prefetched, so this needs no query.
+                    related = record[fk_name]
+                    setattr(obj, name, None if related is None else getattr(related, related_name))
+            row = existing.get(openproject_id)
+            if row is not None:
+                for attname, value in zip(kept, row[1:]):
+                    setattr(obj, attname, value)
+            obj.content_hash = obj.get_content_hash()
+            if row is None or row[0] != obj.content_hash:
+                objs.append(obj)
+        return objs
+
+
+def upsert_valid(serializer_class, records, context, **kwargs):
+    """
+    Writes the valid records with one bulk upsert, skipping the invalid ones.
+
+    Records failing validation (e.g. time entries referencing work packages
+    that are not synchronized yet) are left out, the others are written in one
+    transaction. Errors concerning the request as a whole, e.g. exceeding
+    `max_length`, are raised.
+
+    Args:
+        serializer_class: The model serializer of the records.
+        records (list[dict]): The records to write.
+        context (dict): The serializer context, `upsert` is set on it.
+        **kwargs: Passed on to the list serializer, e.g. `max_length`.
+
+    Returns:
+        tuple[dict, dict]: The mapping of OpenProject ID to primary key of all
+        written records, and the validation errors per index of the skipped
+        records.
+    """
+    context["upsert"] = True
+    serializer = serializer_class(data=records, many=True, context=context, **kwargs)
+    if serializer.is_valid():
+        return serializer.upsert(serializer.validated_data), {}
+    errors = serializer.errors
+    # Per-record errors are a list aligned with the records, or a mapping of
+    # the indexes of invalid records in newer DRF versions.
+    if isinstance(errors, list):
+        skipped = {index: error for index, error in enumerate(errors) if error}
+    elif errors and all(isinstance(index, int) for index in errors):
+        skipped = dict(errors)
+    else:
+        serializer.is_valid(raise_exception=True)
+    valid = [record for index, record in enumerate(records) if index not in skipped]
+    if not valid:
+        return {}, skipped
+    serializer = serializer_class(data=valid, many=True, context=context, **kwargs)
+    serializer.is_valid(raise_exception=True)
+    return serializer.upsert(serializer.validated_data), skipped
+
+
+class ValuesRepresentation:
+    """
+    Builds the representation of a read serializer from `values()` rows.
+
+    `ModelSerializer.to_representation` instantiates a model per row and calls
+    `get_attribute` and `to_representation` of every field, which dominates the
+    time of list requests. This class reads the columns of the serializer's
+    readable fields from each row dict instead, converting the values with
+    converters chosen once per field: values whose representation is the value
+    itself (integers, booleans, strings and primary keys of related objects)
+    are taken as they are, all others are converted with the field's
+    `to_representation`. The result is the same as the serializer's.
+
+    Use `for_serializer`, which returns None if the serializer has fields not
+    backed by a model column, e.g. method fields or nested serializers.
+    """
+
+    identity_fields = (
+        serializers.BooleanField,
+        serializers.CharField,
+        serializers.IntegerField,
+    )
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.lookups = [lookup for _, lookup, _ in columns]
+
+    @classmethod
+    def for_serializer(cls, serializer):
+        model = serializer.Meta.model
+        identity_methods = {field_class.to_representation for field_class in cls.identity_fields}
+        columns = []
+        for field in serializer._readable_fields:
+            try:
+                model_field = model._meta.get_field(field.source)
+            except (FieldDoesNotExist, AttributeError):
+                return None
+            if not model_field.concrete:
+                return None
+            if isinstance(field, serializers.PrimaryKeyRelatedField):
+                # `values()` returns the primary key of the related object.
+                if field.pk_field is not None or not model_field.many_to_one:
+                    return None
+                converter = None
+            elif model_field.is_relation or isinstance(field, serializers.RelatedField):
+                return None
+            elif (
+                isinstance(field, cls.identity_fields)
+                and type(field).to_representation in identity_methods
+                and not getattr(field, "coerce_to_string", False)
+            ):
+                converter = None
+            else:
+                converter = field.to_representation
+            columns.append((field.field_name, field.source, converter))
+        return cls(columns)
+
+    def __call__(self, row):
+        """
+        Returns the representation of a row returned by `values(*self.lookups)`.
+        """
+        ret = {}
+        for field_name, lookup, converter in self.columns:
+            value = row[lookup]
+            ret[field_name] = value if value is None or converter is None else converter(value)
+        return ret
 
 
 class SerializerWithSkipSignal(serializers.ModelSerializer):
@@ -18,6 +358,75 @@ class SerializerWithSkipSignal(serializers.ModelSerializer):
             serializer.
     """
 
+    serializer_related_field = PrefetchedPrimaryKeyRelatedField
+
+    def __init__(self, *args, fields=None, **kwargs):
+        # The names of the fields to include, for sparse fieldsets; all if None.
+        self.sparse_fields = fields
+        super().__init__(*args, **kwargs)
+
+    def get_fields(self):
+        """
+        Adds a write-only `<name>_openproject_id` field for every writable foreign
+        key to a model synchronized with OpenProject, as an alternative to the
+        primary key. If both are given, the OpenProject ID takes precedence.
+
+        Keeps only the fields named in `fields` if given, for sparse fieldsets.
+
+        Drops the uniqueness validators of all fields when used for an upsert,
+        as existing records are expected there and conflicts are resolved by the
+        database.
+        """
+        fields = super().get_fields()
+        self.alternative_related_fields = {}
+        for field_name, field in list(fields.items()):
+            if (
+                field.read_only
+                or type(field) is not PrefetchedPrimaryKeyRelatedField
+                or not hasattr(field.get_queryset().model, "openproject_id")
+            ):
+                continue
+            alternative_name = f"{field_name}_openproject_id"
+            fields[alternative_name] = OpenProjectIdRelatedField(
+                source=field.source or field_name,
+                queryset=field.get_queryset(),
+                required=False,
+                allow_null=field.allow_null,
+            )
+            if field.required:
+                field.required = False
+                self.alternative_related_fields[field_name] = alternative_name
+        if self.sparse_fields is not None:
+            fields = {name: field for name, field in fields.items() if name in self.sparse_fields}
+        if self.context.get("upsert"):
+            for field in fields.values():
+                field.validators = [
+                    validator
+                    for validator in field.validators
+                    if not isinstance(validator, (UniqueValidator, UniqueOpenProjectIdValidator))
+                ]
+        return fields
+
+    def get_extra_kwargs(self):
+        extra_kwargs = super().get_extra_kwargs()
+        openproject_id_kwargs = extra_kwargs.setdefault("openproject_id", {})
+        openproject_id_kwargs.setdefault("validators", [UniqueOpenProjectIdValidator()])
+        return extra_kwargs
+
+    def validate(self, attrs):
+        """
+        Requires one of a foreign key and its `<name>_openproject_id` alternative.
+        """
+        if not self.partial:
+            missing = {
+                field_name: [f"Either {field_name} or {alternative_name} is required."]
+                for field_name, alternative_name in self.alternative_related_fields.items()
+                if self.fields[field_name].source not in attrs
+            }
+            if missing:
+                raise serializers.ValidationError(missing, code="required")
+        return super().validate(attrs)
+
     def create(self, validated_data):
         """
         Creates and saves a new instance of the model using the provided validated data.
@@ -48,7 +457,9 @@ class SerializerWithSkipSignal(serializers.ModelSerializer):
 
         This method overrides the parent class's update method. Before updating the instance, it marks
         a specific flag to bypass any signal processing associated with the instance. The overridden
-        method from the superclass is then called to perform the actual update operation.
+        method from the superclass is then called to perform the actual update operation, unless the
+        content hash of the updated instance matches the stored one and the OpenProject ID (which is
+        not part of the hash) is unchanged.
 
         Parameters:
             instance: The object instance to be updated.
@@ -59,6 +470,17 @@ class SerializerWithSkipSignal(serializers.ModelSerializer):
             The updated instance.
         """
         instance.skip_signal = True
+        stored_hash = instance.content_hash
+        stored_openproject_id = instance.openproject_id
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        if (
+            stored_hash
+            and instance.get_content_hash() == stored_hash
+            and instance.openproject_id == stored_openproject_id
+        ):
+            # Nothing changed, so there is nothing to write.
+            return instance
         super().update(instance, validated_data)
         return instance
 
@@ -82,6 +504,7 @@ class ProjectSerializer(SerializerWithSkipSignal):
 
     class Meta:
         model = Project
+        list_serializer_class = BulkUpsertListSerializer
         fields = [
             "id",
             "openproject_id",
@@ -109,6 +532,7 @@ class WorkPackageSerializer(SerializerWithSkipSignal):
 
     class Meta:
         model = WorkPackage
+        list_serializer_class = BulkUpsertListSerializer
         fields = [
             "id",
             "openproject_id",
@@ -154,6 +578,7 @@ class TimeEntrySerializer(SerializerWithSkipSignal):
 
     class Meta:
         model = TimeEntry
+        list_serializer_class = BulkUpsertListSerializer
         fields = [
             "id",
             "openproject_id",
@@ -165,3 +590,32 @@ class TimeEntrySerializer(SerializerWithSkipSignal):
             "createdAt",
             "updatedAt",
         ]
+
+
+class SyncStateAdvanceSerializer(serializers.Serializer):
+    """
+    Validates the request body of `POST /sync_state/<resource>/advance/`.
+    """
+
+    started_at = serializers.DateTimeField()
+    full = serializers.BooleanField(default=False)
+
+
+class SyncStateSerializer(serializers.ModelSerializer):
+    """
+    Serializer class for the SyncState model.
+
+    Exposes the watermark of a resource together with whether the next pull
+    has to be a full reconcile.
+
+    Attributes:
+        model (type): Specifies the model to be serialized.
+        fields (list): Defines the fields included in the serialized output.
+    """
+
+    full_sync_due = serializers.BooleanField(read_only=True)
+
+    class Meta:
+        model = SyncState
+        fields = ["resource", "watermark", "last_full_sync_at", "full_sync_due"]
+        read_only_fields = ["resource", "watermark", "last_full_sync_at"]
@@ -1,11 +1,11 @@
 from functools import wraps
 
-import requests
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from django_app import settings
+from .identity import identity_map
 from .models import Project, WorkPackage, TimeEntry
+from .outbox import enqueue
 
 
 def skip_signal():
@@ -33,6 +33,29 @@ def skip_signal():
     return _skip_signal
 
 
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=WorkPackage)
+@receiver(post_save, sender=TimeEntry)
+def remember_openproject_id(sender, instance, **kwargs):
+    """
+    Keeps the identity map of the saved model in line with the saved instance.
+
+    Runs regardless of `skip_signal`, as the identity map must reflect writes
+    coming from the API as well as the ones coming from the admin.
+    """
+    identity_map(sender).set(instance.openproject_id, instance.pk)
+
+
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=WorkPackage)
+@receiver(post_delete, sender=TimeEntry)
+def forget_openproject_id(sender, instance, **kwargs):
+    """
+    Removes a deleted instance from the identity map of its model.
+    """
+    identity_map(sender).discard(openproject_id=instance.openproject_id, pk=instance.pk)
+
+
 @receiver(post_save, sender=Project)
 @skip_signal()
 def synchronize_project_to_openproject(sender, instance, created, **kwargs):
@@ -40,10 +63,10 @@ def synchronize_project_to_openproject(sender, instance, created, **kwargs):
     Signal to synchronize a Project instance with the OpenProject system on creation
     or update.
 
-    This function listens to the `post_save` signal for the `Project` model and sends
-    the model's data to the OpenProject API when a new instance is created or an existing
-    one is updated. The synchronization operation utilizes the API authorization details
-    and base URL defined in the application settings.
+    This function listens to the `post_save` signal for the `Project` model and
+    writes an outbox event holding the model's data, in the same transaction as
+    the save. The event is sent to the OpenProject API by the `drain_outbox`
+    management command, so saving never waits for OpenProject.
 
     Args:
         sender: The model class that sent the signal.
@@ -52,47 +75,21 @@ def synchronize_project_to_openproject(sender, instance, created, **kwargs):
         **kwargs: Additional keyword arguments passed by the signal.
 
     Returns:
-        The JSON response from the OpenProject API after a successful synchronization.
+        The written outbox event, or None if no synchronized field changed.
     """
-    authorization_hash = settings.OPENPROJECT_AUTHORIZATION_HASH
-    op_api_url = settings.OPENPROJECT_API_URL
-    try:
-        data = instance.to_openproject()
-        if created:
-            r = requests.post(
-                f"{op_api_url}/api/v3/projects/",
-                json=data,
-                headers={
-                    "Authorization": f"Basic {authorization_hash}",
-                    "Content-Type": "application/json",
-                },
-            )
-        else:
-            r = requests.patch(
-                f"{op_api_url}/api/v3/projects/{instance.openproject_id}/",
-                json=data,
-                headers={
-                    "Authorization": f"Basic {authorization_hash}",
-                    "Content-Type": "application/json",
-                },
-            )
-        response = r.json()
-        Project.objects.filter(id=instance.id).update(openproject_id=response["id"])
-        return response
-    except Exception:
-        pass
+    return enqueue(instance, created)
 
 
 @receiver(post_save, sender=WorkPackage)
 @skip_signal()
 def synchronize_work_package_to_openproject(sender, instance, created, **kwargs):
     """
-    Synchronizes a WorkPackage instance to the OpenProject system via API.
+    Synchronizes a WorkPackage instance to the OpenProject system via the outbox.
 
     This function is triggered as a Django signal receiver whenever a WorkPackage
-    model instance is saved. It either creates or updates a corresponding WorkPackage
-    in the OpenProject system, based on whether the instance is newly created or
-    an existing instance is being updated.
+    model instance is saved. It writes an outbox event, which either creates or
+    updates the corresponding WorkPackage in the OpenProject system once it is
+    delivered by the `drain_outbox` management command.
 
     Parameters:
     sender: type
@@ -105,40 +102,10 @@ def synchronize_work_package_to_openproject(sender, instance, created, **kwargs)
         Additional keyword arguments sent by the signal.
 
     Returns:
-    dict
-        The response data parsed as JSON from the OpenProject API.
+    OutboxEvent or None
+        The written outbox event, or None if no synchronized field changed.
     """
-    authorization_hash = settings.OPENPROJECT_AUTHORIZATION_HASH
-    op_api_url = settings.OPENPROJECT_API_URL
-    try:
-        data = instance.to_openproject()
-        if created:
-            r = requests.post(
-                f"{op_api_url}/api/v3/work_packages/",
-                json=data,
-                headers={
-                    "Authorization": f"Basic {authorization_hash}",
-                    "Content-Type": "application/json",
-                },
-            )
-        else:
-            r = requests.patch(
-                f"{op_api_url}/api/v3/work_packages/{instance.openproject_id}/",
-                json=data,
-                headers={
-                    "Authorization": f"Basic {authorization_hash}",
-                    "Content-Type": "application/json",
-                },
-            )
-        response = r.json()
-        WorkPackage.objects.filter(id=instance.id).update(
-            openproject_id=response["id"],
-            lockVersion=response["lockVersion"],
-            updatedAt=response["updatedAt"],
-        )
-        return response
-    except Exception:
-        pass
+    return enqueue(instance, created)
 
 
 @receiver(post_save, sender=TimeEntry)
@@ -148,9 +115,9 @@ def synchronize_time_entry_to_openproject(sender, instance, created, **kwargs):
     Synchronizes a TimeEntry to OpenProject upon creation or update.
 
     This function is a Django signal receiver that listens for the `post_save` signal
-    on the `TimeEntry` model. It sends the time entry data to the OpenProject API
-    either by creating a new time entry or updating an existing one. The function
-    uses settings-configured credentials and API URLs for authorization and communication.
+    on the `TimeEntry` model. It writes an outbox event in the same transaction as
+    the save; the event is delivered to the OpenProject API by the `drain_outbox`
+    management command, which records failed deliveries for retrying.
 
     Args:
         sender: The model class that sent the signal.
@@ -159,35 +126,7 @@ def synchronize_time_entry_to_openproject(sender, instance, created, **kwargs):
         **kwargs: Additional arguments passed by the signal.
 
     Returns:
-        dict: The response data from the OpenProject API.
-
-    Raises:
-        None: Explicitly suppressed, errors are silently ignored.
+        OutboxEvent or None: The written outbox event, or None if no synchronized
+            field changed.
     """
-    authorization_hash = settings.OPENPROJECT_AUTHORIZATION_HASH
-    op_api_url = settings.OPENPROJECT_API_URL
-    try:
-        data = instance.to_openproject()
-        if created:
-            r = requests.post(
-                f"{op_api_url}/api/v3/time_entries/",
-                json=data,
-                headers={
-                    "Authorization": f"Basic {authorization_hash}",
-                    "Content-Type": "application/json",
-                },
-            )
-        else:
-            r = requests.patch(
-                f"{op_api_url}/api/v3/time_entries/{instance.openproject_id}/",
-                json=data,
-                headers={
-                    "Authorization": f"Basic {authorization_hash}",
-                    "Content-Type": "application/json",
-                },
-            )
-        response = r.json()
-        TimeEntry.objects.filter(id=instance.id).update(openproject_id=response["id"])
-        return response
-    except Exception:
-        pass
+    return enqueue(instance, created)
@@ -0,0 +1,19 @@
+import pytest
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+
+from openproject_sync import models
+from openproject_sync.identity import identity_map
+
+
+@pytest.fixture(autouse=True)
+def clear_identity_maps():
+    for model in (models.Project, models.WorkPackage, models.TimeEntry):
+        identity_map(model).clear()
+
+
+@pytest.fixture
+def api_client(db):
+    client = APIClient()
+    client.force_authenticate(User.objects.create_user("sync"))
+    return client
@@ -0,0 +1,75 @@
+import pytest
+
+from openproject_sync import models
+
+
+@pytest.fixture
+def project(db):
+    return models.Project.objects.create(openproject_id=1, identifier="alpha", name="Alpha")
+
+
+@pytest.mark.django_db
+def test_bulk_upsert_creates_and_updates_projects(api_client, project):
+    response = api_client.post(
+        "/projects/bulk_upsert/",
+        [
+            {"openproject_id": 1, "identifier": "alpha", "name": "Alpha renamed"},
+            {"openproject_id": 2, "identifier": "beta", "name": "Beta"},
+        ],
+        format="json",
+    )
+
+    assert 200 == response.status_code
+    beta = models.Project.objects.get(openproject_id=2)
+    assert {"1": project.pk, "2": beta.pk} == response.json()
+    project.refresh_from_db()
+    assert "Alpha renamed" == project.name
+
+
+@pytest.mark.django_db
+def test_bulk_upsert_resolves_foreign_keys_with_one_query(
+    api_client, project, django_assert_max_num_queries
+):
+    records = [
+        {"openproject_id": i, "subject": f"Task {i}", "project": project.pk}
+        for i in range(1, 51)
+    ]
+
+    # Authentication, FK prefetch, savepoint, upsert, mapping and savepoint release.
+    with django_assert_max_num_queries(8):
+        response = api_client.post("/work_packages/bulk_upsert/", records, format="json")
+
+    assert 200 == response.status_code
+    assert 50 == models.WorkPackage.objects.filter(project=project).count()
+
+
+@pytest.mark.django_db
+def test_bulk_upsert_reports_unknown_foreign_keys(api_client, project):
+    response = api_client.post(
+        "/work_packages/bulk_upsert/",
+        [
+            {"openproject_id": 1, "subject": "Valid", "project": project.pk},
+            {"openproject_id": 2, "subject": "Invalid", "project": project.pk + 1},
+        ],
+        format="json",
+    )
+
+    assert 400 == response.status_code
+    assert 0 == models.WorkPackage.objects.count()
+
+
+@pytest.mark.django_db
+def test_bulk_upsert_rejects_oversized_batches(api_client, settings):
+    settings.OPENPROJECT_BULK_UPSERT_BATCH_SIZE = 1
+
+    response = api_client.post(
+        "/projects/bulk_upsert/",
+        [
+            {"openproject_id": 1, "identifier": "alpha", "name": "Alpha"},
+            {"openproject_id": 2, "identifier": "beta", "name": "Beta"},
+        ],
+        format="json",
+    )
+
+    assert 400 == response.status_code
+
@@ -0,0 +1,73 @@
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from openproject_sync import client as client_module
+from openproject_sync.client import OpenProjectClient, get_client
+
+
+@pytest.fixture
+def client():
+    return OpenProjectClient(
+        base_url="http://openproject/", authorization_hash="secret", timeout=(1, 2), max_retries=3
+    )
+
+
+def test_client_reuses_headers_and_pooled_adapter(client):
+    adapter = client.session.get_adapter("http://openproject/api/v3/projects")
+
+    assert "Basic secret" == client.session.headers["Authorization"]
+    assert adapter is client.session.get_adapter("http://openproject/api/v3/work_packages")
+    assert 3 == adapter.max_retries.total
+    assert 429 in adapter.max_retries.status_forcelist
+    assert "POST" not in adapter.max_retries.allowed_methods
+    assert adapter.max_retries.backoff_jitter > 0
+
+
+def test_client_sends_requests_with_timeout(client, monkeypatch):
+    response = MagicMock()
+    response.json.return_value = {"id": 1}
+    request = MagicMock(return_value=response)
+    monkeypatch.setattr(client.session, "request", request)
+
+    assert {"id": 1} == client.patch("/api/v3/projects/1/", json={"name": "Alpha"})
+    request.assert_called_once_with(
+        "PATCH", "http://openproject/api/v3/projects/1/", json={"name": "Alpha"}, timeout=(1, 2)
+    )
+
+
+def test_client_keeps_absolute_urls(client):
+    assert "http://other/api/v3/x" == client.url("http://other/api/v3/x")
+
+
+def test_client_raises_on_error_status(client, monkeypatch):
+    response = MagicMock()
+    response.raise_for_status.side_effect = requests.HTTPError("422")
+    monkeypatch.setattr(client.session, "request", MagicMock(return_value=response))
+
+    with pytest.raises(requests.HTTPError):
+        client.get("/api/v3/projects")
+
+
+def test_get_client_is_shared_per_process_and_replaced_after_fork(monkeypatch):
+    first = get_client()
+    assert first is get_client()
+
+    monkeypatch.setattr(client_module, "_client_pid", -1)
+
+    assert first is not get_client()
+
+
+def test_client_iterates_pages_of_collection(client, monkeypatch):
+    pages = [
+        {"total": 3, "pageSize": 2, "_embedded": {"elements": [{"id": 1}, {"id": 2}]}},
+        {"total": 3, "pageSize": 2, "_embedded": {"elements": [{"id": 3}]}},
+    ]
+    get = MagicMock(side_effect=pages)
+    monkeypatch.setattr(client, "get", get)
+
+    assert [[{"id": 1}, {"id": 2}], [{"id": 3}]] == list(
+        client.iter_pages("/api/v3/projects", params={"filters": "[]"}, page_size=2)
+    )
+    assert {"filters": "[]", "offset": 2, "pageSize": 2} == get.call_args.kwargs["params"]
@@ -0,0 +1,85 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from openproject_sync import models
+
+
+@pytest.fixture
+def project(db):
+    return models.Project.objects.create(
+        openproject_id=1, identifier="alpha", name="Alpha", description="First"
+    )
+
+
+def writes(queries):
+    return [q["sql"] for q in queries if q["sql"].startswith(("INSERT", "UPDATE"))]
+
+
+@pytest.mark.django_db
+def test_save_stores_content_hash(project):
+    project.name = "Renamed"
+    project.save(update_fields=["name"])
+    project.refresh_from_db()
+
+    assert project.get_content_hash() == project.content_hash
+
+
+@pytest.mark.django_db
+def test_bulk_upsert_skips_unchanged_records(api_client, project):
+    record = {"openproject_id": 1, "identifier": "alpha", "name": "Alpha", "description": "First"}
+
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.post("/projects/bulk_upsert/", [record], format="json")
+
+    assert 200 == response.status_code
+    assert {"1": project.pk} == response.json()
+    assert [] == writes(queries)
+
+
+@pytest.mark.django_db
+def test_bulk_upsert_keeps_fields_missing_from_records(api_client, project):
+    record = {"openproject_id": 1, "identifier": "alpha", "name": "Renamed"}
+
+    response = api_client.post("/projects/bulk_upsert/", [record], format="json")
+
+    assert 200 == response.status_code
+    project.refresh_from_db()
+    assert ("Renamed", "First") == (project.name, project.description)
+    assert project.get_content_hash() == project.content_hash
+
+
+@pytest.mark.django_db
+def test_bulk_upsert_keeps_fields_missing_from_some_records(api_client, project):
+    records = [
+        {"openproject_id": 1, "identifier": "alpha", "name": "Renamed"},
+        {"openproject_id": 2, "identifier": "beta", "name": "Beta", "description": "Second"},
+    ]
+
+    response = api_client.post("/projects/bulk_upsert/", records, format="json")
+
+    assert 200 == response.status_code
+    project.refresh_from_db()
+    assert ("Renamed", "First") == (project.name, project.description)
+    assert project.get_content_hash() == project.content_hash
+    assert "Second" == models.Project.objects.get(openproject_id=2).description
+
+
+@pytest.mark.django_db
+def test_update_writes_changed_openproject_id(api_client, project):
+    response = api_client.patch("/projects/1/", {"openproject_id": 99}, format="json")
+
+    assert 200 == response.status_code
+    project.refresh_from_db()
+    assert 99 == project.openproject_id
+
+
+@pytest.mark.django_db
+def test_update_skips_unchanged_records(api_client, project):
+    record = {"openproject_id": 1, "identifier": "alpha", "name": "Alpha", "description": "First"}
+
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.put("/projects/1/", record, format="json")
+
+    assert 200 == response.status_code
+    assert [] == writes(queries)
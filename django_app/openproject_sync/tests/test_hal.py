@@ -0,0 +1,139 @@
+import pytest
+
+from openproject_sync import hal, models
+
+
+def test_from_hal_maps_work_package():
+    document = {
+        "_type": "WorkPackage",
+        "id": 7,
+        "lockVersion": 3,
+        "subject": "Task",
+        "description": {"format": "markdown", "raw": "Do it", "html": "<p>Do it</p>"},
+        "derivedStartDate": "2024-05-01",
+        "startDate": "2024-05-02",
+        "dueDate": None,
+        "percentageDone": 50,
+        "unknownAttribute": "ignored",
+        "_links": {"project": {"href": "/api/v3/projects/3", "title": "Alpha"}},
+    }
+
+    assert {
+        "openproject_id": 7,
+        "lockVersion": 3,
+        "subject": "Task",
+        "description": "Do it",
+        "derivedStartDate": "2024-05-01",
+        "startDate": "2024-05-02",
+        "dueDate": None,
+        "percentageDone": 50,
+        "project_openproject_id": 3,
+    } == hal.from_hal(models.WorkPackage, document)
+
+
+def test_from_hal_rejects_other_types():
+    with pytest.raises(hal.HALError):
+        hal.from_hal(models.WorkPackage, {"_type": "Project", "id": 1})
+
+
+def test_linked_id_prefers_embedded_resource():
+    time_entry = {
+        "_embedded": {"entity": {"_type": "WorkPackage", "id": 7}},
+        "_links": {"entity": {"href": "/api/v3/work_packages/8"}},
+    }
+
+    assert 7 == hal.linked_id(time_entry, models.WorkPackage, ("entity", "workPackage"))
+
+
+def test_linked_id_reads_work_package_link():
+    time_entry = {"_links": {"workPackage": {"href": "/api/v3/work_packages/43"}}}
+
+    assert 43 == hal.linked_id(time_entry, models.WorkPackage, ("entity", "workPackage"))
+
+
+def test_linked_id_ignores_links_to_other_resources():
+    time_entry = {"_links": {"entity": {"href": "/api/v3/meetings/1"}}}
+
+    assert hal.linked_id(time_entry, models.WorkPackage, ("entity", "workPackage")) is None
+
+
+@pytest.mark.django_db
+def test_ingest_collection_page(api_client):
+    project = models.Project.objects.create(openproject_id=3, identifier="alpha", name="Alpha")
+    work_package = models.WorkPackage.objects.create(
+        openproject_id=7, subject="Task", project=project
+    )
+    page = {
+        "_type": "Collection",
+        "total": 2,
+        "count": 2,
+        "_embedded": {
+            "elements": [
+                {
+                    "_type": "TimeEntry",
+                    "id": i,
+                    "comment": {"raw": f"Entry {i}"},
+                    "spentOn": "2024-05-01",
+                    "hours": "PT1H",
+                    "_links": {"entity": {"href": "/api/v3/work_packages/7"}},
+                }
+                for i in (1, 2)
+            ]
+        },
+    }
+
+    response = api_client.post("/time_entries/ingest/", page, format="json")
+
+    assert 200 == response.status_code
+    assert {} == response.json()["skipped"]
+    assert {"Entry 1", "Entry 2"} == set(
+        models.TimeEntry.objects.filter(work_package=work_package).values_list("comment", flat=True)
+    )
+
+
+@pytest.mark.django_db
+def test_ingest_skips_documents_that_cannot_be_written(api_client):
+    project = models.Project.objects.create(openproject_id=3, identifier="alpha", name="Alpha")
+    work_package = models.WorkPackage.objects.create(
+        openproject_id=7, subject="Task", project=project
+    )
+    documents = [
+        {
+            "_type": "TimeEntry",
+            "id": i,
+            "hours": "PT1H",
+            "_links": {"entity": {"href": f"/api/v3/work_packages/{work_package_id}"}},
+        }
+        for i, work_package_id in ((1, 7), (2, 8))
+    ]
+
+    response = api_client.post("/time_entries/ingest/", documents, format="json")
+
+    assert 200 == response.status_code
+    entry = models.TimeEntry.objects.get()
+    assert {"1": entry.pk} == response.json()["written"]
+    assert ["2"] == list(response.json()["skipped"])
+
+
+@pytest.mark.django_db
+def test_ingest_rejects_documents_of_other_types(api_client):
+    response = api_client.post(
+        "/projects/ingest/", {"_type": "WorkPackage", "id": 1}, format="json"
+    )
+
+    assert 400 == response.status_code
+
+
+@pytest.mark.django_db
+def test_ingest_reads_plain_dates_of_datetime_fields(api_client):
+    models.Project.objects.create(openproject_id=3, identifier="alpha", name="Alpha")
+    document = {
+        "_type": "WorkPackage",
+        "id": 7,
+        "subject": "Task",
+        "derivedStartDate": "2024-05-01",
+        "_embedded": {"project": {"_type": "Project", "id": 3}},
+    }
+
+    assert 200 == api_client.post("/work_packages/ingest/", document, format="json").status_code
+    assert "2024-05-01T00:00:00Z" == api_client.get("/work_packages/7/").json()["derivedStartDate"]
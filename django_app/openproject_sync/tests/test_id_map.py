@@ -0,0 +1,64 @@
+import pytest
+
+from openproject_sync import models
+from openproject_sync.identity import identity_map
+
+
+@pytest.fixture
+def projects(db):
+    return {
+        i: models.Project.objects.create(openproject_id=i, identifier=f"p{i}", name=f"P{i}").pk
+        for i in (1, 2, 3)
+    }
+
+
+@pytest.mark.django_db
+def test_id_map_returns_all_records(api_client, projects):
+    assert {str(k): v for k, v in projects.items()} == api_client.get("/projects/id_map/").json()
+
+
+@pytest.mark.django_db
+def test_id_map_resolves_requested_ids(api_client, projects):
+    response = api_client.get("/projects/id_map/?openproject_id=1,3,99")
+
+    assert {"1": projects[1], "3": projects[3]} == response.json()
+
+
+@pytest.mark.django_db
+def test_id_map_accepts_posted_ids(api_client, projects):
+    response = api_client.post("/projects/id_map/", {"openproject_id": [2]}, format="json")
+
+    assert {"2": projects[2]} == response.json()
+
+
+@pytest.mark.django_db
+def test_id_map_rejects_invalid_ids(api_client, projects):
+    assert 400 == api_client.get("/projects/id_map/?openproject_id=a").status_code
+
+
+@pytest.mark.django_db
+def test_id_map_accepts_posted_list(api_client, projects):
+    response = api_client.post("/projects/id_map/", [1, 2], format="json")
+
+    assert {"1": projects[1], "2": projects[2]} == response.json()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("body", [{"openproject_id": "1"}, {"openproject_id": ["a"]}, "1"])
+def test_id_map_rejects_invalid_posted_ids(api_client, projects, body):
+    assert 400 == api_client.post("/projects/id_map/", body, format="json").status_code
+
+
+@pytest.mark.django_db
+def test_id_map_does_not_serve_stale_cache_entries(api_client, projects):
+    ids = identity_map(models.Project)
+    ids.set_many({1: projects[1], 2: projects[2]})
+    # Another process deleted one project and re-created the other.
+    models.Project.objects.filter(openproject_id=1).delete()
+    models.Project.objects.filter(openproject_id=2).update(openproject_id=20)
+    recreated = models.Project.objects.create(openproject_id=2, identifier="new", name="New").pk
+
+    response = api_client.post("/projects/id_map/", {"openproject_id": [1, 2]}, format="json")
+
+    assert {"2": recreated} == response.json()
+    assert 1 not in ids
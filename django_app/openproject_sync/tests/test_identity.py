@@ -0,0 +1,85 @@
+import pytest
+from django.db import IntegrityError
+
+from openproject_sync import models
+from openproject_sync.identity import IdentityMap, identity_map
+
+
+@pytest.mark.django_db
+def test_openproject_id_is_unique():
+    models.Project.objects.create(openproject_id=1, identifier="one", name="One")
+
+    with pytest.raises(IntegrityError):
+        models.Project.objects.create(openproject_id=1, identifier="two", name="Two")
+
+
+@pytest.mark.django_db
+def test_identity_map_is_filled_on_save_and_cleared_on_delete():
+    project = models.Project.objects.create(openproject_id=7, identifier="seven", name="Seven")
+
+    assert 7 in identity_map(models.Project)
+
+    project.delete()
+
+    assert 7 not in identity_map(models.Project)
+
+
+@pytest.mark.django_db
+def test_identity_map_resolves_cached_ids_without_queries(django_assert_num_queries):
+    project = models.Project.objects.create(openproject_id=8, identifier="eight", name="Eight")
+
+    with django_assert_num_queries(0):
+        assert project.pk == identity_map(models.Project).get(8)
+
+
+@pytest.mark.django_db
+def test_identity_map_fetches_missing_ids_in_one_query(django_assert_num_queries):
+    first = models.Project.objects.create(openproject_id=1, identifier="one", name="One")
+    second = models.Project.objects.create(openproject_id=2, identifier="two", name="Two")
+    identity_map(models.Project).clear()
+
+    with django_assert_num_queries(1):
+        assert {1: first.pk, 2: second.pk} == identity_map(models.Project).get_many([1, 2, 3])
+
+
+def test_identity_map_evicts_least_recently_used_entries():
+    ids = IdentityMap(models.Project, maxsize=2)
+    ids.set(1, 10)
+    ids.set(2, 20)
+    ids.get(1)
+    ids.set(3, 30)
+
+    assert 1 in ids
+    assert 2 not in ids
+    assert 3 in ids
+
+
+def test_identity_map_replaces_stale_entries_of_the_same_pk():
+    ids = IdentityMap(models.Project, maxsize=10)
+    ids.set(1, 10)
+    ids.set(2, 10)
+
+    assert 1 not in ids
+    assert 1 == len(ids)
+
+
+@pytest.mark.django_db
+def test_detail_lookup_recovers_from_stale_identity_map(api_client):
+    project = models.Project.objects.create(openproject_id=5, identifier="five", name="Five")
+    models.Project.objects.filter(pk=project.pk).update(openproject_id=6)
+
+    assert 404 == api_client.get("/projects/5/").status_code
+    assert 5 not in identity_map(models.Project)
+    assert "five" == api_client.get("/projects/6/").json()["identifier"]
+
+
+@pytest.mark.django_db
+def test_create_rejects_duplicate_openproject_id(api_client):
+    models.Project.objects.create(openproject_id=9, identifier="nine", name="Nine")
+
+    response = api_client.post(
+        "/projects/", {"openproject_id": 9, "identifier": "other", "name": "Other"}, format="json"
+    )
+
+    assert 400 == response.status_code
+    assert "openproject_id" in response.json()
@@ -0,0 +1,53 @@
+import datetime
+
+import pytest
+from django.utils import timezone
+
+from openproject_sync import models
+
+
+@pytest.fixture
+def work_package(db):
+    project = models.Project.objects.create(openproject_id=1, identifier="alpha", name="Alpha")
+    return models.WorkPackage.objects.create(
+        openproject_id=10,
+        project=project,
+        subject="Task",
+        lockVersion=3,
+        updatedAt=datetime.datetime(2026, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+    )
+
+
+@pytest.mark.django_db
+def test_manifest_returns_columns(api_client, work_package):
+    manifest = api_client.get("/work_packages/manifest/").json()
+
+    assert {
+        "count": 1,
+        "openproject_id": [10],
+        "lockVersion": [3],
+        "updatedAt": ["2026-01-02T03:04:05Z"],
+        "hash": [work_package.get_content_hash()],
+    } == manifest
+
+
+@pytest.mark.django_db
+def test_manifest_omits_columns_missing_on_the_model(api_client, work_package):
+    manifest = api_client.get("/projects/manifest/").json()
+
+    assert {"count", "openproject_id", "hash"} == set(manifest)
+
+
+@pytest.mark.django_db
+def test_manifest_hash_changes_with_synchronized_fields(api_client, work_package):
+    before = api_client.get("/work_packages/manifest/").json()["hash"]
+    models.WorkPackage.objects.filter(pk=work_package.pk).update(subject="Renamed")
+
+    assert before != api_client.get("/work_packages/manifest/").json()["hash"]
+
+
+def test_content_hash_normalizes_timezones():
+    utc = datetime.datetime(2026, 1, 1, 12, tzinfo=datetime.timezone.utc)
+    local = utc.astimezone(timezone.get_fixed_timezone(120))
+
+    assert models.content_hash([utc]) == models.content_hash([local])
@@ -0,0 +1,33 @@
+import pytest
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+
+INITIAL = [("openproject_sync", "0001_initial")]
+UNIQUE = [("openproject_sync", "0002_openproject_id_unique")]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_unique_openproject_id_migration_reports_duplicates():
+    executor = MigrationExecutor(connection)
+    latest = executor.loader.graph.leaf_nodes("openproject_sync")
+    Project = executor.loader.project_state(INITIAL[0]).apps.get_model(
+        "openproject_sync", "Project"
+    )
+    executor.migrate(INITIAL)
+    try:
+        for name in ("Alpha", "Alpha again", "Beta"):
+            Project.objects.create(
+                openproject_id=2 if name == "Beta" else 1, identifier=name, name=name
+            )
+
+        executor = MigrationExecutor(connection)
+        with pytest.raises(RuntimeError, match="Project: 1$"):
+            executor.migrate(UNIQUE)
+
+        Project.objects.filter(name="Alpha again").delete()
+        MigrationExecutor(connection).migrate(UNIQUE)
+    finally:
+        Project.objects.all().delete()
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(latest)
@@ -0,0 +1,63 @@
+import pytest
+
+from openproject_sync import models
+
+
+@pytest.fixture
+def project(db):
+    return models.Project.objects.create(openproject_id=10, identifier="alpha", name="Alpha")
+
+
+@pytest.mark.django_db
+def test_create_work_package_with_project_openproject_id(api_client, project):
+    response = api_client.post(
+        "/work_packages/",
+        {"openproject_id": 1, "subject": "Task", "project_openproject_id": 10},
+        format="json",
+    )
+
+    assert 201 == response.status_code
+    assert project.pk == response.json()["project"]
+    assert "project_openproject_id" not in response.json()
+
+
+@pytest.mark.django_db
+def test_create_work_package_requires_a_project(api_client, project):
+    response = api_client.post(
+        "/work_packages/", {"openproject_id": 1, "subject": "Task"}, format="json"
+    )
+
+    assert 400 == response.status_code
+    assert "project" in response.json()
+
+
+@pytest.mark.django_db
+def test_create_work_package_with_unknown_project_openproject_id(api_client, project):
+    response = api_client.post(
+        "/work_packages/",
+        {"openproject_id": 1, "subject": "Task", "project_openproject_id": 11},
+        format="json",
+    )
+
+    assert 400 == response.status_code
+    assert "project_openproject_id" in response.json()
+
+
+@pytest.mark.django_db
+def test_bulk_upsert_resolves_openproject_ids_with_one_query(
+    api_client, project, django_assert_max_num_queries
+):
+    work_package = models.WorkPackage.objects.create(
+        openproject_id=1, subject="Task", project=project
+    )
+    records = [
+        {"openproject_id": i, "work_package_openproject_id": 1, "hours": "PT1H"}
+        for i in range(1, 51)
+    ]
+
+    # Authentication, FK prefetch, savepoint, upsert, mapping and savepoint release.
+    with django_assert_max_num_queries(8):
+        response = api_client.post("/time_entries/bulk_upsert/", records, format="json")
+
+    assert 200 == response.status_code
+    assert 50 == models.TimeEntry.objects.filter(work_package=work_package).count()
@@ -0,0 +1,180 @@
+import datetime
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from django.db import transaction
+from django.utils import timezone
+
+from openproject_sync import models
+from openproject_sync.outbox import drain
+
+
+@pytest.fixture
+def project(db):
+    return models.Project.objects.create(openproject_id=1, identifier="alpha", name="Alpha")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = MagicMock()
+    monkeypatch.setattr("openproject_sync.outbox.get_client", lambda: client)
+    return client
+
+
+@pytest.mark.django_db
+def test_save_writes_outbox_event_without_calling_openproject(project, client):
+    project.name = "Renamed"
+
+    project.save()
+
+    event = models.OutboxEvent.objects.latest("id")
+    assert ("openproject_sync.project", project.pk, "updated") == (
+        event.model_label,
+        event.object_id,
+        event.action,
+    )
+    assert "Renamed" == event.payload["name"]
+    assert not client.method_calls
+
+
+@pytest.mark.django_db
+def test_outbox_event_is_rolled_back_with_the_save(project):
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            project.save()
+            raise RuntimeError
+
+    assert 1 == models.OutboxEvent.objects.count()
+
+
+@pytest.mark.django_db
+def test_skip_signal_does_not_write_outbox_event(project):
+    project.skip_signal = True
+    project.save()
+
+    assert 1 == models.OutboxEvent.objects.count()
+
+
+@pytest.mark.django_db
+def test_drain_pushes_events_and_applies_response(client):
+    project = models.Project.objects.create(openproject_id=1, identifier="alpha", name="Alpha")
+    work_package = models.WorkPackage.objects.create(openproject_id=2, project=project, subject="Task")
+    client.post.side_effect = [{"id": 10}, {"id": 20, "lockVersion": 1}]
+
+    assert (2, 0) == drain()
+
+    work_package.refresh_from_db()
+    assert (20, 1) == (work_package.openproject_id, work_package.lockVersion)
+    assert 10 == models.Project.objects.get().openproject_id
+    assert not models.OutboxEvent.objects.filter(processed_at__isnull=True).exists()
+
+
+@pytest.mark.django_db
+def test_drain_records_failures_for_retry(project, client):
+    client.post.side_effect = requests.ConnectionError("unavailable")
+
+    assert (0, 1) == drain()
+
+    event = models.OutboxEvent.objects.get()
+    assert (1, "unavailable", None) == (event.attempts, event.last_error, event.processed_at)
+
+
+@pytest.mark.django_db
+def test_drain_skips_events_after_max_attempts(project, client):
+    models.OutboxEvent.objects.update(attempts=3)
+
+    assert (0, 0) == drain(max_attempts=3)
+
+
+@pytest.mark.django_db
+def test_drain_skips_events_claimed_by_another_drainer(project, client):
+    models.OutboxEvent.objects.update(claimed_at=timezone.now())
+
+    assert (0, 0) == drain()
+
+    models.OutboxEvent.objects.update(claimed_at=timezone.now() - datetime.timedelta(hours=1))
+    client.post.return_value = {"id": 10}
+
+    assert (1, 0) == drain()
+    assert None is models.OutboxEvent.objects.get().claimed_at
+
+
+@pytest.mark.django_db
+def test_drain_waits_for_earlier_events_claimed_by_another_drainer(project, client):
+    project.name = "Renamed"
+    project.save()
+    first = models.OutboxEvent.objects.earliest("id")
+    models.OutboxEvent.objects.filter(pk=first.pk).update(claimed_at=timezone.now())
+
+    assert (0, 0) == drain()
+
+    assert not client.method_calls
+    assert None is models.OutboxEvent.objects.latest("id").claimed_at
+
+
+@pytest.mark.django_db
+def test_drain_records_delivery_when_applying_the_response_fails(client):
+    models.Project.objects.create(openproject_id=1, identifier="alpha", name="Alpha")
+    models.Project.objects.create(openproject_id=2, identifier="beta", name="Beta")
+    # OpenProject returns the ID of a project that already exists locally.
+    ids = {"alpha": 2, "beta": 30}
+    client.post.side_effect = lambda url, json: {"id": ids[json["identifier"]]}
+
+    assert (2, 0) == drain()
+
+    first, second = models.OutboxEvent.objects.order_by("id")
+    assert first.processed_at is not None
+    assert first.last_error.startswith("Applying the response failed")
+    assert 1 == models.Project.objects.get(identifier="alpha").openproject_id
+    assert (None, 30) == (second.last_error, models.Project.objects.get(identifier="beta").openproject_id)
+
+
+@pytest.mark.django_db
+def test_saving_without_changes_writes_no_outbox_event(project):
+    project = models.Project.objects.get(pk=project.pk)
+
+    project.save()
+
+    assert 1 == models.OutboxEvent.objects.count()
+
+
+@pytest.mark.django_db
+def test_update_event_only_carries_changed_fields(project):
+    work_package = models.WorkPackage.objects.create(
+        openproject_id=2, project=project, subject="Task", lockVersion=4
+    )
+    work_package = models.WorkPackage.objects.get(pk=work_package.pk)
+    work_package.subject = "Renamed"
+
+    work_package.save()
+
+    assert {"id": 2, "lockVersion": 4, "subject": "Renamed"} == (
+        models.OutboxEvent.objects.latest("id").payload
+    )
+
+
+@pytest.mark.django_db
+def test_unsynchronized_changes_write_no_outbox_event(project):
+    work_package = models.WorkPackage.objects.create(openproject_id=2, project=project, subject="Task")
+    work_package.derivedPercentageDone = 50
+
+    work_package.save()
+
+    assert 2 == models.OutboxEvent.objects.count()
+
+
+@pytest.mark.django_db
+def test_drain_passes_new_lock_version_to_later_events(project, client):
+    work_package = models.WorkPackage.objects.create(
+        openproject_id=2, project=project, subject="Task", lockVersion=1
+    )
+    models.OutboxEvent.objects.all().delete()
+    for subject in ("First", "Second"):
+        work_package.subject = subject
+        work_package.save()
+    client.patch.side_effect = [{"id": 2, "lockVersion": 2}, {"id": 2, "lockVersion": 3}]
+
+    assert (2, 0) == drain()
+
+    assert 2 == client.patch.call_args_list[1].kwargs["json"]["lockVersion"]
@@ -0,0 +1,44 @@
+import pytest
+
+from openproject_sync import models
+from openproject_sync.pagination import OpenProjectCursorPagination
+
+
+@pytest.fixture
+def projects(db):
+    return [
+        models.Project.objects.create(openproject_id=i, identifier=f"p{i}", name=f"Project {i}")
+        for i in range(1, 6)
+    ]
+
+
+@pytest.mark.django_db
+def test_list_is_cursor_paginated_by_primary_key(api_client, projects):
+    seen = []
+    url = "/projects/?page_size=2"
+    while url:
+        page = api_client.get(url).json()
+        assert len(page["results"]) <= 2
+        seen.extend(p["openproject_id"] for p in page["results"])
+        url = page["next"]
+
+    assert [p.openproject_id for p in projects] == seen
+
+
+@pytest.mark.django_db
+def test_cursor_is_stable_when_rows_are_inserted(api_client, projects):
+    first = api_client.get("/projects/?page_size=2").json()
+    models.Project.objects.create(openproject_id=99, identifier="new", name="AAA first by name")
+
+    second = api_client.get(first["next"]).json()
+
+    assert [3, 4] == [p["openproject_id"] for p in second["results"]]
+
+
+@pytest.mark.django_db
+def test_page_size_is_capped(api_client, projects, monkeypatch):
+    monkeypatch.setattr(OpenProjectCursorPagination, "max_page_size", 3)
+
+    page = api_client.get("/projects/?page_size=100").json()
+
+    assert 3 == len(page["results"])
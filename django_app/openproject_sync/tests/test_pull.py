@@ -0,0 +1,148 @@
+import datetime
+import json
+from concurrent.futures import Future
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from openproject_sync import models, pull
+
+PROJECTS = [
+    {
+        "_type": "Project",
+        "id": project_id,
+        "identifier": f"p{project_id}",
+        "name": f"P{project_id}",
+        "_links": {"workPackages": {"href": f"/api/v3/projects/{project_id}/work_packages"}},
+    }
+    for project_id in (1, 2)
+]
+
+
+def work_package(openproject_id, project_id):
+    return {
+        "_type": "WorkPackage",
+        "id": openproject_id,
+        "subject": f"Task {openproject_id}",
+        "_links": {"project": {"href": f"/api/v3/projects/{project_id}"}},
+    }
+
+
+def time_entry(openproject_id, href):
+    return {
+        "_type": "TimeEntry",
+        "id": openproject_id,
+        "hours": "PT1H",
+        "_links": {"entity": {"href": href}},
+    }
+
+
+class FakeClient:
+    def __init__(self):
+        self.paths = []
+
+    def iter_pages(self, path, params=None):
+        self.paths.append(path)
+        if path == "/api/v3/projects":
+            yield PROJECTS
+        elif path.endswith("/work_packages"):
+            project_id = int(path.split("/")[-2])
+            yield [work_package(project_id * 10, project_id)]
+        else:
+            project_id = int(json.loads(params["filters"])[0]["project"]["values"][0])
+            yield [
+                time_entry(project_id * 100, f"/api/v3/work_packages/{project_id * 10}"),
+                # Time entries logged on other resources cannot be stored.
+                time_entry(project_id * 100 + 1, "/api/v3/meetings/1"),
+            ]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(pull, "get_client", lambda: client)
+    return client
+
+
+@pytest.mark.django_db
+def test_pull_writes_all_resources(client):
+    stats = pull.pull()
+
+    assert 2 == stats["projects"]["records"]
+    assert 2 == stats["work_packages"]["records"]
+    assert {"records": 2, "skipped": 2} == {
+        key: stats["time_entries"][key] for key in ("records", "skipped")
+    }
+    work_package = models.WorkPackage.objects.get(openproject_id=20)
+    assert 2 == work_package.project.openproject_id
+    assert work_package == models.TimeEntry.objects.get(openproject_id=200).work_package
+    assert {} == models.SyncState.objects.get(resource="time_entries").checkpoint
+
+
+@pytest.mark.django_db
+def test_pull_resumes_after_done_projects(client):
+    pull.pull()
+    models.SyncState.objects.filter(resource="work_packages").update(checkpoint={"done": [1]})
+    client.paths.clear()
+
+    pull.pull(resume=True)
+
+    assert "/api/v3/projects/1/work_packages" not in client.paths
+    assert "/api/v3/projects/2/work_packages" in client.paths
+
+
+@pytest.mark.django_db
+def test_pull_advances_watermark_to_start_of_first_run(client):
+    started_at = datetime.datetime(2026, 3, 1, 12, tzinfo=datetime.timezone.utc)
+    models.SyncState.objects.create(
+        resource="work_packages", checkpoint={"started_at": started_at.isoformat(), "done": [1]}
+    )
+    before = timezone.now()
+
+    pull.pull(resume=True)
+
+    assert started_at == models.SyncState.objects.get(resource="work_packages").watermark
+    assert before <= models.SyncState.objects.get(resource="time_entries").watermark
+
+
+@pytest.mark.django_db
+def test_sync_openproject_reports_records_per_second(client):
+    out = StringIO()
+
+    call_command("sync_openproject", stdout=out)
+
+    assert "work_packages: 2 records, 0 skipped in" in out.getvalue()
+    assert "records/s" in out.getvalue()
+
+
+class InlineExecutor:
+    """
+    Runs submitted calls immediately, standing in for the process pool.
+    """
+
+    def __init__(self, max_workers, initializer):
+        self.max_workers = max_workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+@pytest.mark.django_db
+def test_pull_merges_statistics_of_parallel_shards(client, monkeypatch):
+    monkeypatch.setattr(pull, "ProcessPoolExecutor", InlineExecutor)
+
+    stats = pull.pull(workers=4)
+
+    assert 2 == stats["work_packages"]["records"]
+    assert 2 == stats["time_entries"]["skipped"]
+    assert 2 == models.TimeEntry.objects.count()
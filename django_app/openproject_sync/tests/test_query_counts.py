@@ -0,0 +1,133 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from openproject_sync import models
+
+
+def create_records(count, offset=0):
+    """
+    Creates `count` projects, each with one work package with one time entry.
+    """
+    for i in range(offset, offset + count):
+        project = models.Project.objects.create(
+            openproject_id=i, identifier=f"p{i}", name=f"Project {i}"
+        )
+        work_package = models.WorkPackage.objects.create(
+            openproject_id=100 + i, project=project, subject=f"Task {i}"
+        )
+        models.TimeEntry.objects.create(openproject_id=200 + i, work_package=work_package)
+
+
+def count_queries(func):
+    # The first request e.g. fills the content type cache, so it is not counted.
+    func()
+    with CaptureQueriesContext(connection) as queries:
+        func()
+    return len(queries.captured_queries)
+
+
+@pytest.fixture
+def admin_client(client, django_user_model):
+    client.force_login(django_user_model.objects.create_superuser("admin"))
+    return client
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/admin/openproject_sync/workpackage/",
+        "/admin/openproject_sync/timeentry/",
+        "/work_packages/",
+        "/time_entries/",
+        "/time_entries/?format=ndjson",
+    ],
+)
+def test_list_query_count_does_not_grow_with_rows(admin_client, path):
+    create_records(1)
+
+    def get():
+        response = admin_client.get(path)
+        assert 200 == response.status_code
+        if response.streaming:
+            b"".join(response.streaming_content)
+
+    few = count_queries(get)
+    create_records(5, offset=1)
+
+    assert few == count_queries(get)
+
+
+@pytest.mark.django_db
+def test_time_entry_change_form_query_count_does_not_grow_with_rows(admin_client):
+    create_records(1)
+    time_entry = models.TimeEntry.objects.get()
+    path = f"/admin/openproject_sync/timeentry/{time_entry.pk}/change/"
+
+    few = count_queries(lambda: admin_client.get(path))
+    create_records(5, offset=1)
+
+    assert few == count_queries(lambda: admin_client.get(path))
+
+
+@pytest.mark.django_db
+def test_to_openproject_needs_no_query():
+    create_records(1)
+    work_package = models.WorkPackage.objects.get()
+    time_entry = models.TimeEntry.objects.get()
+
+    with CaptureQueriesContext(connection) as queries:
+        assert {"id": 0} == work_package.to_openproject()["_embedded"]["project"]
+        assert {"id": 100} == time_entry.to_openproject()["_embedded"]["workPackage"]
+
+    assert [] == queries.captured_queries
+
+
+@pytest.mark.django_db
+def test_saving_does_not_fetch_parents(django_assert_num_queries):
+    create_records(1)
+    time_entry = models.TimeEntry.objects.get()
+    time_entry.hours = "PT3H"
+
+    # Savepoint, update, outbox event and savepoint release.
+    with django_assert_num_queries(4):
+        time_entry.save()
+
+    assert "PT3H" == models.OutboxEvent.objects.order_by("pk").last().payload["hours"]
+
+
+@pytest.mark.django_db
+def test_moving_to_another_parent_updates_the_copy():
+    create_records(2)
+    time_entry = models.TimeEntry.objects.get(openproject_id=200)
+    time_entry.work_package_id = models.WorkPackage.objects.get(openproject_id=101).pk
+    time_entry.save()
+
+    assert 101 == models.TimeEntry.objects.get(pk=time_entry.pk).work_package_openproject_id
+    event = models.OutboxEvent.objects.order_by("pk").last()
+    assert {"id": 101} == event.payload["_embedded"]["workPackage"]
+
+
+@pytest.mark.django_db
+def test_changed_parent_openproject_id_is_copied():
+    create_records(1)
+    project = models.Project.objects.get()
+    project.openproject_id = 42
+    project.save()
+
+    assert 42 == models.WorkPackage.objects.get().project_openproject_id
+
+
+@pytest.mark.django_db
+def test_bulk_upsert_copies_parent_openproject_ids(api_client):
+    create_records(1)
+
+    response = api_client.post(
+        "/time_entries/bulk_upsert/",
+        [{"openproject_id": 201, "work_package_openproject_id": 100}],
+        format="json",
+    )
+
+    assert 200 == response.status_code
+    assert 100 == models.TimeEntry.objects.get(openproject_id=201).work_package_openproject_id
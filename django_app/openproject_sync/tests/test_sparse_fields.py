@@ -0,0 +1,69 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from openproject_sync import models
+
+
+@pytest.fixture
+def work_packages(db):
+    project = models.Project.objects.create(
+        openproject_id=1, identifier="alpha", name="Alpha", description="Long text"
+    )
+    return [
+        models.WorkPackage.objects.create(
+            openproject_id=10 + i, project=project, subject=f"Task {i}", description="Long text"
+        )
+        for i in range(3)
+    ]
+
+
+def selected_sql(queries):
+    return " ".join(query["sql"] for query in queries if query["sql"].startswith("SELECT"))
+
+
+@pytest.mark.django_db
+def test_fields_restricts_list_and_query(api_client, work_packages):
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get("/work_packages/?fields=openproject_id,subject")
+
+    assert [{"openproject_id": 10 + i, "subject": f"Task {i}"} for i in range(3)] == response.json()[
+        "results"
+    ]
+    assert '"description"' not in selected_sql(queries.captured_queries)
+
+
+@pytest.mark.django_db
+def test_exclude_defers_text_columns(api_client, work_packages):
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get("/projects/?exclude=description")
+
+    [project] = response.json()["results"]
+    assert "description" not in project
+    assert "name" in project
+    assert '"description"' not in selected_sql(queries.captured_queries)
+
+
+@pytest.mark.django_db
+def test_sparse_fields_apply_to_detail_and_stream(api_client, work_packages):
+    detail = api_client.get("/work_packages/10/?fields=subject").json()
+    stream = api_client.get("/work_packages/?format=ndjson&exclude=description")
+
+    assert {"subject": "Task 0"} == detail
+    assert all(b"description" not in line for line in b"".join(stream.streaming_content).splitlines())
+
+
+@pytest.mark.django_db
+def test_sparse_fields_keep_pagination(api_client, work_packages):
+    first = api_client.get("/work_packages/?fields=subject&page_size=2").json()
+    second = api_client.get(first["next"]).json()
+
+    assert ["Task 0", "Task 1", "Task 2"] == [r["subject"] for r in first["results"] + second["results"]]
+
+
+@pytest.mark.django_db
+def test_unknown_fields_are_rejected(api_client, work_packages):
+    response = api_client.get("/work_packages/?fields=subject,nope&exclude=other")
+
+    assert 400 == response.status_code
+    assert {"fields", "exclude"} == set(response.json())
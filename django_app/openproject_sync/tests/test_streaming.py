@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from openproject_sync import models
+
+
+@pytest.fixture
+def work_packages(db):
+    project = models.Project.objects.create(openproject_id=1, identifier="alpha", name="Alpha")
+    return [
+        models.WorkPackage.objects.create(openproject_id=10 + i, project=project, subject=f"Task {i}")
+        for i in range(3)
+    ]
+
+
+@pytest.mark.django_db
+def test_ndjson_streams_every_record(api_client, work_packages, settings):
+    settings.OPENPROJECT_STREAM_CHUNK_SIZE = 2
+    paginated = api_client.get("/work_packages/").json()["results"]
+
+    response = api_client.get("/work_packages/?format=ndjson")
+
+    assert response.streaming
+    assert "application/x-ndjson" == response["Content-Type"]
+    lines = b"".join(response.streaming_content).decode().splitlines()
+    assert paginated == [json.loads(line) for line in lines]
+
+
+@pytest.mark.django_db
+def test_ndjson_is_not_paginated(api_client, work_packages):
+    response = api_client.get("/work_packages/?format=ndjson&page_size=1")
+
+    assert 3 == len(b"".join(response.streaming_content).splitlines())
+
+
+@pytest.mark.django_db
+def test_ndjson_renders_errors_as_a_line(api_client):
+    response = api_client.get("/work_packages/999/?format=ndjson")
+
+    assert 404 == response.status_code
+    assert "detail" in json.loads(response.content)
@@ -0,0 +1,77 @@
+import datetime
+
+import pytest
+from django.utils import timezone
+
+from openproject_sync import models
+
+UPDATED_AT = datetime.datetime(2026, 3, 1, 12, tzinfo=datetime.timezone.utc)
+
+
+@pytest.fixture
+def time_entry(db):
+    project = models.Project.objects.create(openproject_id=1, identifier="alpha", name="Alpha")
+    work_package = models.WorkPackage.objects.create(openproject_id=1, project=project, subject="Task")
+    return models.TimeEntry.objects.create(
+        openproject_id=1, work_package=work_package, updatedAt=UPDATED_AT
+    )
+
+
+@pytest.mark.django_db
+def test_new_state_requires_full_sync(api_client):
+    state = api_client.get("/sync_state/time_entries/").json()
+
+    assert {
+        "resource": "time_entries",
+        "watermark": None,
+        "last_full_sync_at": None,
+        "full_sync_due": True,
+    } == state
+
+
+@pytest.mark.django_db
+def test_unknown_resource_is_not_found(api_client):
+    assert 404 == api_client.get("/sync_state/unknown/").status_code
+
+
+@pytest.mark.django_db
+def test_advance_moves_watermark_to_start_of_pull(api_client, time_entry):
+    state = api_client.post(
+        "/sync_state/time_entries/advance/",
+        {"started_at": "2026-02-01T12:00:00Z", "full": True},
+        format="json",
+    ).json()
+
+    # Not to the later updatedAt stored, e.g. written back by the outbox.
+    assert "2026-02-01T12:00:00Z" == state["watermark"]
+    assert state["last_full_sync_at"] is not None
+    assert False is state["full_sync_due"]
+
+
+@pytest.mark.django_db
+def test_advance_requires_start_of_pull(api_client):
+    response = api_client.post("/sync_state/time_entries/advance/", {"full": True}, format="json")
+
+    assert 400 == response.status_code
+    assert "started_at" in response.json()
+
+
+@pytest.mark.django_db
+def test_full_sync_is_due_after_interval(time_entry, settings):
+    settings.OPENPROJECT_FULL_SYNC_INTERVAL = datetime.timedelta(hours=1)
+    state = models.SyncState.objects.create(resource="time_entries")
+    state.advance(UPDATED_AT, full=True)
+
+    state.last_full_sync_at = timezone.now() - datetime.timedelta(hours=2)
+
+    assert state.full_sync_due
+
+
+@pytest.mark.django_db
+def test_watermark_never_moves_backwards(time_entry):
+    later = UPDATED_AT + datetime.timedelta(days=1)
+    state = models.SyncState.objects.create(resource="time_entries", watermark=later)
+
+    state.advance(UPDATED_AT)
+
+    assert later == state.watermark
@@ -0,0 +1,89 @@
+import datetime
+
+import pytest
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from openproject_sync import models
+from openproject_sync.serializers import (
+    ProjectSerializer,
+    TimeEntrySerializer,
+    ValuesRepresentation,
+    WorkPackageSerializer,
+)
+
+SERIALIZERS = {
+    "/projects/": ProjectSerializer,
+    "/work_packages/": WorkPackageSerializer,
+    "/time_entries/": TimeEntrySerializer,
+}
+
+
+@pytest.fixture
+def records(db):
+    project = models.Project.objects.create(
+        openproject_id=1, identifier="alpha", name="Älpha", active=False, description=None
+    )
+    models.Project.objects.create(openproject_id=2, identifier="beta", name="Beta", description="B")
+    work_package = models.WorkPackage.objects.create(
+        openproject_id=10,
+        project=project,
+        subject="Task",
+        lockVersion=3,
+        createdAt=datetime.datetime(2026, 1, 2, 3, 4, 5, 600, tzinfo=datetime.timezone.utc),
+        updatedAt=datetime.datetime(2026, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+        startDate=datetime.date(2026, 1, 2),
+        spentTime="PT1H",
+        scheduleManually=True,
+        percentageDone=50,
+    )
+    models.WorkPackage.objects.create(openproject_id=11, project=project, subject="Empty")
+    models.TimeEntry.objects.create(
+        openproject_id=100,
+        work_package=work_package,
+        comment="Done",
+        spentOn=datetime.date(2026, 1, 3),
+        hours="PT2H",
+    )
+    models.TimeEntry.objects.create(openproject_id=101, work_package=work_package)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("serializer_class", SERIALIZERS.values())
+def test_values_representation_matches_serializer(records, serializer_class):
+    queryset = serializer_class.Meta.model.objects.order_by("pk")
+    representation = ValuesRepresentation.for_serializer(serializer_class())
+
+    fast = [representation(row) for row in queryset.values(*representation.lookups)]
+
+    expected = serializer_class(queryset, many=True).data
+    assert JSONRenderer().render(expected) == JSONRenderer().render(fast)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("path", SERIALIZERS)
+def test_list_matches_serializer(api_client, records, path):
+    serializer_class = SERIALIZERS[path]
+    queryset = serializer_class.Meta.model.objects.order_by("pk")
+
+    response = api_client.get(path)
+
+    assert response.json()["results"] == serializer_class(queryset, many=True).data
+
+
+@pytest.mark.django_db
+def test_list_pages_with_values(api_client, records):
+    first = api_client.get("/work_packages/?page_size=1").json()
+    second = api_client.get(first["next"]).json()
+
+    assert [10, 11] == [r["openproject_id"] for r in first["results"] + second["results"]]
+
+
+def test_unsupported_fields_fall_back():
+    class Serializer(ProjectSerializer):
+        label = serializers.SerializerMethodField()
+
+        class Meta(ProjectSerializer.Meta):
+            fields = ProjectSerializer.Meta.fields + ["label"]
+
+    assert ValuesRepresentation.for_serializer(Serializer()) is None
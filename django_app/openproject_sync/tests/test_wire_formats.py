@@ -0,0 +1,122 @@
+import datetime
+import gzip
+import json
+import zlib
+from decimal import Decimal
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from openproject_sync import models
+from openproject_sync.renderers import ORJSONRenderer
+
+PROJECTS = [
+    {"openproject_id": 1, "identifier": "alpha", "name": "Alpha"},
+    {"openproject_id": 2, "identifier": "beta", "name": "Beta"},
+]
+
+
+@pytest.fixture
+def project(db):
+    return models.Project.objects.create(openproject_id=1, identifier="alpha", name="Alpha")
+
+
+def test_orjson_renderer_matches_json_renderer():
+    data = {
+        1: "Ünïcode  ",
+        "at": datetime.datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc),
+        "on": datetime.date(2026, 1, 2),
+        "time": datetime.time(3, 4, 5),
+        "amount": Decimal("1.50"),
+        "items": [None, True, 1.5],
+    }
+
+    assert JSONRenderer().render(data) == ORJSONRenderer().render(data)
+
+
+@pytest.mark.django_db
+def test_lists_are_rendered_as_msgpack(api_client, project):
+    msgpack = pytest.importorskip("msgpack")
+
+    response = api_client.get("/projects/", HTTP_ACCEPT="application/msgpack")
+
+    assert "application/msgpack" == response["Content-Type"]
+    assert api_client.get("/projects/").json() == msgpack.unpackb(response.content)
+
+
+@pytest.mark.django_db
+def test_msgpack_request_bodies_are_parsed(api_client):
+    msgpack = pytest.importorskip("msgpack")
+
+    response = api_client.post(
+        "/projects/bulk_upsert/", msgpack.packb(PROJECTS), content_type="application/msgpack"
+    )
+
+    assert 200 == response.status_code
+    assert 2 == models.Project.objects.count()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("encoding, compress", [("gzip", gzip.compress), ("deflate", zlib.compress)])
+def test_compressed_request_bodies_are_decompressed(api_client, encoding, compress):
+    response = api_client.post(
+        "/projects/bulk_upsert/",
+        compress(json.dumps(PROJECTS).encode()),
+        content_type="application/json",
+        HTTP_CONTENT_ENCODING=encoding,
+    )
+
+    assert 200 == response.status_code
+    assert 2 == models.Project.objects.count()
+
+
+@pytest.mark.django_db
+def test_invalid_compressed_request_bodies_are_rejected(api_client):
+    body = gzip.compress(json.dumps(PROJECTS).encode())
+
+    for content, status in ((b"not gzip", 400), (body[:-10], 400)):
+        response = api_client.post(
+            "/projects/bulk_upsert/", content, content_type="application/json", HTTP_CONTENT_ENCODING="gzip"
+        )
+        assert status == response.status_code
+    response = api_client.post(
+        "/projects/bulk_upsert/", body, content_type="application/json", HTTP_CONTENT_ENCODING="br"
+    )
+    assert 415 == response.status_code
+
+
+@pytest.mark.django_db
+def test_decompressed_request_bodies_are_limited(api_client, settings):
+    settings.OPENPROJECT_MAX_DECOMPRESSED_REQUEST_SIZE = 10
+
+    response = api_client.post(
+        "/projects/bulk_upsert/",
+        gzip.compress(json.dumps(PROJECTS).encode()),
+        content_type="application/json",
+        HTTP_CONTENT_ENCODING="gzip",
+    )
+
+    assert 413 == response.status_code
+    assert 0 == models.Project.objects.count()
+
+
+@pytest.mark.django_db
+def test_responses_are_gzipped(api_client, project):
+    models.Project.objects.bulk_create(
+        models.Project(openproject_id=i, identifier=f"p{i}", name=f"Project {i}") for i in range(2, 20)
+    )
+
+    response = api_client.get("/projects/", HTTP_ACCEPT_ENCODING="gzip")
+
+    assert "gzip" == response["Content-Encoding"]
+    assert api_client.get("/projects/").json() == json.loads(gzip.decompress(response.content))
+
+
+@pytest.mark.django_db
+def test_admin_pages_are_not_gzipped(client, django_user_model):
+    client.force_login(django_user_model.objects.create_superuser("admin"))
+
+    response = client.get("/admin/", HTTP_ACCEPT_ENCODING="gzip")
+
+    assert 200 == response.status_code
+    assert not response.has_header("Content-Encoding")
@@ -1,14 +1,356 @@
-from rest_framework import permissions, viewsets
+from django.conf import settings
+from django.http import Http404, StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.gzip import gzip_page
+from rest_framework import mixins, permissions, serializers, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
 
-from openproject_sync.models import Project, WorkPackage, TimeEntry
+from openproject_sync import hal
+from openproject_sync.identity import identity_map
+from openproject_sync.models import Project, WorkPackage, TimeEntry, SyncState, content_hash
+from openproject_sync.renderers import NDJSONRenderer
 from openproject_sync.serializers import (
     ProjectSerializer,
+    SyncStateAdvanceSerializer,
+    SyncStateSerializer,
     TimeEntrySerializer,
+    ValuesRepresentation,
     WorkPackageSerializer,
+    upsert_valid,
 )
 
 
-class ProjectViewSet(viewsets.ModelViewSet):
+class GZipMixin:
+    """
+    Compresses the responses with gzip if the client accepts it.
+
+    Only the API is compressed, not the whole site: compressing pages that hold
+    CSRF tokens, like the admin, makes them vulnerable to BREACH.
+    """
+
+    @method_decorator(gzip_page)
+    def dispatch(self, request, *args, **kwargs):
+        return super().dispatch(request, *args, **kwargs)
+
+
+class OpenProjectLookupMixin:
+    """
+    Resolves detail lookups by `openproject_id` through the identity map.
+
+    The primary key cached for the requested OpenProject ID is used to fetch the
+    object. Since the cache is per process, the fetched row is only accepted if
+    its `openproject_id` still matches; otherwise the entry is discarded and the
+    regular lookup by `openproject_id` is performed.
+    """
+
+    lookup_field = "openproject_id"
+
+    def get_object(self):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            openproject_id = int(self.kwargs[lookup_url_kwarg])
+        except (TypeError, ValueError):
+            raise Http404
+        ids = identity_map(self.queryset.model)
+        pk = ids.get(openproject_id)
+        if pk is None:
+            raise Http404
+        try:
+            obj = self.filter_queryset(self.get_queryset()).get(pk=pk)
+        except self.queryset.model.DoesNotExist:
+            obj = None
+        if obj is None or obj.openproject_id != openproject_id:
+            ids.discard(openproject_id=openproject_id, pk=pk)
+            return super().get_object()
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+
+class BulkUpsertMixin:
+    """
+    Adds a `bulk_upsert` action creating or updating many records in one request.
+
+    The request body is a list of records keyed by `openproject_id`. All records
+    are validated in one pass with prefetched foreign key targets and written in
+    a single transaction. At most `OPENPROJECT_BULK_UPSERT_BATCH_SIZE` records
+    are accepted per request. The response maps the OpenProject ID of every
+    written record to its primary key.
+    """
+
+    @action(detail=False, methods=["post"])
+    def bulk_upsert(self, request, *args, **kwargs):
+        return Response(self.perform_bulk_upsert(request.data))
+
+    def perform_bulk_upsert(self, data):
+        context = self.get_serializer_context()
+        context["upsert"] = True
+        serializer = self.get_serializer_class()(
+            data=data,
+            many=True,
+            context=context,
+            max_length=settings.OPENPROJECT_BULK_UPSERT_BATCH_SIZE,
+        )
+        serializer.is_valid(raise_exception=True)
+        return serializer.upsert(serializer.validated_data)
+
+
+class IngestMixin:
+    """
+    Adds an `ingest` action accepting raw OpenProject API v3 HAL documents.
+
+    The request body is a single resource, a list of resources or a whole
+    collection page as returned by OpenProject. The resources are mapped to
+    records in-process (see `openproject_sync.hal`), with related resources
+    resolved by their OpenProject IDs, and written like a `bulk_upsert`.
+
+    Unlike `bulk_upsert`, resources that cannot be written (e.g. time entries
+    of work packages that are not synchronized yet) do not fail the request,
+    as OpenProject pages regularly contain some. They are skipped, and the
+    response holds the written records as well as the errors of the skipped
+    ones per OpenProject ID:
+
+        {"written": {"1": 11}, "skipped": {"2": {"work_package_openproject_id": [...]}}}
+    """
+
+    @action(detail=False, methods=["post"])
+    def ingest(self, request, *args, **kwargs):
+        try:
+            records = hal.from_hal_documents(self.queryset.model, request.data)
+        except hal.HALError as exc:
+            raise serializers.ValidationError({"non_field_errors": [str(exc)]})
+        written, skipped = upsert_valid(
+            self.get_serializer_class(),
+            records,
+            self.get_serializer_context(),
+            max_length=settings.OPENPROJECT_BULK_UPSERT_BATCH_SIZE,
+        )
+        skipped = {records[index]["openproject_id"]: error for index, error in skipped.items()}
+        return Response({"written": written, "skipped": skipped})
+
+
+class ManifestMixin:
+    """
+    Adds a `manifest` action listing what is needed to decide create/update/skip.
+
+    The manifest is read with `values_list()` and returned in columnar form, i.e.
+    one array per column with the same index referring to the same record:
+
+        {"count": 2, "openproject_id": [1, 2], "updatedAt": [...], "hash": [...]}
+
+    `lockVersion` and `updatedAt` are only included for models having these
+    fields. `hash` is the content hash of the synchronized fields, see
+    `OpenProjectModelMixin.content_hash_fields`.
+    """
+
+    manifest_columns = ("lockVersion", "updatedAt")
+
+    @action(detail=False, methods=["get"])
+    def manifest(self, request, *args, **kwargs):
+        model = self.queryset.model
+        field_names = {field.name for field in model._meta.concrete_fields}
+        columns = ["openproject_id"] + [c for c in self.manifest_columns if c in field_names]
+        hash_fields = model.content_hash_fields()
+        positions = [hash_fields.index(column) + 1 for column in columns[1:]]
+        manifest = {column: [] for column in columns}
+        manifest["hash"] = []
+        datetime_field = serializers.DateTimeField()
+        rows = (
+            self.filter_queryset(self.get_queryset())
+            .order_by("pk")
+            .values_list("openproject_id", *hash_fields)
+            .iterator(chunk_size=2000)
+        )
+        for row in rows:
+            manifest["openproject_id"].append(row[0])
+            for column, position in zip(columns[1:], positions):
+                value = row[position]
+                if column == "updatedAt":
+                    value = datetime_field.to_representation(value)
+                manifest[column].append(value)
+            manifest["hash"].append(content_hash(row[1:]))
+        return Response({"count": len(manifest["openproject_id"]), **manifest})
+
+
+class SparseFieldsMixin:
+    """
+    Restricts list and detail responses to the fields requested by the client.
+
+    `?fields=id,openproject_id` includes only the named fields, `?exclude=description`
+    all fields but the named ones. The database query is narrowed accordingly
+    with `only()`, so large text columns are not read unless requested.
+    """
+
+    sparse_actions = ("list", "retrieve")
+
+    def get_sparse_fields(self):
+        """
+        Returns the names of the requested fields, or None if all are requested.
+        """
+        if getattr(self, "action", None) not in self.sparse_actions:
+            return None
+        params = self.request.query_params
+        if "fields" not in params and "exclude" not in params:
+            return None
+        serializer = self.get_serializer_class()(context=self.get_serializer_context())
+        names = [field.field_name for field in serializer._readable_fields]
+        requested = {name for name in params.get("fields", "").split(",") if name}
+        excluded = {name for name in params.get("exclude", "").split(",") if name}
+        errors = {
+            param: [f"Unknown fields: {', '.join(sorted(unknown))}."]
+            for param, unknown in (("fields", requested - set(names)), ("exclude", excluded - set(names)))
+            if unknown
+        }
+        if errors:
+            raise serializers.ValidationError(errors)
+        return [
+            name
+            for name in names
+            if (not requested or name in requested) and name not in excluded
+        ]
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_sparse_fields()
+        if fields is not None:
+            kwargs.setdefault("fields", fields)
+        return super().get_serializer(*args, **kwargs)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        fields = self.get_sparse_fields()
+        if fields is None:
+            return queryset
+        serializer = self.get_serializer()
+        # The OpenProject ID is needed by detail lookups.
+        return queryset.only("openproject_id", *(field.source for field in serializer._readable_fields))
+
+
+class ValuesListMixin:
+    """
+    Serves list requests from `values()` rows instead of model instances.
+
+    The rows are converted with a `ValuesRepresentation` of the view's
+    serializer, producing the same output without instantiating models or going
+    through the per-field machinery of the serializer. Views whose serializer is
+    not supported by `ValuesRepresentation` use the regular `list()`.
+    """
+
+    def get_values_representation(self):
+        return ValuesRepresentation.for_serializer(self.get_serializer())
+
+    def get_values_queryset(self, representation):
+        lookups = list(representation.lookups)
+        # The primary key is the position of the cursor pagination.
+        pk_name = self.queryset.model._meta.pk.name
+        if pk_name not in lookups:
+            lookups.append(pk_name)
+        return self.filter_queryset(self.get_queryset()).values(*lookups)
+
+    def list(self, request, *args, **kwargs):
+        representation = self.get_values_representation()
+        if representation is None:
+            return super().list(request, *args, **kwargs)
+        queryset = self.get_values_queryset(representation)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response([representation(row) for row in page])
+        return Response([representation(row) for row in queryset])
+
+
+class StreamingListMixin:
+    """
+    Streams the whole list as newline delimited JSON with `?format=ndjson`.
+
+    The filtered queryset is read with `.iterator()` in chunks of
+    `OPENPROJECT_STREAM_CHUNK_SIZE` rows, and every row is serialized and
+    written as soon as it is read. Memory use therefore does not depend on the
+    number of records. Streamed lists are not paginated and ordered by primary
+    key. Rows are read with `values()` if the view is a `ValuesListMixin`.
+    """
+
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer]
+
+    def list(self, request, *args, **kwargs):
+        if request.accepted_renderer.format != NDJSONRenderer.format:
+            return super().list(request, *args, **kwargs)
+        representation = None
+        if isinstance(self, ValuesListMixin):
+            representation = self.get_values_representation()
+        if representation is None:
+            representation = self.get_serializer().to_representation
+            queryset = self.filter_queryset(self.get_queryset())
+        else:
+            queryset = self.get_values_queryset(representation)
+        rows = (
+            NDJSONRenderer.render_line(representation(row))
+            for row in queryset.order_by("pk").iterator(
+                chunk_size=settings.OPENPROJECT_STREAM_CHUNK_SIZE
+            )
+        )
+        return StreamingHttpResponse(rows, content_type=NDJSONRenderer.media_type)
+
+
+class IdMapMixin:
+    """
+    Adds an `id_map` action resolving OpenProject IDs to primary keys in bulk.
+
+    Without parameters the mapping of all records is returned. The IDs to
+    resolve can be restricted with `?openproject_id=1,2,3`, or for long lists
+    by POSTing `{"openproject_id": [1, 2, 3]}` or just `[1, 2, 3]`. These are
+    resolved with a single query rather than from the identity map, as rows may
+    have been deleted or re-created by other processes; the identity map is
+    refreshed with the result. Unknown IDs are omitted from the response.
+    """
+
+    @action(detail=False, methods=["get", "post"])
+    def id_map(self, request, *args, **kwargs):
+        model = self.queryset.model
+        if request.method == "POST":
+            openproject_ids = request.data
+            if isinstance(openproject_ids, dict):
+                openproject_ids = openproject_ids.get("openproject_id")
+        else:
+            openproject_ids = request.query_params.get("openproject_id")
+            if openproject_ids is not None:
+                openproject_ids = [i for i in openproject_ids.split(",") if i]
+        if openproject_ids is None:
+            mapping = dict(
+                model._default_manager.order_by().values_list("openproject_id", "pk")
+            )
+            return Response(mapping)
+        try:
+            if not isinstance(openproject_ids, list):
+                raise ValueError
+            openproject_ids = {int(i) for i in openproject_ids}
+        except (TypeError, ValueError):
+            raise serializers.ValidationError(
+                {"openproject_id": ["A list of integers is required."]}
+            )
+        mapping = dict(
+            model._default_manager.filter(openproject_id__in=openproject_ids)
+            .order_by()
+            .values_list("openproject_id", "pk")
+        )
+        ids = identity_map(model)
+        for openproject_id in openproject_ids - set(mapping):
+            ids.discard(openproject_id=openproject_id)
+        ids.set_many(mapping)
+        return Response(mapping)
+
+
+class ProjectViewSet(
+    GZipMixin,
+    OpenProjectLookupMixin,
+    SparseFieldsMixin,
+    StreamingListMixin,
+    ValuesListMixin,
+    BulkUpsertMixin,
+    IngestMixin,
+    ManifestMixin,
+    IdMapMixin,
+    viewsets.ModelViewSet,
+):
     """
     Handles operations related to Project objects.
 
@@ -29,7 +371,18 @@ class ProjectViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
 
 
-class WorkPackageViewSet(viewsets.ModelViewSet):
+class WorkPackageViewSet(
+    GZipMixin,
+    OpenProjectLookupMixin,
+    SparseFieldsMixin,
+    StreamingListMixin,
+    ValuesListMixin,
+    BulkUpsertMixin,
+    IngestMixin,
+    ManifestMixin,
+    IdMapMixin,
+    viewsets.ModelViewSet,
+):
     """
     ViewSet for managing work packages.
 
@@ -54,7 +407,18 @@ class WorkPackageViewSet(viewsets.ModelViewSet):
     lookup_field = "openproject_id"
 
 
-class TimeEntryViewSet(viewsets.ModelViewSet):
+class TimeEntryViewSet(
+    GZipMixin,
+    OpenProjectLookupMixin,
+    SparseFieldsMixin,
+    StreamingListMixin,
+    ValuesListMixin,
+    BulkUpsertMixin,
+    IngestMixin,
+    ManifestMixin,
+    IdMapMixin,
+    viewsets.ModelViewSet,
+):
     """
     A viewset for managing TimeEntry instances.
 
@@ -73,3 +437,44 @@ class TimeEntryViewSet(viewsets.ModelViewSet):
     serializer_class = TimeEntrySerializer
     permission_classes = [permissions.IsAuthenticated]
     lookup_field = "openproject_id"
+
+
+class SyncStateViewSet(
+    GZipMixin, mixins.RetrieveModelMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
+    """
+    Exposes the incremental synchronization state per resource.
+
+    `GET /sync_state/<resource>/` returns the watermark of the resource and
+    whether a full reconcile is due; the state is created on first access.
+    `POST /sync_state/<resource>/advance/` moves the watermark to the time a
+    finished pull started, e.g. `{"started_at": "2026-01-01T00:00:00Z"}`; add
+    `"full": true` after a full reconcile.
+
+    Attributes:
+        queryset: A queryset containing all SyncState objects.
+        serializer_class: The serializer class used for SyncState objects.
+        permission_classes: A list of permission classes applied to this viewset.
+    """
+
+    queryset = SyncState.objects.all()
+    serializer_class = SyncStateSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    lookup_field = "resource"
+    pagination_class = None
+
+    def get_object(self):
+        resource = self.kwargs[self.lookup_field]
+        if resource not in dict(SyncState.RESOURCE_CHOICES):
+            raise Http404
+        obj, _ = SyncState.objects.get_or_create(resource=resource)
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+    @action(detail=True, methods=["post"])
+    def advance(self, request, *args, **kwargs):
+        state = self.get_object()
+        serializer = SyncStateAdvanceSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        state.advance(**serializer.validated_data)
+        return Response(self.get_serializer(state).data)
@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# Windmill scripts import each other by their workspace path (e.g. "u.admin.x"),
+# which resolves relative to the windmill directory.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "windmill"))
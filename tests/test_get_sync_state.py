@@ -0,0 +1,50 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from windmill.u.admin.get_sync_state import main, updated_since_filters
+
+
+class TestGetSyncState(unittest.TestCase):
+    def test_filters_select_records_updated_since_watermark(self):
+        filters = json.loads(updated_since_filters("work_packages", "2026-01-01T00:00:00Z"))
+
+        self.assertEqual("<>d", filters[0]["updatedAt"]["operator"])
+        self.assertEqual("2026-01-01T00:00:00Z", filters[0]["updatedAt"]["values"][0])
+
+    def test_time_entries_use_snake_case_filter(self):
+        filters = json.loads(updated_since_filters("time_entries", "2026-01-01T00:00:00Z"))
+
+        self.assertIn("updated_at", filters[0])
+
+    @patch("windmill.u.admin.get_sync_state.wmill.get_variable")
+    @patch("windmill.u.admin.get_sync_state.requests.get")
+    def test_returns_no_filters_when_full_sync_is_due(self, mock_get, mock_get_variable):
+        mock_get_variable.side_effect = lambda key: "mock_value"
+        mock_get.return_value = MagicMock(
+            json=MagicMock(return_value={"full_sync_due": True, "watermark": None})
+        )
+
+        result = main("time_entries")
+
+        self.assertEqual((True, ""), (result["full"], result["filters"]))
+        self.assertIn("started_at", result)
+
+    @patch("windmill.u.admin.get_sync_state.wmill.get_variable")
+    @patch("windmill.u.admin.get_sync_state.requests.get")
+    def test_returns_filters_for_incremental_sync(self, mock_get, mock_get_variable):
+        mock_get_variable.side_effect = lambda key: "mock_value"
+        mock_get.return_value = MagicMock(
+            json=MagicMock(
+                return_value={"full_sync_due": False, "watermark": "2026-01-01T00:00:00Z"}
+            )
+        )
+
+        result = main("time_entries")
+
+        self.assertFalse(result["full"])
+        self.assertIn("2026-01-01T00:00:00Z", result["filters"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+from unittest.mock import patch
+
+from windmill.u.admin import id_set
+
+
+class TestIdSet(unittest.TestCase):
+    def test_encodes_sorted_deduplicated_deltas(self):
+        self.assertEqual("1,1,1,7,z", id_set.encode([10, "2", 1, 3, 2, 45]))
+
+    def test_decodes_encoded_ids(self):
+        ids = [1, 5, 5, 36, 1000000]
+        self.assertEqual(frozenset(ids), id_set.decode(id_set.encode(ids)))
+
+    def test_decodes_empty_set(self):
+        self.assertEqual(frozenset(), id_set.decode(id_set.encode([])))
+
+    def test_contains_accepts_lists_and_encoded_sets(self):
+        self.assertTrue(id_set.contains(["3", "4"], 4))
+        self.assertTrue(id_set.contains(id_set.encode([3, 4]), "4"))
+        self.assertFalse(id_set.contains(id_set.encode([3, 4]), 5))
+        self.assertFalse(id_set.contains([3], ""))
+
+    @patch("windmill.u.admin.id_set.wmill")
+    def test_stores_sets_in_flow_user_state(self, wmill):
+        state = {}
+        wmill.set_flow_user_state.side_effect = state.__setitem__
+        wmill.get_flow_user_state.side_effect = state.get
+
+        reference = id_set.store([7, 8], "existing")
+
+        self.assertEqual("@existing", reference)
+        self.assertTrue(id_set.contains(reference, 8))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import gzip
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from windmill.u.admin.ingest import post_documents
+
+
+class TestPostDocuments(unittest.TestCase):
+    @patch("windmill.u.admin.ingest.CHUNK_SIZE", 2)
+    def test_posts_documents_in_chunks(self):
+        session = MagicMock()
+        session.post.return_value.json.side_effect = [{"1": 11, "2": 12}, {"3": 13}]
+        documents = [{"_type": "Project", "id": i} for i in (1, 2, 3)]
+
+        mapping = post_documents("https://dj/projects/ingest/", {}, documents, session=session)
+
+        self.assertEqual({"1": 11, "2": 12, "3": 13}, mapping)
+        self.assertEqual(
+            [documents[:2], documents[2:]],
+            [json.loads(gzip.decompress(call.kwargs["data"])) for call in session.post.call_args_list],
+        )
+        self.assertEqual("gzip", session.post.call_args.kwargs["headers"]["Content-Encoding"])
+
+    def test_returns_written_records_of_ingest_responses(self):
+        session = MagicMock()
+        session.post.return_value.json.return_value = {
+            "written": {"1": 11},
+            "skipped": {"2": {"work_package_openproject_id": ["Invalid pk"]}},
+        }
+        documents = [{"_type": "TimeEntry", "id": i} for i in (1, 2)]
+
+        mapping = post_documents("https://dj/time_entries/ingest/", {}, documents, session=session)
+
+        self.assertEqual({"1": 11}, mapping)
+
+    def test_posts_nothing_without_documents(self):
+        session = MagicMock()
+
+        self.assertEqual({}, post_documents("https://dj/projects/ingest/", {}, [], session=session))
+        session.post.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
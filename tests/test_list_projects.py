@@ -0,0 +1,37 @@
+import unittest
+from unittest.mock import patch
+
+from windmill.u.admin import list_projects
+
+
+class TestListProjects(unittest.TestCase):
+    documents = [
+        {"id": 1, "_links": {"workPackages": {"href": "/api/v3/projects/1/work_packages"}}},
+        {"id": 2, "_links": {}},
+    ]
+
+    @patch("windmill.u.admin.list_projects.ingest")
+    @patch("windmill.u.admin.list_projects.get_id_map", return_value={"1": 11})
+    @patch("windmill.u.admin.list_projects.get_collection")
+    def test_ingests_only_unknown_projects(self, mock_get_collection, mock_get_id_map, mock_ingest):
+        mock_get_collection.return_value = self.documents
+
+        result = list_projects.main()
+
+        self.assertEqual([(1, "/api/v3/projects/1/work_packages"), (2, None)], result)
+        mock_get_id_map.assert_called_once_with("projects", [1, 2])
+        mock_ingest.assert_called_once_with("projects", documents=[self.documents[1]])
+
+    @patch("windmill.u.admin.list_projects.ingest")
+    @patch("windmill.u.admin.list_projects.get_id_map", return_value={"1": 11, "2": 12})
+    @patch("windmill.u.admin.list_projects.get_collection")
+    def test_writes_nothing_if_all_projects_are_known(self, mock_get_collection, mock_get_id_map, mock_ingest):
+        mock_get_collection.return_value = self.documents
+
+        list_projects.main()
+
+        mock_ingest.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from unittest.mock import MagicMock
+
+from windmill.u.admin.op_collection import iter_collection, iter_pages
+
+
+def page(elements, total, page_size):
+    response = MagicMock()
+    response.json.return_value = {
+        "total": total,
+        "pageSize": page_size,
+        "_embedded": {"elements": elements},
+    }
+    return response
+
+
+class TestIterPages(unittest.TestCase):
+    def test_reads_single_page_collection_with_one_request(self):
+        session = MagicMock()
+        session.get.return_value = page([{"id": 1}], total=1, page_size=1000)
+
+        result = list(iter_collection("https://op/api/v3/projects", {}, session=session))
+
+        self.assertEqual([{"id": 1}], result)
+        session.get.assert_called_once()
+        self.assertEqual(
+            {"offset": 1, "pageSize": 1000}, session.get.call_args.kwargs["params"]
+        )
+
+    def test_fetches_remaining_pages_with_effective_page_size(self):
+        """
+        The server may clamp the requested page size; the remaining offsets
+        must be computed from the page size it reports.
+        """
+        session = MagicMock()
+        requested_sizes = {}
+
+        def get(url, headers, params, timeout):
+            offset = params["offset"]
+            requested_sizes[offset] = params["pageSize"]
+            ids = [offset * 10, offset * 10 + 1][: 5 - (offset - 1) * 2]
+            return page([{"id": i} for i in ids], total=5, page_size=2)
+
+        session.get.side_effect = get
+
+        pages = list(iter_pages("https://op/api/v3/projects", {}, session=session))
+
+        self.assertEqual([[10, 11], [20, 21], [30]], [[e["id"] for e in p] for p in pages])
+        self.assertEqual({1: 1000, 2: 2, 3: 2}, requested_sizes)
+
+    def test_passes_additional_parameters(self):
+        session = MagicMock()
+        session.get.return_value = page([], total=0, page_size=1000)
+
+        list(iter_pages("https://op/x", {}, params={"filters": "[]"}, session=session))
+
+        self.assertEqual("[]", session.get.call_args.kwargs["params"]["filters"])
+
+    def test_handles_missing_embedded_elements(self):
+        session = MagicMock()
+        response = MagicMock()
+        response.json.return_value = {}
+        session.get.return_value = response
+
+        self.assertEqual([], list(iter_collection("https://op/x", {}, session=session)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,9 @@
+import gzip
+import json
 import unittest
 from unittest.mock import patch, MagicMock
 
-from windmill.u.admin.synchronize_work_packages import process_hook
+from windmill.u.admin.synchronize_work_packages import process_batch, process_hook
 
 
 class TestProcessHook(unittest.TestCase):
@@ -79,6 +81,84 @@ class TestProcessHook(unittest.TestCase):
             )
         self.assertEqual(str(context.exception), "'openproject_id'")
 
+    @patch('windmill.u.admin.synchronize_work_packages.wmill.run_script')
+    @patch('windmill.u.admin.synchronize_work_packages.requests.post')
+    def test_work_package_project_resolved_from_id_map(self, mock_post, mock_run_script):
+        """
+        Test that process_hook takes the project from the ID map without running get_project.
+        """
+        work_package = {"id": 7, "_embedded": {"project": {"id": 3}}}
+        mock_post.return_value.json.return_value = {"id": 7}
+
+        process_hook(
+            action="work_package:created",
+            work_package=work_package,
+            work_packages_url="https://api.example.com/work_packages/",
+            headers={},
+            project_ids={"3": 42},
+        )
+
+        self.assertEqual(42, work_package["project"])
+        mock_run_script.assert_not_called()
+
+    @patch('windmill.u.admin.synchronize_work_packages.wmill.run_script')
+    @patch('windmill.u.admin.synchronize_work_packages.requests.post')
+    def test_work_package_project_missing_from_id_map(self, mock_post, mock_run_script):
+        """
+        Test that process_hook sends projects missing from the ID map by their OpenProject ID.
+        """
+        work_package = {"id": 7, "_embedded": {"project": {"id": 3}}}
+        mock_post.return_value.json.return_value = {"id": 7}
+
+        process_hook(
+            action="work_package:created",
+            work_package=work_package,
+            work_packages_url="https://api.example.com/work_packages/",
+            headers={},
+            project_ids={},
+        )
+
+        self.assertEqual(3, work_package["project_openproject_id"])
+        self.assertNotIn("project", work_package)
+        mock_run_script.assert_not_called()
+
+
+class TestProcessBatch(unittest.TestCase):
+    @patch('u.admin.ingest.CHUNK_SIZE', 2)
+    @patch('u.admin.ingest.requests.Session')
+    def test_work_packages_are_upserted_in_chunks(self, mock_session):
+        """
+        Test that process_batch posts prepared records to bulk_upsert in chunks.
+        """
+        post = mock_session.return_value.post
+        post.return_value.json.side_effect = [{"1": 11, "2": 12}, {"3": 13}]
+        work_packages = [
+            {"id": i, "description": {"raw": f"d{i}"}, "_embedded": {"project": {"id": i}}, "_links": {}}
+            for i in (1, 2, 3)
+        ]
+
+        result = process_batch(
+            work_packages,
+            "https://api.example.com/work_packages/",
+            headers={},
+            project_ids={"1": 5},
+        )
+
+        self.assertEqual({"1": 11, "2": 12, "3": 13}, result)
+        self.assertEqual(2, post.call_count)
+        url = post.call_args_list[0].args[0]
+        first_chunk = json.loads(gzip.decompress(post.call_args_list[0].kwargs["data"]))
+        self.assertEqual("https://api.example.com/work_packages/bulk_upsert/", url)
+        self.assertEqual(
+            [
+                {"id": 1, "openproject_id": 1, "description": "d1", "project": 5},
+                {"id": 2, "openproject_id": 2, "description": "d2", "project_openproject_id": 2},
+            ],
+            first_chunk,
+        )
+        # The input records are left untouched.
+        self.assertNotIn("openproject_id", work_packages[0])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,41 +1,25 @@
 import unittest
+from unittest.mock import patch
 
 from windmill.f.flows.sync_work_packages__flow.inline_script_1 import main
+from windmill.f.flows.sync_work_packages__flow.inline_script_3 import main as total
 
 
 class TestMainFunction(unittest.TestCase):
-    def test_returns_href_when_present(self):
-        input_dict = {
-            "_links": {
-                "workPackages": {
-                    "href": "https://example.com/workPackages/123"
-                }
-            }
-        }
-        expected = "https://example.com/workPackages/123"
-        self.assertEqual(expected, main(input_dict))
-
-    def test_returns_none_when_missing_workPackages(self):
-        input_dict = {
-            "_links": {}
-        }
-        self.assertIsNone(main(input_dict))
-
-    def test_returns_none_when_missing_links(self):
-        input_dict = {}
-        self.assertIsNone(main(input_dict))
-
-    def test_returns_none_when_input_is_empty(self):
-        input_dict = {}
-        self.assertIsNone(main(input_dict))
-
-    def test_returns_none_when_href_is_missing(self):
-        input_dict = {
-            "_links": {
-                "workPackages": {}
-            }
-        }
-        self.assertIsNone(main(input_dict))
+    @patch('windmill.f.flows.sync_work_packages__flow.inline_script_1.ingest')
+    def test_ingests_the_work_packages_of_the_project(self, mock_ingest):
+        mock_ingest.return_value = 3
+
+        result = main([1, "/api/v3/projects/1/work_packages"], filters="[]")
+
+        self.assertEqual(3, result)
+        mock_ingest.assert_called_once_with(
+            "work_packages", path="/api/v3/projects/1/work_packages", filters="[]"
+        )
+
+    def test_total_sums_the_counts(self):
+        self.assertEqual(8, total([3, 5]))
+        self.assertEqual(0, total([]))
 
 
 if __name__ == "__main__":
@@ -1,28 +0,0 @@
-import wmill
-import requests
-
-
-def main():
-    """
-    Retrieves time entries data from an external API.
-
-    This function communicates with an external API to fetch the time entries and returns
-    the extracted elements from the response. The API endpoint and authorization hash are
-    retrieved from predefined variables.
-
-    Returns:
-        list: A list of elements representing the time entries.
-
-    Raises:
-        Any exceptions raised during the HTTP request or response processing will propagate
-        to the caller.
-    """
-    authorization_hash = wmill.get_variable("u/admin/op_authorization_hash")
-    op_api_url = wmill.get_variable("u/admin/op_api_url")
-    r = requests.get(
-        f"{op_api_url}/api/v3/time_entries",
-        headers={
-            "Authorization": f"Basic {authorization_hash}"
-        },
-    )
-    return r.json().get("_embedded", {"elements": []}).get("elements", [])
@@ -1,21 +0,0 @@
-# import wmill
-
-
-def main(x: dict):
-    """
-    Retrieves the 'href' attribute from a nested dictionary structure.
-
-    This function navigates through a series of nested dictionaries to
-    access and return the 'href' attribute located under the '_links',
-    'self' keys. If any key in the specified path is missing, it returns
-    an empty string.
-
-    Parameters:
-    x (dict): A dictionary that may contain nested dictionaries
-              under the '_links' and 'self' keys.
-
-    Returns:
-    str: The value of the 'href' attribute if it exists, otherwise
-         an empty string.
-    """
-    return x.get("_links", {}).get("self", {}).get("href", "")
\ No newline at end of file
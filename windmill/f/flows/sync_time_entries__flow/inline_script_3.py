@@ -1,15 +0,0 @@
-
-
-def main(x: str):
-    """
-    Processes a string input to extract and return an ID value from a nested JSON-like structure.
-
-    Parameters:
-    x (str): A string input representing a JSON-like structure. It is assumed to have a
-             nested dictionary structure with keys "_embedded" and "entity".
-
-    Returns:
-    Any: The value of the "id" key within the nested "entity" dictionary. If the structure
-         is incomplete or the key does not exist, None is returned.
-    """
-    return x.get("_embedded", {"entity": {}}).get("entity", {}).get("id")
\ No newline at end of file
@@ -1,21 +0,0 @@
-# import wmill
-
-
-def main(x: object):
-    """
-    Processes an iterable object and returns a list of its elements.
-
-    This function iterates through the elements of the given iterable object, collects
-    each element, and returns them as a new list. The order of elements in the list
-    matches the order in which they appear in the input iterable.
-
-    Parameters:
-    x (object): An iterable object containing elements to be processed.
-
-    Returns:
-    list: A list containing all elements of the input iterable.
-    """
-    result = []
-    for i in x:
-        result.append(i)
-    return result
\ No newline at end of file
@@ -1,5 +0,0 @@
-# import wmill
-
-
-def main(x: str):
-    return x[0]
\ No newline at end of file
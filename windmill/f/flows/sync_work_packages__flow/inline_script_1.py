@@ -1,34 +1,24 @@
-import wmill
-import requests
+from u.admin.ingest import main as ingest
 
 
-def main(x: str):
+def main(x: str, filters: str = ""):
     """
-    Fetches a list of elements from a remote API endpoint.
+    Writes the work packages of a project to the Django app.
 
-    This function retrieves data from a specified API URL using a GET
-    request. It requires an API endpoint addition to the base URL and
-    uses predefined authorization and API URL variables to authenticate
-    and construct the request. The response is parsed to extract and
-    return the list of elements.
+    The work packages collection of the project is streamed page by page from
+    OpenProject into the ingest endpoint of the Django app, which maps the HAL
+    documents (including the project) to records itself.
 
     Parameters:
     x: str
-        A string representing the endpoint addition to the base
-        API URL.
+        The OpenProject project as (id, work packages href) pair.
+    filters: str
+        OpenProject API filters, e.g. selecting the work packages updated
+        since the last synchronization. All work packages are written if
+        empty.
 
     Returns:
-    list
-        A list of elements extracted from the "_embedded" property
-        of the JSON response. Returns an empty list if the property
-        or elements do not exist.
+    int
+        The number of written work packages.
     """
-    authorization_hash = wmill.get_variable("u/admin/op_authorization_hash")
-    op_api_url = wmill.get_variable("u/admin/op_api_url")
-    r = requests.get(
-        f"{op_api_url}{x[1]}",
-        headers={
-            "Authorization": f"Basic {authorization_hash}"
-        },
-    )
-    return r.json().get("_embedded", {"elements": []}).get("elements", [])
+    return ingest("work_packages", path=x[1], filters=filters)
@@ -1,9 +1,13 @@
-# import wmill
+def main(x: list):
+    """
+    Sums the number of work packages written for each project.
 
+    Parameters:
+    x: list
+        The number of written work packages of each project.
 
-def main(x: object):
-    result = []
-    for i in x:
-        for j in i:
-            result.append(j)
-    return result
\ No newline at end of file
+    Returns:
+    int
+        The number of written work packages.
+    """
+    return sum(x)
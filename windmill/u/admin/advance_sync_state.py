@@ -0,0 +1,31 @@
+import requests
+import wmill
+
+
+def main(resource: str, started_at: str, full: bool = False):
+    """
+    Moves the watermark of the given resource after a successful pull.
+
+    The Django app sets the watermark to the time the pull started, and records
+    the time of the full reconcile if `full` is set.
+
+    Parameters:
+    resource : str
+        The OpenProject collection, either "work_packages" or "time_entries".
+    started_at : str
+        The ISO 8601 datetime the pull started, as returned by the
+        u/admin/get_sync_state script.
+    full : bool
+        Whether the finished pull was a full reconcile.
+
+    Returns:
+    dict
+        The new synchronization state of the resource.
+    """
+    authorization_hash = wmill.get_variable("u/admin/dj_authorization_hash")
+    dj_api_url = wmill.get_variable("u/admin/dj_api_url")
+    headers = {"Authorization": f"Basic {authorization_hash}"}
+    r = requests.post(
+        f"{dj_api_url}/sync_state/{resource}/advance/", json={"started_at": started_at, "full": full}, headers=headers
+    )
+    return r.json()
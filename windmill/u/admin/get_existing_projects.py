@@ -1,8 +1,9 @@
 import requests
 import wmill
+from u.admin import id_set
 
 
-def main():
+def main(key: str = ""):
     """
     Fetch a list of OpenProject IDs from the Django API.
 
@@ -12,18 +13,22 @@ def main():
     to extract the OpenProject IDs of all projects.
 
     Parameters:
-    None
+    key (str): If given, the IDs are stored under this key of the flow user
+    state and a reference to them is returned.
 
     Raises:
     ValueError: If the response from the API cannot be parsed as JSON, or if the
     expected keys are missing in the response data.
 
     Returns:
-    list: A list of integers or strings containing the OpenProject IDs of all
-    projects retrieved from the API.
+    str: The OpenProject IDs of all projects retrieved from the API, encoded by
+    `u/admin/id_set`, or a reference to them.
     """
     authorization_hash = wmill.get_variable("u/admin/dj_authorization_hash")
     dj_api_url = wmill.get_variable("u/admin/dj_api_url")
     headers = {"Authorization": f"Basic {authorization_hash}"}
-    r = requests.get(f"{dj_api_url}/projects/", headers=headers)
-    return [p.get("openproject_id") for p in r.json()]
\ No newline at end of file
+    # The manifest only carries the columns needed for the sync, in columnar form.
+    r = requests.get(f"{dj_api_url}/projects/manifest/", headers=headers)
+    # The IDs are returned compactly encoded, or stored in the flow user state,
+    # so that passing them to every job of a flow stays cheap.
+    return id_set.main(r.json()["openproject_id"], key)
\ No newline at end of file
@@ -1,20 +1,23 @@
 import requests
 import wmill
+from u.admin import id_set
 
 
-def main():
+def main(key: str = ""):
     """
     Fetches time entry data via an API call and extracts OpenProject IDs.
 
     This function retrieves the API authorization credentials and URL from predefined variables.
-    It sends a GET request to the endpoint for retrieving time entry data. The API response is
-    expected to be in JSON format, and the function extracts the 'openproject_id' values from
-    the time entry objects contained within the response.
+    It sends a GET request to the manifest endpoint of the time entries, which returns the
+    'openproject_id' values of all time entries as a single column.
+
+    Args:
+        key (str): If given, the IDs are stored under this key of the flow user
+            state and a reference to them is returned.
 
     Returns:
-        List[int | None]: A list containing the 'openproject_id' extracted from the time
-        entries returned by the API. If a time entry object lacks the 'openproject_id' key,
-        None will be included in the list.
+        str: The 'openproject_id' of all time entries encoded by `u/admin/id_set`,
+            or a reference to them.
 
     Raises:
         Any exceptions raised during the network request or JSON decoding will propagate
@@ -23,5 +26,8 @@ def main():
     authorization_hash = wmill.get_variable("u/admin/dj_authorization_hash")
     dj_api_url = wmill.get_variable("u/admin/dj_api_url")
     headers = {"Authorization": f"Basic {authorization_hash}"}
-    r = requests.get(f"{dj_api_url}/time_entries/", headers=headers)
-    return [p.get("openproject_id") for p in r.json()]
\ No newline at end of file
+    # The manifest only carries the columns needed for the sync, in columnar form.
+    r = requests.get(f"{dj_api_url}/time_entries/manifest/", headers=headers)
+    # The IDs are returned compactly encoded, or stored in the flow user state,
+    # so that passing them to every job of a flow stays cheap.
+    return id_set.main(r.json()["openproject_id"], key)
\ No newline at end of file
@@ -1,8 +1,9 @@
 import requests
 import wmill
+from u.admin import id_set
 
 
-def main():
+def main(key: str = ""):
     """
     Retrieves open project IDs for work packages.
 
@@ -11,8 +12,13 @@ def main():
     retrieved from a secure variable storage. The function processes the response
     to extract and return the open project IDs.
 
+    Args:
+        key (str): If given, the IDs are stored under this key of the flow user
+            state and a reference to them is returned.
+
     Returns:
-        list: A list of open project IDs extracted from the response.
+        str: The open project IDs extracted from the response, encoded by
+            `u/admin/id_set`, or a reference to them.
 
     Raises:
         Any exceptions raised by `requests.get`.
@@ -21,5 +27,8 @@ def main():
     authorization_hash = wmill.get_variable("u/admin/dj_authorization_hash")
     dj_api_url = wmill.get_variable("u/admin/dj_api_url")
     headers = {"Authorization": f"Basic {authorization_hash}"}
-    r = requests.get(f"{dj_api_url}/work_packages/", headers=headers)
-    return [p.get("openproject_id") for p in r.json()]
\ No newline at end of file
+    # The manifest only carries the columns needed for the sync, in columnar form.
+    r = requests.get(f"{dj_api_url}/work_packages/manifest/", headers=headers)
+    # The IDs are returned compactly encoded, or stored in the flow user state,
+    # so that passing them to every job of a flow stays cheap.
+    return id_set.main(r.json()["openproject_id"], key)
\ No newline at end of file
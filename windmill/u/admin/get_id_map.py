@@ -0,0 +1,43 @@
+import requests
+import wmill
+
+# Django API collection per resource that can be resolved.
+RESOURCES = ("projects", "work_packages", "time_entries")
+
+
+def main(resource: str, openproject_ids: list = []):
+    """
+    Fetches the mapping of OpenProject IDs to Django IDs for a resource.
+
+    A flow resolves its foreign keys with the result of a single call of this
+    script, instead of running `u/admin/get_project` or `u/admin/get_work_package`
+    for every item. Without `openproject_ids` the mapping of all records of the
+    resource is returned.
+
+    Parameters:
+    resource : str
+        One of "projects", "work_packages" or "time_entries".
+    openproject_ids : list
+        The OpenProject IDs to resolve. Defaults to all records.
+
+    Raises:
+    ValueError: If the resource is unknown.
+    requests.RequestException: If the Django API cannot be reached.
+
+    Returns:
+    dict: The Django ID per OpenProject ID. As JSON object keys are strings, the
+    OpenProject IDs are strings as well. Unknown OpenProject IDs are omitted.
+    """
+    if resource not in RESOURCES:
+        raise ValueError(f"Unknown resource {resource!r}")
+    authorization_hash = wmill.get_variable("u/admin/dj_authorization_hash")
+    dj_api_url = wmill.get_variable("u/admin/dj_api_url")
+    headers = {"Authorization": f"Basic {authorization_hash}"}
+    url = f"{dj_api_url}/{resource}/id_map/"
+    if openproject_ids:
+        # The IDs are posted, as a long list would exceed the URL length limit.
+        r = requests.post(url, json={"openproject_id": openproject_ids}, headers=headers)
+    else:
+        r = requests.get(url, headers=headers)
+    r.raise_for_status()
+    return r.json()
@@ -0,0 +1,69 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import requests
+import wmill
+
+# Name of the "updated at" filter per OpenProject collection.
+UPDATED_AT_FILTERS = {
+    "work_packages": "updatedAt",
+    "time_entries": "updated_at",
+}
+
+
+def updated_since_filters(resource: str, since: str) -> str:
+    """
+    Builds the OpenProject API filters selecting the records updated since `since`.
+
+    The filter is inclusive, so records updated exactly at the watermark are
+    fetched again; writing them is idempotent.
+
+    Parameters:
+    resource : str
+        The OpenProject collection, e.g. "work_packages".
+    since : str
+        The ISO 8601 datetime of the watermark.
+
+    Returns:
+    str
+        The JSON encoded value for the "filters" query parameter.
+    """
+    until = (datetime.now(timezone.utc) + timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return json.dumps(
+        [{UPDATED_AT_FILTERS[resource]: {"operator": "<>d", "values": [since, until]}}]
+    )
+
+
+def main(resource: str):
+    """
+    Determines how the given resource has to be pulled from OpenProject.
+
+    Reads the synchronization state of the resource from the Django app. If a
+    full reconcile is due, no filters are returned and all records are pulled;
+    otherwise the filters select the records updated since the watermark. The
+    time of this step is returned as the start of the pull, which becomes the
+    next watermark once the pull finished.
+
+    Parameters:
+    resource : str
+        The OpenProject collection, either "work_packages" or "time_entries".
+
+    Returns:
+    dict
+        "full" (bool) telling whether this is a full reconcile, "filters" (str)
+        holding the value of the "filters" query parameter, empty for full pulls,
+        and "started_at" (str), the ISO 8601 datetime the pull started.
+    """
+    started_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    authorization_hash = wmill.get_variable("u/admin/dj_authorization_hash")
+    dj_api_url = wmill.get_variable("u/admin/dj_api_url")
+    headers = {"Authorization": f"Basic {authorization_hash}"}
+    r = requests.get(f"{dj_api_url}/sync_state/{resource}/", headers=headers)
+    state = r.json()
+    if state["full_sync_due"]:
+        return {"full": True, "filters": "", "started_at": started_at}
+    return {
+        "full": False,
+        "filters": updated_since_filters(resource, state["watermark"]),
+        "started_at": started_at,
+    }
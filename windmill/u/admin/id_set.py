@@ -0,0 +1,114 @@
+from functools import lru_cache
+
+import wmill
+
+# Prefix of references to sets stored in the flow user state.
+REFERENCE_PREFIX = "@"
+
+
+def encode(ids: list) -> str:
+    """
+    Encodes a collection of IDs as a compact string.
+
+    The IDs are deduplicated and sorted, and only the differences between
+    consecutive IDs are kept, in base 36. Dense ID ranges therefore take about
+    two characters per ID, e.g. [1, 2, 3, 10] becomes "1,1,1,7".
+
+    Parameters:
+    ids : list
+        The IDs, as integers or numeric strings.
+
+    Returns:
+    str
+        The encoded IDs.
+    """
+    previous = 0
+    deltas = []
+    for i in sorted({int(i) for i in ids}):
+        deltas.append(_to_base36(i - previous))
+        previous = i
+    return ",".join(deltas)
+
+
+@lru_cache(maxsize=8)
+def decode(encoded: str) -> frozenset:
+    """
+    Decodes a string produced by `encode` into a set of IDs.
+
+    The result is cached, so jobs checking many records against the same set
+    decode it only once.
+    """
+    ids = set()
+    current = 0
+    for delta in filter(None, encoded.split(",")):
+        current += int(delta, 36)
+        ids.add(current)
+    return frozenset(ids)
+
+
+def store(ids: list, key: str) -> str:
+    """
+    Stores the encoded IDs in the flow user state and returns a reference.
+
+    The reference has a constant size, so it can be passed to every job of a
+    flow no matter how many IDs the set holds.
+    """
+    wmill.set_flow_user_state(key, encode(ids))
+    return f"{REFERENCE_PREFIX}{key}"
+
+
+def resolve(existing) -> frozenset:
+    """
+    Returns the set of IDs described by `existing`.
+
+    Parameters:
+    existing : list or str
+        A list of IDs, an encoded set or a reference returned by `store`.
+
+    Returns:
+    frozenset
+        The IDs as integers, for constant time membership tests.
+    """
+    if isinstance(existing, str):
+        if existing.startswith(REFERENCE_PREFIX):
+            existing = wmill.get_flow_user_state(existing[len(REFERENCE_PREFIX):]) or ""
+        return decode(existing)
+    return frozenset(int(i) for i in existing)
+
+
+def contains(existing, openproject_id) -> bool:
+    """
+    Returns whether `openproject_id` is in the set described by `existing`.
+    """
+    try:
+        return int(openproject_id) in resolve(existing)
+    except (TypeError, ValueError):
+        return False
+
+
+def _to_base36(number: int) -> str:
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    result = ""
+    while True:
+        number, remainder = divmod(number, 36)
+        result = digits[remainder] + result
+        if not number:
+            return result
+
+
+def main(ids: list, key: str = ""):
+    """
+    Encodes a list of IDs compactly, optionally storing it in the flow user state.
+
+    Parameters:
+    ids : list
+        The IDs to encode.
+    key : str
+        If given, the encoded IDs are stored under this key of the flow user
+        state and a reference to them is returned instead.
+
+    Returns:
+    str
+        The encoded IDs, or a reference to them.
+    """
+    return store(ids, key) if key else encode(ids)
@@ -0,0 +1,109 @@
+import gzip
+import json
+
+import requests
+import wmill
+from u.admin.op_collection import iter_pages
+
+# The Django app accepts at most OPENPROJECT_BULK_UPSERT_BATCH_SIZE (default
+# 1000) records per request.
+CHUNK_SIZE = 1000
+# The request bodies are gzip compressed, as the field names repeat in every record.
+COMPRESS_LEVEL = 6
+
+
+def post_documents(url: str, headers: dict, documents: list, session=None) -> dict:
+    """
+    Posts OpenProject HAL documents to the ingest endpoint of the Django app.
+
+    Records can be posted to the `bulk_upsert` endpoint the same way. The
+    ingest endpoint skips documents it cannot write (e.g. time entries of work
+    packages that are not synchronized yet); these are logged with their errors.
+
+    Parameters:
+    url : str
+        The ingest endpoint, e.g. ".../work_packages/ingest/".
+    headers : dict
+        The HTTP headers to send with every request.
+    documents : list
+        The HAL documents, sent gzip compressed in chunks of at most `CHUNK_SIZE`.
+    session : requests.Session
+        The session to use, a new one is created if omitted.
+
+    Returns:
+    dict
+        The Django ID per OpenProject ID of all written records.
+
+    Raises:
+    requests.RequestException
+        If the Django app rejects a chunk.
+    """
+    session = session or requests.Session()
+    mapping = {}
+    headers = {**headers, "Content-Type": "application/json", "Content-Encoding": "gzip"}
+    for start in range(0, len(documents), CHUNK_SIZE):
+        body = json.dumps(documents[start:start + CHUNK_SIZE]).encode()
+        r = session.post(url, data=gzip.compress(body, COMPRESS_LEVEL), headers=headers)
+        r.raise_for_status()
+        result = r.json()
+        if "written" in result:
+            for openproject_id, errors in result["skipped"].items():
+                print(f"Skipped {openproject_id}: {errors}")
+            result = result["written"]
+        mapping.update(result)
+    return mapping
+
+
+def main(
+    resource: str,
+    documents: list = [],
+    path: str = "",
+    filters: str = "",
+    max_workers: int = 4,
+):
+    """
+    Writes OpenProject HAL documents to the Django app as-is.
+
+    The documents are mapped to records by the Django app, so no reshaping
+    steps are needed in the flows. Either the documents are given directly, or
+    the OpenProject collection at `path` is streamed into the Django app page by
+    page, so that neither the whole collection nor the records ever pass
+    through job arguments.
+
+    Parameters:
+    resource : str
+        The Django API collection, e.g. "work_packages".
+    documents : list
+        The HAL documents to write.
+    path : str
+        The API path (or href) of an OpenProject collection to write instead,
+        e.g. "/api/v3/time_entries".
+    filters : str
+        OpenProject API filters applied to the collection at `path`.
+    max_workers : int
+        The maximum number of pages requested from OpenProject concurrently.
+
+    Returns:
+    int
+        The number of written records.
+    """
+    authorization_hash = wmill.get_variable("u/admin/dj_authorization_hash")
+    dj_api_url = wmill.get_variable("u/admin/dj_api_url")
+    headers = {"Authorization": f"Basic {authorization_hash}"}
+    url = f"{dj_api_url}/{resource}/ingest/"
+    session = requests.Session()
+
+    if not path:
+        return len(post_documents(url, headers, documents, session=session))
+
+    op_authorization_hash = wmill.get_variable("u/admin/op_authorization_hash")
+    op_api_url = wmill.get_variable("u/admin/op_api_url")
+    count = 0
+    for elements in iter_pages(
+        f"{op_api_url}{path}",
+        headers={"Authorization": f"Basic {op_authorization_hash}"},
+        params={"filters": filters} if filters else None,
+        max_workers=max_workers,
+    ):
+        count += len(post_documents(url, headers, elements, session=session))
+    return count
@@ -0,0 +1,48 @@
+from u.admin.get_id_map import main as get_id_map
+from u.admin.ingest import main as ingest
+from u.admin.op_collection import main as get_collection
+
+
+def project_shards(documents: list) -> list:
+    """
+    Returns the (OpenProject ID, work packages href) pair of every project.
+    """
+    return [
+        (document.get("id"), document.get("_links", {}).get("workPackages", {}).get("href"))
+        for document in documents
+    ]
+
+
+def missing_projects(documents: list, project_ids: dict) -> list:
+    """
+    Returns the project documents whose OpenProject ID is not in `project_ids`.
+    """
+    return [document for document in documents if str(document.get("id")) not in project_ids]
+
+
+def main(ingest_missing: bool = True):
+    """
+    Lists the OpenProject projects, for flows that work project by project.
+
+    Unlike the `f/flows/sync_projects` flow, known projects are not written to
+    the Django app again. Only projects the Django app does not know yet are
+    ingested, so that their work packages and time entries can reference them.
+    Flows should cache the result of this step for a while (`cache_ttl`), as
+    projects rarely change; projects created in the meantime are picked up once
+    the cache expires.
+
+    Parameters:
+    ingest_missing : bool
+        Whether to ingest the projects unknown to the Django app.
+
+    Returns:
+    list
+        The (OpenProject ID, work packages href) pair of every project.
+    """
+    documents = get_collection("/api/v3/projects")
+    if ingest_missing and documents:
+        project_ids = get_id_map("projects", [document["id"] for document in documents])
+        missing = missing_projects(documents, project_ids)
+        if missing:
+            ingest("projects", documents=missing)
+    return project_shards(documents)
@@ -0,0 +1,114 @@
+import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+import wmill
+
+# OpenProject caps the page size at its configured maximum (1000 by default)
+# and reports the effective value in the "pageSize" attribute of each page.
+MAX_PAGE_SIZE = 1000
+
+
+def iter_pages(
+    url: str,
+    headers: dict,
+    params: dict = None,
+    page_size: int = MAX_PAGE_SIZE,
+    max_workers: int = 4,
+    session: requests.Session = None,
+):
+    """
+    Yields the elements of an OpenProject collection page by page.
+
+    The first page is requested with the maximum page size. Its "total" and
+    "pageSize" attributes determine the remaining offsets, which are fetched
+    concurrently by up to `max_workers` threads over a shared keep-alive
+    session. Pages are yielded in order, and at most `max_workers` pages are
+    held in memory at any time, so the memory use does not depend on the size
+    of the collection.
+
+    Parameters:
+    url : str
+        The absolute URL of the collection, e.g. ".../api/v3/projects".
+    headers : dict
+        The HTTP headers to send with every request.
+    params : dict
+        Additional query parameters, e.g. "filters".
+    page_size : int
+        The requested number of elements per page.
+    max_workers : int
+        The maximum number of pages requested concurrently.
+    session : requests.Session
+        The session to use, a new one is created if omitted.
+
+    Yields:
+    list
+        The elements of each page of the collection.
+
+    Raises:
+    requests.RequestException
+        If a page cannot be fetched.
+    """
+    session = session or requests.Session()
+    params = dict(params or {})
+
+    def fetch(offset, size):
+        r = session.get(
+            url,
+            headers=headers,
+            params={**params, "offset": offset, "pageSize": size},
+            timeout=(3.05, 60),
+        )
+        r.raise_for_status()
+        return r.json()
+
+    first = fetch(1, page_size)
+    yield first.get("_embedded", {"elements": []}).get("elements", [])
+
+    page_size = first.get("pageSize") or page_size
+    pages = math.ceil(first.get("total", 0) / page_size)
+    offsets = iter(range(2, pages + 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        window = deque(
+            executor.submit(fetch, offset, page_size)
+            for _, offset in zip(range(max_workers), offsets)
+        )
+        while window:
+            page = window.popleft().result()
+            offset = next(offsets, None)
+            if offset is not None:
+                window.append(executor.submit(fetch, offset, page_size))
+            yield page.get("_embedded", {"elements": []}).get("elements", [])
+
+
+def iter_collection(url: str, headers: dict, **kwargs):
+    """
+    Yields the elements of an OpenProject collection one by one.
+
+    Accepts the same keyword arguments as `iter_pages`.
+    """
+    for elements in iter_pages(url, headers, **kwargs):
+        yield from elements
+
+
+def main(path: str, max_workers: int = 4):
+    """
+    Fetches all elements of an OpenProject collection.
+
+    Parameters:
+    path : str
+        The API path of the collection, e.g. "/api/v3/projects".
+    max_workers : int
+        The maximum number of pages requested concurrently.
+
+    Returns:
+    list
+        All elements of the collection.
+    """
+    authorization_hash = wmill.get_variable("u/admin/op_authorization_hash")
+    op_api_url = wmill.get_variable("u/admin/op_api_url")
+    headers = {"Authorization": f"Basic {authorization_hash}"}
+    return list(
+        iter_collection(f"{op_api_url}{path}", headers, max_workers=max_workers)
+    )
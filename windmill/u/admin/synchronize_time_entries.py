@@ -1,8 +1,62 @@
 import requests
 import wmill
+from u.admin import id_set
+from u.admin.ingest import post_documents
 
 
-def process_hook(action: str, time_entry: dict, url: str, headers: dict) -> str:
+def prepare(time_entry: dict, work_package_ids: dict = None) -> dict:
+    """
+    Prepares a time entry for the Django app in place and returns it.
+
+    The OpenProject ID is taken from "id" if missing, the work package is
+    resolved with `work_package_ids` and the comment is reduced to its raw text.
+    """
+    if "openproject_id" not in time_entry and "id" in time_entry:
+        time_entry["openproject_id"] = time_entry["id"]
+
+    if "work_package" not in time_entry and "_embedded" in time_entry:
+        openproject_work_package_id = time_entry["_embedded"]["workPackage"]["id"]
+        work_package_id = (work_package_ids or {}).get(str(openproject_work_package_id))
+        if work_package_id is None:
+            # Let the Django app resolve the work package itself.
+            time_entry["work_package_openproject_id"] = openproject_work_package_id
+        else:
+            time_entry["work_package"] = work_package_id
+
+    if "comment" in time_entry and type(time_entry["comment"]) is dict:
+        time_entry["comment"] = time_entry["comment"].get("raw", "")
+    return time_entry
+
+
+def process_batch(time_entries: list, url: str, headers: dict, work_package_ids: dict = None) -> dict:
+    """
+    Creates or updates many time entries with bulk upserts.
+
+    The time entries are prepared like in `process_hook` and sent to the
+    `bulk_upsert` endpoint in chunks, which decides per record whether to create
+    or update it. Work packages missing from `work_package_ids` are resolved by
+    the Django app once per chunk.
+
+    Arguments:
+        time_entries (list): The time entries, e.g. a page of an OpenProject collection.
+        url (str): The endpoint URL of the time entries API.
+        headers (dict): The HTTP request headers.
+        work_package_ids (dict): The Django work package ID per OpenProject work package ID.
+
+    Returns:
+        dict: The Django ID per OpenProject ID of the written time entries.
+    """
+    records = [
+        # The HAL links and embedded resources are not stored, so they are not sent.
+        {k: v for k, v in prepare(dict(time_entry), work_package_ids).items() if not k.startswith("_")}
+        for time_entry in time_entries
+    ]
+    return post_documents(f"{url}bulk_upsert/", headers, records)
+
+
+def process_hook(
+    action: str, time_entry: dict, url: str, headers: dict, work_package_ids: dict = None
+) -> str:
     """
     Processes a webhook action for a time entry and synchronizes data with an external service.
 
@@ -18,6 +72,9 @@ def process_hook(action: str, time_entry: dict, url: str, headers: dict) -> str:
         url (str): The endpoint URL of the external service where data needs to be sent.
         headers (dict): A dictionary containing HTTP request headers for authentication or
             other configurations.
+        work_package_ids (dict): The Django work package ID per OpenProject work package
+            ID, as returned by `u/admin/get_id_map`. Work packages missing from it are
+            sent by their OpenProject ID.
 
     Returns:
         str: The ID of the processed time entry, as returned by the external service.
@@ -26,18 +83,7 @@ def process_hook(action: str, time_entry: dict, url: str, headers: dict) -> str:
         Exception: If the HTTP request fails or if the response does not include the expected
             data structure.
     """
-    if "openproject_id" not in time_entry and "id" in time_entry:
-        time_entry["openproject_id"] = time_entry["id"]
-
-    if "work_package" not in time_entry and "_embedded" in time_entry:
-        work_package_id = wmill.run_script(
-            "u/admin/get_work_package",
-            args={"work_package_id": time_entry["_embedded"]["workPackage"]["id"]}
-        )
-        time_entry["work_package"] = work_package_id
-
-    if "comment" in time_entry and type(time_entry["comment"]) is dict:
-        time_entry["comment"] = time_entry["comment"].get("raw", "")
+    prepare(time_entry, work_package_ids)
 
     if action == "time_entry:updated":
         print(f'{url}{time_entry["openproject_id"]}/')
@@ -50,7 +96,12 @@ def process_hook(action: str, time_entry: dict, url: str, headers: dict) -> str:
 
 
 def main(
-        action: str = "", time_entry: dict = {}, existing_time_entries: list = []
+        action: str = "",
+        time_entry: dict = {},
+        existing_time_entries: list = [],
+        work_package_ids: dict = {},
+        existing_ids: str = "",
+        time_entries: list = [],
 ):
     """
     Main function for processing time entry actions and orchestrating payload handling.
@@ -69,10 +120,20 @@ def main(
     existing_time_entries : list
         A collection of existing time entries IDs, used to identify whether the
         `time_entry` corresponds to an update.
+    work_package_ids : dict
+        The Django work package ID per OpenProject work package ID, as returned by
+        `u/admin/get_id_map`.
+    existing_ids : str
+        The IDs of the existing time entries encoded by `u/admin/id_set`, or a
+        reference to them. Takes precedence over `existing_time_entries`.
+    time_entries : list
+        Time entries to create or update in bulk instead of `time_entry`, so that
+        a whole page is handled by a single job.
 
     Returns:
     tuple
-        The result of processing the given action, as returned by `process_hook`.
+        The result of processing the given action, as returned by `process_hook`,
+        or by `process_batch` if `time_entries` is given.
 
     Raises:
     None
@@ -82,15 +143,18 @@ def main(
     headers = {"Authorization": f"Basic {authorization_hash}"}
     url = f"{dj_api_url}/time_entries/"
 
+    if time_entries:
+        return process_batch(time_entries, url, headers, work_package_ids)
+
     if action and time_entry:
         # In case "action" is present in the input project, it means that we about to process a webhook payload.
-        return process_hook(action, time_entry, url, headers)
+        return process_hook(action, time_entry, url, headers, work_package_ids)
 
     # Otherwise, we are dealing with a normal project request and do create the project payload ourself.
     action = "time_entry:created"
     openproject_id = time_entry.get("openproject_id", "")
 
-    if openproject_id and openproject_id in existing_time_entries:
+    if openproject_id and id_set.contains(existing_ids or existing_time_entries, openproject_id):
         action = "time_entry:updated"
 
-    return process_hook(action, time_entry, url, headers)
\ No newline at end of file
+    return process_hook(action, time_entry, url, headers, work_package_ids)
\ No newline at end of file
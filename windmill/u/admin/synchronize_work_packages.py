@@ -1,9 +1,72 @@
 import requests
 import wmill
+from u.admin import id_set
+from u.admin.ingest import post_documents
+
+
+def prepare(work_package: dict, project_ids: dict = None) -> dict:
+    """
+    Prepares a work package for the Django app in place and returns it.
+
+    The OpenProject ID is taken from "id" if missing, the project is resolved
+    with `project_ids` and the description is reduced to its raw text.
+    """
+    if "openproject_id" not in work_package and "id" in work_package:
+        work_package["openproject_id"] = work_package["id"]
+
+    if "_embedded" in work_package:
+        openproject_project_id = work_package["_embedded"]["project"]["id"]
+        project_id = (project_ids or {}).get(str(openproject_project_id))
+        if project_id is None:
+            # Let the Django app resolve the project itself.
+            work_package["project_openproject_id"] = openproject_project_id
+        else:
+            work_package["project"] = project_id
+
+    if "description" in work_package and type(work_package["description"]) is dict:
+        work_package["description"] = work_package["description"].get("raw", "")
+    return work_package
+
+
+def process_batch(
+    work_packages: list, work_packages_url: str, headers: dict, project_ids: dict = None
+) -> dict:
+    """
+    Creates or updates many work packages with bulk upserts.
+
+    The work packages are prepared like in `process_hook` and sent to the
+    `bulk_upsert` endpoint in chunks, which decides per record whether to create
+    or update it. Projects missing from `project_ids` are resolved by the Django
+    app once per chunk.
+
+    Parameters:
+    work_packages : list
+        The work packages, e.g. a page of an OpenProject collection.
+    work_packages_url : str
+        The base URL for the work packages API endpoint.
+    headers : dict
+        The HTTP headers required for the API request.
+    project_ids : dict
+        The Django project ID per OpenProject project ID.
+
+    Returns:
+    dict
+        The Django ID per OpenProject ID of the written work packages.
+    """
+    records = [
+        # The HAL links and embedded resources are not stored, so they are not sent.
+        {k: v for k, v in prepare(dict(work_package), project_ids).items() if not k.startswith("_")}
+        for work_package in work_packages
+    ]
+    return post_documents(f"{work_packages_url}bulk_upsert/", headers, records)
 
 
 def process_hook(
-    action: str, work_package: dict, work_packages_url: str, headers: dict
+    action: str,
+    work_package: dict,
+    work_packages_url: str,
+    headers: dict,
+    project_ids: dict = None,
 ) -> str:
     """
     Processes a webhook action for updating or creating work packages.
@@ -22,23 +85,16 @@ def process_hook(
         The base URL for the work packages API endpoint.
     headers : dict
         The HTTP headers required for the API request.
+    project_ids : dict
+        The Django project ID per OpenProject project ID, as returned by
+        `u/admin/get_id_map`. Projects missing from it are sent by their
+        OpenProject ID.
 
     Returns:
     str
         The ID of the processed work package as returned by the API.
     """
-    if "openproject_id" not in work_package and "id" in work_package:
-        work_package["openproject_id"] = work_package["id"]
-
-    if "_embedded" in work_package:
-        project_id = wmill.run_script(
-            "u/admin/get_project",
-            args={"project_id": work_package["_embedded"]["project"]["id"]},
-        )
-        work_package["project"] = project_id
-
-    if "description" in work_package and type(work_package["description"]) is dict:
-        work_package["description"] = work_package["description"].get("raw", "")
+    prepare(work_package, project_ids)
 
     if action == "work_package:updated":
         result = requests.patch(
@@ -51,7 +107,14 @@ def process_hook(
     return result.json()["id"]
 
 
-def main(action: str = "", work_package: dict = {}, existing_work_packages: list = []):
+def main(
+    action: str = "",
+    work_package: dict = {},
+    existing_work_packages: list = [],
+    project_ids: dict = {},
+    existing_ids: str = "",
+    work_packages: list = [],
+):
     """
     Main function for handling work package operations.
 
@@ -70,26 +133,41 @@ def main(action: str = "", work_package: dict = {}, existing_work_packages: list
     existing_work_packages: list
         A list of work packages that already exist, used for determining whether
         the action is a creation or an update. Defaults to an empty list.
+    project_ids: dict
+        The Django project ID per OpenProject project ID, as returned by
+        `u/admin/get_id_map`. Defaults to an empty dictionary.
+    existing_ids: str
+        The IDs of the existing work packages encoded by `u/admin/id_set`, or a
+        reference to them. Takes precedence over `existing_work_packages`.
+    work_packages: list
+        Work packages to create or update in bulk instead of `work_package`, so
+        that a whole page is handled by a single job.
 
     Returns:
     Any
         The result of the `process_hook` function, which handles the defined
-        action on the specified work package.
+        action on the specified work package, or the result of `process_batch`
+        if `work_packages` is given.
     """
     authorization_hash = wmill.get_variable("u/admin/dj_authorization_hash")
     dj_api_url = wmill.get_variable("u/admin/dj_api_url")
     headers = {"Authorization": f"Basic {authorization_hash}"}
     work_packages_url = f"{dj_api_url}/work_packages/"
 
+    if work_packages:
+        return process_batch(work_packages, work_packages_url, headers, project_ids)
+
     if action and work_package:
         # In case "action" is present in the input project, it means that we about to process a webhook payload.
-        return process_hook(action, work_package, work_packages_url, headers)
+        return process_hook(
+            action, work_package, work_packages_url, headers, project_ids
+        )
 
     # Otherwise, we are dealing with a normal project request and do create the project payload ourself.
     action = "work_package:created"
     openproject_id = work_package.get("openproject_id", "")
 
-    if openproject_id and openproject_id in existing_work_packages:
+    if openproject_id and id_set.contains(existing_ids or existing_work_packages, openproject_id):
         action = "work_package:updated"
 
-    return process_hook(action, work_package, work_packages_url, headers)
+    return process_hook(action, work_package, work_packages_url, headers, project_ids)
@@ -1,5 +1,6 @@
 import requests
 import wmill
+from u.admin import id_set
 
 
 def process_hook(action: str, project: dict, projects_url: str, headers: dict) -> str:
@@ -37,7 +38,12 @@ def process_hook(action: str, project: dict, projects_url: str, headers: dict) -
     return result.json()["id"]
 
 
-def main(action: str = "", project: dict = {}, existing_projects: list = []):
+def main(
+    action: str = "",
+    project: dict = {},
+    existing_projects: list = [],
+    existing_ids: str = "",
+):
     """
     Processes project actions with webhook payload and determines whether to create or update a project
     based on the provided parameters and existing project criteria.
@@ -46,6 +52,8 @@ def main(action: str = "", project: dict = {}, existing_projects: list = []):
     action (str): Specifies the type of action. Default is an empty string.
     project (dict): The project data to process. Default is an empty dictionary.
     existing_projects (list): A list of existing project identifiers.
+    existing_ids (str): The existing project identifiers encoded by `u/admin/id_set`,
+        or a reference to them. Takes precedence over `existing_projects`.
 
     Returns:
     Any: The result of the process_hook function, applicable to the performed action.
@@ -66,7 +74,7 @@ def main(action: str = "", project: dict = {}, existing_projects: list = []):
     action = "project:created"
     openproject_id = project.get("openproject_id", "")
 
-    if openproject_id and openproject_id in existing_projects:
+    if openproject_id and id_set.contains(existing_ids or existing_projects, openproject_id):
         action = "project:updated"
 
     return process_hook(action, project, projects_url, headers)